@@ -0,0 +1,53 @@
+"""
+Compares getting a ``Program`` back from its source (lexing and ``ParserLL1``)
+with decoding it from ``encode_ast``'s bytes, for scripts of growing size.
+
+Run from the repository root:
+
+    python -m benchmarks.ast_codec [commands...]
+"""
+import io
+import sys
+import time
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.parser.ast_codec import decode_ast, encode_ast
+from src.parser.parser import ParserLL1
+
+BLOCK = '''\
+  lado = lado + 1;
+  repita 4 vezes
+    se lado > 10 entao avancar lado * 2; senao girar_direita 90; fim_se;
+  fim_repita;
+  ir_para(lado, 10.5);
+  escrever "lado";
+'''
+COMMANDS_PER_BLOCK = 4
+
+
+def parse(source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+    return ParserLL1(list(tokenizer.iter_tokens(io.StringIO(source)))).parse()
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(sizes):
+    for commands in sizes:
+        source = 'inicio\n  var inteiro : lado;\n' + BLOCK * (commands // COMMANDS_PER_BLOCK) + 'fim\n'
+        program, parse_time = timed(parse, source)
+        data, encode_time = timed(encode_ast, program)
+        _, decode_time = timed(decode_ast, data)
+        print(f"{commands:7} commands   lex+parse {parse_time:8.1f} ms   encode {encode_time:7.1f} ms"
+              f"   decode {decode_time:7.1f} ms   {len(source.encode())} source bytes, {len(data)} encoded")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1000, 10000, 50000])
@@ -0,0 +1,79 @@
+"""
+Measures the memory (``tracemalloc``) a parsed ``Program`` keeps alive, as
+node objects and in a ``NodeArena`` filled from its ``encode_ast`` bytes.
+
+Run from the repository root:
+
+    python -m benchmarks.ast_memory [commands]
+"""
+import io
+import sys
+import tracemalloc
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.parser.ast_arena import NodeArena
+from src.parser.ast_codec import decode_ast, encode_ast
+from src.parser.parser import ParserLL1
+
+BLOCK = '''\
+  lado = lado + 1;
+  repita 4 vezes
+    se lado > 10 entao avancar lado * 2; senao girar_direita 90; fim_se;
+  fim_repita;
+  ir_para(lado, 10.5);
+  escrever "lado";
+'''
+COMMANDS_PER_BLOCK = 4
+
+
+def tokenize(source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+    return list(tokenizer.iter_tokens(io.StringIO(source)))
+
+
+def count_nodes(program):
+    count = 0
+    pending = [program]
+    while pending:
+        node = pending.pop()
+        count += 1
+        for name in node.__slots__:
+            value = getattr(node, name)
+            if isinstance(value, list):
+                pending.extend(item for item in value if not isinstance(item, str))
+            elif hasattr(value, '__slots__'):
+                pending.append(value)
+    return count
+
+
+def retained(function, *args):
+    """Returns ``function(*args)`` and the bytes it still holds once returned."""
+    tracemalloc.start()
+    result = function(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def fill_arena(data):
+    arena = NodeArena()
+    decode_ast(data, arena)
+    return arena
+
+
+def main(commands):
+    tokens = tokenize('inicio\n  var inteiro : lado;\n' + BLOCK * (commands // COMMANDS_PER_BLOCK) + 'fim\n')
+    program, objects_size = retained(ParserLL1(tokens).parse)
+    nodes = count_nodes(program)
+    data = encode_ast(program)
+    del program, tokens
+    arena, arena_size = retained(fill_arena, data)
+    print(f"{nodes} nodes   objects {objects_size / nodes:6.1f} bytes/node   "
+          f"arena {arena_size / nodes:6.1f} bytes/node   ({len(data) / nodes:.1f} encoded)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,64 @@
+"""
+Parses programs nested thousands of levels deep with ``IterativeParserLL1``,
+and shows where the recursive ``ParserLL1`` gives up.
+
+* ``blocks``: 'repita' and 'se'/'senao' blocks alternating, one per level.
+* ``parentheses``: one assignment whose expression is wrapped in as many
+  parentheses, with an operator at every level.
+
+Run from the repository root:
+
+    python -m benchmarks.deep_nesting [depth]
+"""
+import io
+import sys
+import time
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.parser.parser import IterativeParserLL1, ParserLL1
+
+
+def tokenize(source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+    return list(tokenizer.iter_tokens(io.StringIO(source)))
+
+
+def nested_blocks(depth):
+    opening = []
+    closing = []
+    for level in range(depth):
+        if level % 2:
+            opening.append("se lado > 1 entao avancar 1;\n")
+            closing.append("senao recuar 1; fim_se;\n")
+        else:
+            opening.append("repita 2 vezes\n")
+            closing.append("fim_repita;\n")
+    return "inicio\n" + "".join(opening) + "girar_direita 90;\n" + "".join(reversed(closing)) + "fim\n"
+
+
+def nested_parentheses(depth):
+    return "inicio\nlado = " + "(1 + " * depth + "lado" + ")" * depth + ";\nfim\n"
+
+
+def timed(parser, tokens):
+    start = time.perf_counter()
+    try:
+        parser(tokens).parse()
+    except RecursionError:
+        return "RecursionError"
+    return f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+
+
+def main(depth):
+    for name, factory in (("blocks", nested_blocks), ("parentheses", nested_parentheses)):
+        tokens = tokenize(factory(depth))
+        print(f"{name:12} depth {depth}, {len(tokens)} tokens")
+        for parser in (IterativeParserLL1, ParserLL1):
+            print(f"    {parser.__name__:20} {timed(parser, tokens)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,100 @@
+"""
+Times FIRST/FOLLOW computation on generated grammars with thousands of
+productions.
+
+* ``chain``: ``A0 -> A1 t0 | t0``, ``A1 -> A2 t1 | t1``... FIRST flows from
+  the last non-terminal back to the first, against the order of the rules.
+* ``levels``: an expression grammar with one precedence level per
+  non-terminal pair, as left recursion removal produces (``E -> T E'``,
+  ``E' -> + T E' | #``).
+* ``random``: random productions over a fixed alphabet, with about one in
+  five productions empty.
+
+Run from the repository root:
+
+    python -m benchmarks.first_follow [size]
+"""
+import random
+import sys
+import time
+
+from src.parser.calculate_first_set import calculate_first_sets
+from src.parser.calculate_follow_set import calculate_follow_sets
+from src.parser.numbered_grammar import NumberedGrammar
+
+
+def chain_grammar(size):
+    grammar = {
+        f"A{index}": [[f"A{index + 1}", f"t{index}"], [f"t{index}"]]
+        for index in range(size - 1)
+    }
+    grammar[f"A{size - 1}"] = [[f"t{size - 1}"]]
+    return grammar, {f"t{index}" for index in range(size)}, "A0"
+
+
+def levels_grammar(size):
+    grammar = {}
+    levels = size // 2
+    for level in range(levels):
+        operand = f"E{level + 1}" if level + 1 < levels else "P"
+        grammar[f"E{level}"] = [[operand, f"E{level}'"]]
+        grammar[f"E{level}'"] = [[f"op{level}", operand, f"E{level}'"], ["#"]]
+    grammar["P"] = [["(", "E0", ")"], ["id"]]
+    terminals = {f"op{level}" for level in range(levels)} | {"(", ")", "id"}
+    return grammar, terminals, "E0"
+
+
+def random_grammar(size, seed=7):
+    rnd = random.Random(seed)
+    non_terminals = [f"N{index}" for index in range(size)]
+    terminals = [f"t{index}" for index in range(64)]
+    grammar = {}
+    for non_terminal in non_terminals:
+        productions = []
+        for _ in range(rnd.randint(1, 4)):
+            if rnd.random() < 0.2:
+                productions.append(["#"])
+            else:
+                productions.append([
+                    rnd.choice(non_terminals) if rnd.random() < 0.6 else rnd.choice(terminals)
+                    for _ in range(rnd.randint(1, 5))
+                ])
+        grammar[non_terminal] = productions
+    return grammar, set(terminals), non_terminals[0]
+
+
+def timed(function, *args):
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start_time) * 1000
+
+
+def decode_all(sets):
+    return sum(len(sets[symbol]) for symbol in sets)
+
+
+def main(size):
+    for name, factory in (("chain", chain_grammar), ("levels", levels_grammar), ("random", random_grammar)):
+        grammar_rules, terminals, start = factory(size)
+        productions = sum(len(alternatives) for alternatives in grammar_rules.values())
+
+        # Bitmasks, as the parse table builder uses them.
+        grammar, numbering_time = timed(NumberedGrammar, grammar_rules, (), terminals)
+        first, first_time = timed(grammar.first_masks)
+        follow, follow_time = timed(grammar.follow_masks, start, first)
+        _, predict_time = timed(grammar.predict_masks, first, follow)
+
+        # The dict-of-sets API, with every set decoded from its mask.
+        first_sets, first_sets_time = timed(calculate_first_sets, grammar_rules, terminals)
+        follow_sets, follow_sets_time = timed(calculate_follow_sets, grammar_rules, start, first_sets)
+        members, decode_time = timed(lambda: decode_all(first_sets) + decode_all(follow_sets))
+
+        print(f"{name:7} {productions:6} productions")
+        print(f"    masks: numbering {numbering_time:7.1f} ms   FIRST {first_time:7.1f} ms"
+              f"   FOLLOW {follow_time:7.1f} ms   predict {predict_time:7.1f} ms")
+        print(f"    sets:  FIRST {first_sets_time:7.1f} ms   FOLLOW {follow_sets_time:7.1f} ms"
+              f"   decoding {members} members {decode_time:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,61 @@
+"""
+Compares a full ``parse_program`` with ``reparse_program`` after editing one
+command in the middle of scripts of growing size.
+
+Each script repeats a block of top-level commands, 'repita' and 'se' bodies
+included. The edit rewrites the count of one 'avancar' nested two levels deep.
+
+Run from the repository root:
+
+    python -m benchmarks.incremental [commands...]
+"""
+import io
+import sys
+import time
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.parser.incremental import parse_program, reparse_program
+
+BLOCK = '''\
+  lado = lado + 1;
+  repita 4 vezes
+    se lado > 10 entao avancar lado; senao girar_direita 90; fim_se;
+  fim_repita;
+  ir_para(lado, 10);
+'''
+COMMANDS_PER_BLOCK = 3
+
+
+def tokenize(source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+    return list(tokenizer.iter_tokens(io.StringIO(source)))
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(sizes):
+    for commands in sizes:
+        tokens = tokenize('inicio\n  var inteiro : lado;\n' + BLOCK * (commands // COMMANDS_PER_BLOCK) + 'fim\n')
+        previous, full_time = timed(parse_program, tokens)
+
+        # 'avancar lado;' in the middle block becomes 'avancar lado + 2;'.
+        middle = len(tokens) // 2
+        edit = next(index for index in range(middle, len(tokens)) if tokens[index].lexeme == 'avancar') + 1
+        replacement = tokenize('inicio\n  x = lado + 2;\nfim\n')[3:6]
+        edited = tokens[:edit] + replacement + tokens[edit + 1:]
+
+        result, incremental_time = timed(reparse_program, previous, edited, edit, edit + 1, edit + len(replacement))
+        shared = len(set(map(id, previous.program.commands)) & set(map(id, result.program.commands)))
+        print(f"{commands:7} commands   full {full_time:8.1f} ms   incremental {incremental_time:6.2f} ms"
+              f"   {shared} of {len(result.program.commands)} top-level commands reused")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1000, 10000, 50000])
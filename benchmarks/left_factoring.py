@@ -0,0 +1,69 @@
+"""
+Compares the trie-based ``left_factoring`` with applying
+``left_factoring_concise`` until the grammar stops changing, on a generated
+grammar whose non-terminals have hundreds of alternatives sharing prefixes
+of varying length.
+
+Run from the repository root:
+
+    python -m benchmarks.left_factoring [non_terminals] [alternatives]
+"""
+import random
+import sys
+import time
+
+from src.parser.left_factoring import left_factoring, left_factoring_concise
+
+
+def generated_grammar(non_terminals, alternatives, seed=11):
+    rnd = random.Random(seed)
+    grammar = {}
+    for index in range(non_terminals):
+        productions = []
+        for _ in range(alternatives):
+            # Few symbols per position, so many alternatives share prefixes.
+            length = rnd.randint(1, 12)
+            productions.append([f"t{rnd.randint(0, 3)}" for _ in range(length)])
+        grammar[f"N{index}"] = productions
+    return grammar
+
+
+def repeated_concise(grammar):
+    rounds = 0
+    while True:
+        rounds += 1
+        factored = left_factoring_concise(grammar)
+        if factored == grammar:
+            return factored, rounds
+        grammar = factored
+
+
+def is_factored(grammar):
+    return all(
+        len({production[0] if production else None for production in productions}) == len(productions)
+        for productions in grammar.values()
+    )
+
+
+def main(non_terminals, alternatives):
+    grammar = generated_grammar(non_terminals, alternatives)
+    length = sum(len(production) for productions in grammar.values() for production in productions)
+    print(f"{non_terminals} non-terminals x {alternatives} alternatives, {length} symbols")
+
+    start = time.perf_counter()
+    factored = left_factoring(grammar)
+    elapsed = time.perf_counter() - start
+    print(f"    trie:              {elapsed * 1000:8.1f} ms   {len(factored):6} rules   factored={is_factored(factored)}")
+
+    start = time.perf_counter()
+    factored, rounds = repeated_concise(grammar)
+    elapsed = time.perf_counter() - start
+    print(f"    repeated concise:  {elapsed * 1000:8.1f} ms   {len(factored):6} rules   factored={is_factored(factored)}"
+          f"   ({rounds} rounds)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 400,
+    )
@@ -0,0 +1,53 @@
+"""
+Compares the regex ``Lexer`` with the table-driven ``DfaLexer``.
+
+Run from the repository root:
+
+    python -m benchmarks.lexer_dfa [repetitions]
+"""
+import io
+import sys
+import time
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.lexical_analyzer.utils.dfa_lexer import DfaLexer, build_lexer_table
+
+BODY = """  var inteiro : lado, passo;
+  var real : angulo;
+  lado = 150; angulo = 72.5; // pentagono
+  repita 5 vezes
+    se lado >= 10 entao avancar lado; senao recuar (lado + 1) * 2; fim_se;
+    definir_cor "azul";
+  fim_repita;
+"""
+# Long runs of symbols and partial multi-character operators.
+SYMBOLS = "  a = " + "(" * 200 + "1" + ")" * 200 + "; b = 1" + " <= 2 != 3 >= 4 == 5" * 50 + ";\n"
+
+
+def tokenize(lexer, source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(lexer, TokenListTable(token_factory), symbol_table, token_factory)
+    start = time.perf_counter()
+    count = sum(1 for _ in tokenizer.iter_tokens(io.StringIO(source)))
+    return count, time.perf_counter() - start
+
+
+def main(repetitions):
+    start = time.perf_counter()
+    build_lexer_table()
+    print(f"table build: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for name, body, count in (
+        ("script", BODY, repetitions),
+        ("symbol runs", SYMBOLS, max(repetitions // 20, 1)),
+    ):
+        source = "inicio\n" + body * count + "fim\n"
+        results = [(lexer, *tokenize(lexer, source)) for lexer in (Lexer(), DfaLexer())]
+        for lexer, tokens, seconds in results:
+            print(f"{name:12} {type(lexer).__name__:9} {tokens:8} tokens {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
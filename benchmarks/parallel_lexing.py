@@ -0,0 +1,53 @@
+"""
+Times ``Tokenizer.analise_line`` against ``Tokenizer.analise_parallel`` on a
+generated script.
+
+Run from the repository root:
+
+    python -m benchmarks.parallel_lexing [repetitions] [workers ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+
+BODY = """  var inteiro : lado, passo;
+  lado = 150; passo = lado / 3 + 1; // proximo lado
+  repita 5 vezes
+    se lado >= 10 entao avancar lado; senao recuar (lado + 1) * 2; fim_se;
+    definir_cor "azul";
+  fim_repita;
+"""
+
+
+def run(method, path, **kwargs):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    token_list = TokenListTable(token_factory)
+    tokenizer = Tokenizer(Lexer(), token_list, symbol_table, token_factory)
+    start = time.perf_counter()
+    getattr(tokenizer, method)(path, **kwargs)
+    return len(token_list.get_tokens()), time.perf_counter() - start
+
+
+def main(repetitions, workers):
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as file:
+        file.write("inicio\n" + BODY * repetitions + "fim\n")
+    try:
+        size = os.path.getsize(file.name) / 2**20
+        count, seconds = run("analise_line", file.name)
+        print(f"{size:.1f} MiB, {count} tokens")
+        print(f"analise_line               {seconds:7.3f} s")
+        for worker_count in workers:
+            _, seconds = run("analise_parallel", file.name, workers=worker_count)
+            print(f"analise_parallel {worker_count:3} workers {seconds:7.3f} s")
+    finally:
+        os.remove(file.name)
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(arguments[0] if arguments else 50000, arguments[1:] or [1, 2, 4, os.cpu_count()])
@@ -0,0 +1,48 @@
+"""
+Times the hand-written ``ParserLL1``, the table-driven ``TableParserLL1`` and
+the generated ``GeneratedParserLL1`` on the same token list, a program with
+thousands of nested commands and expressions.
+
+Run from the repository root:
+
+    python -m benchmarks.parsers [repetitions]
+"""
+import io
+import sys
+import time
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.parser.generated_parser import GeneratedParserLL1
+from src.parser.parser import ParserLL1
+from src.parser.table_parser import TableParserLL1, load_parse_table
+
+BODY = '''\
+  lado = (lado + 2) * 3 - lado / 4;
+  se lado > 10 entao avancar lado; senao girar_direita 90; fim_se;
+  repita 4 vezes ir_para(lado, 10 + lado); fim_repita;
+'''
+
+
+def tokenize(source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+    return list(tokenizer.iter_tokens(io.StringIO(source)))
+
+
+def main(repetitions):
+    tokens = tokenize('inicio\n  var inteiro : lado;\n' + BODY * repetitions + 'fim\n')
+    load_parse_table()
+    print(f"{len(tokens)} tokens")
+    for parser in (ParserLL1, TableParserLL1, GeneratedParserLL1):
+        times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            parser(tokens).parse()
+            times.append(time.perf_counter() - start)
+        print(f"    {parser.__name__:20} {min(times) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,73 @@
+"""
+Measures the cold start of ``python -m src.main`` on a small script.
+
+Every run is a fresh interpreter started with ``-X importtime``; the report
+shows the median wall time, the total import time and the slowest imports.
+Runs happen in a scratch directory so generated ``examples/saidaN.py`` files
+do not touch the repository.
+
+Run from the repository root:
+
+    python -m benchmarks.startup [runs] [script]
+"""
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run_once(arguments, cwd):
+    environment = dict(os.environ, PYTHONPATH=REPOSITORY)
+    # Cold start is measured with up-to-date bytecode caches, as installed.
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.main", *arguments],
+        cwd=cwd,
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    imports = {}
+    total = 0
+    for match in IMPORT_LINE.finditer(result.stderr):
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        imports[name] = cumulative
+        if len(indent) == 1:
+            total += cumulative
+    return elapsed, total, imports
+
+
+def main(runs, script):
+    with tempfile.TemporaryDirectory() as cwd:
+        os.mkdir(os.path.join(cwd, "examples"))
+        shutil.copy(script, cwd)
+        name = os.path.basename(script)
+
+        for label, arguments in (("lex only", ["--lex", name]), ("full compile", [name])):
+            # The first run writes the bytecode caches.
+            run_once(arguments, cwd)
+            samples = [run_once(arguments, cwd) for _ in range(runs)]
+            wall = statistics.median(sample[0] for sample in samples)
+            imports = statistics.median(sample[1] for sample in samples)
+            print(f"{label:12} wall {wall * 1000:7.1f} ms   imports {imports / 1000:6.1f} ms")
+
+            slowest = sorted(samples[-1][2].items(), key=lambda item: item[1], reverse=True)
+            for module, cumulative in slowest[:5]:
+                print(f"    {module:45} {cumulative / 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+        sys.argv[2] if len(sys.argv) > 2 else os.path.join(REPOSITORY, "examples", "entrada1.txt"),
+    )
@@ -0,0 +1,76 @@
+"""
+Measures the time and peak memory (``tracemalloc``) of lexing, parsing and
+semantically checking a generated drawing of many commands, two ways:
+
+* ``batch``: the token list is materialized, ``ParserLL1.parse`` builds the
+  whole ``Program`` and ``analyze_program`` checks it.
+* ``streaming``: ``Tokenizer.iter_tokens`` feeds ``StreamingParserLL1``, and
+  each declaration or command is checked as soon as ``parse_stream`` yields it
+  and then dropped.
+
+Run from the repository root:
+
+    python -m benchmarks.streaming [commands]
+"""
+import sys
+import time
+import tracemalloc
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.parser.parser import ParserLL1, StreamingParserLL1
+from src.semantic_analyzer.semantico import analyze_command, analyze_program
+from src.semantic_analyzer.symbol_table import SymbolTable as SemanticSymbolTable
+from src.semantic_analyzer.syntatic_tree import VariableDeclaration
+
+COMMANDS_PER_BLOCK = 4
+
+
+def drawing(commands):
+    yield "inicio\n"
+    yield "  var inteiro : lado;\n"
+    for _ in range(commands // COMMANDS_PER_BLOCK):
+        yield "  lado = lado + 1;\n"
+        yield "  avancar lado * 2;\n"
+        yield "  girar_direita 90;\n"
+        yield "  repita 2 vezes recuar 1; fim_repita;\n"
+    yield "fim\n"
+
+
+def tokenizer():
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    return Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+
+
+def batch(commands):
+    tokens = list(tokenizer().iter_tokens(drawing(commands)))
+    analyze_program(ParserLL1(tokens).parse())
+
+
+def streaming(commands):
+    symbol_table = SemanticSymbolTable()
+    for item in StreamingParserLL1(tokenizer().iter_tokens(drawing(commands))).parse_stream():
+        if isinstance(item, VariableDeclaration):
+            for name in item.names:
+                symbol_table.declare(name, item.var_type)
+        else:
+            analyze_command(item, symbol_table)
+
+
+def main(commands):
+    print(f"{commands} commands")
+    for name, run in (("batch", batch), ("streaming", streaming)):
+        start = time.perf_counter()
+        run(commands)
+        elapsed = time.perf_counter() - start
+        # Tracing slows everything down, so memory is measured on a second run.
+        tracemalloc.start()
+        run(commands)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"    {name:10} {elapsed * 1000:9.1f} ms   peak {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
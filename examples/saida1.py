@@ -0,0 +1,23 @@
+import turtle
+
+screen = turtle.Screen()
+t = turtle.Turtle()
+screen.title("Resultado - Exemplo 1")
+
+
+passo = 0
+repeticoes = 0
+cor_fundo = ""
+cor_linha = ""
+titulo = ""
+angulo_preciso = 0.0
+desenhar_forma = False
+passo = 150
+repeticoes = 5
+titulo = "Desenho de uma Estrela"
+cor_fundo = "black"
+cor_linha = "blue"
+angulo_preciso = 144.0
+desenhar_forma = True
+
+turtle.done()
\ No newline at end of file
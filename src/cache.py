@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+import tempfile
+
+CACHE_DIR_VARIABLE = "TURTLESCRIPT_CACHE_DIR"
+
+# Version of the entry layout written by ``store_json``; entries of any other
+# version are misses.
+_ENTRY_FORMAT = 1
+
+
+def cache_dir() -> str:
+    """
+    Directory of the on-disk cache, overridable with ``TURTLESCRIPT_CACHE_DIR``.
+    Defaults to ``turtlescript`` under the user's cache directory
+    (``$XDG_CACHE_HOME`` or ``~/.cache``), never to a directory shared with
+    other users.
+    """
+    directory = os.environ.get(CACHE_DIR_VARIABLE)
+    if directory:
+        return directory
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "turtlescript")
+
+
+def cache_key(*parts: object) -> str:
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _cache_path(name: str, key: str) -> str:
+    return os.path.join(cache_dir(), f"{name}-{key[:32]}.json")
+
+
+def load_json(name: str, key: str, is_valid=None):
+    """
+    Returns the value stored under ``name``/``key``, or ``None`` on a miss.
+
+    A file that is not an entry of the current format for ``key``, or whose
+    value ``is_valid`` rejects, is a miss too: callers then rebuild the value
+    and store it again instead of trusting what they found.
+    """
+    try:
+        with open(_cache_path(name, key), "r", encoding="utf-8") as file:
+            entry = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("format") != _ENTRY_FORMAT or entry.get("key") != key:
+        return None
+    value = entry.get("value")
+    if is_valid is not None and not is_valid(value):
+        return None
+    return value
+
+
+def store_json(name: str, key: str, value) -> None:
+    """
+    Stores ``value`` under ``name``/``key``, replacing the file atomically so
+    readers never see it half written. The cache is best effort: a directory
+    that cannot be written is silently ignored.
+    """
+    path = _cache_path(name, key)
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"format": _ENTRY_FORMAT, "key": key, "value": value}, file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError:
+        pass
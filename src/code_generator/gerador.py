@@ -83,6 +83,7 @@ class CodeGenerator:
             op = expr.operator
 
             if op == "%":
+                self.add_import("import math")
                 return f"math.fmod({left}, {right})"
             return f"({left} {op} {right})"
 
@@ -2,20 +2,32 @@ from .error_types import ErrorType
 
 
 class GenericError(Exception):
+    """
+    Compiler diagnostic. The position is either given as ``line``/``column``
+    or as an ``offset`` into a ``source`` line index (anything with a
+    ``position(offset)`` method), which is only resolved when the line or
+    column is read, e.g. when the message is formatted.
+    """
+
     def __init__(
         self,
         error_type: ErrorType,
         message: str,
-        line: int,
-        column: int,
-        symbol: object,
+        line: int | None = None,
+        column: int | None = None,
+        symbol: object = None,
+        *,
+        offset: int | None = None,
+        source=None,
     ) -> None:
         self._error_type = error_type
         self._message = message
         self._line = line
         self._column = column
         self._symbol = symbol
-        super().__init__(self.__str__())
+        self._offset = offset
+        self._source = source
+        super().__init__(message)
 
     @property
     def error_type(self) -> ErrorType:
@@ -25,12 +37,18 @@ class GenericError(Exception):
     def message(self) -> str:
         return self._message
 
+    def _resolve_position(self) -> None:
+        if self._line is None and self._source is not None:
+            self._line, self._column = self._source.position(self._offset)
+
     @property
-    def line(self) -> int:
+    def line(self) -> int | None:
+        self._resolve_position()
         return self._line
 
     @property
-    def column(self) -> int:
+    def column(self) -> int | None:
+        self._resolve_position()
         return self._column
 
     @property
@@ -47,15 +65,42 @@ class GenericError(Exception):
 
 
 class LexicalError(GenericError):
-    def __init__(self, message: str, line: int, column: int, symbol: object) -> None:
-        super().__init__(ErrorType.LEXICAL, message, line, column, symbol)
+    def __init__(
+        self,
+        message: str,
+        line: int | None = None,
+        column: int | None = None,
+        symbol: object = None,
+        *,
+        offset: int | None = None,
+        source=None,
+    ) -> None:
+        super().__init__(ErrorType.LEXICAL, message, line, column, symbol, offset=offset, source=source)
 
 
 class SyntacticError(GenericError):
-    def __init__(self, message: str, line: int, column: int, symbol: object) -> None:
-        super().__init__(ErrorType.SYNTACTIC, message, line, column, symbol)
+    def __init__(
+        self,
+        message: str,
+        line: int | None = None,
+        column: int | None = None,
+        symbol: object = None,
+        *,
+        offset: int | None = None,
+        source=None,
+    ) -> None:
+        super().__init__(ErrorType.SYNTACTIC, message, line, column, symbol, offset=offset, source=source)
 
 
 class SemanticError(GenericError):
-    def __init__(self, message: str, line: int, column: int, symbol: object) -> None:
-        super().__init__(ErrorType.SEMANTIC, message, line, column, symbol)
\ No newline at end of file
+    def __init__(
+        self,
+        message: str,
+        line: int | None = None,
+        column: int | None = None,
+        symbol: object = None,
+        *,
+        offset: int | None = None,
+        source=None,
+    ) -> None:
+        super().__init__(ErrorType.SEMANTIC, message, line, column, symbol, offset=offset, source=source)
\ No newline at end of file
@@ -1,13 +1,38 @@
-import re
+import io
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
 
 from src.errors.error import LexicalError
 from src.errors.error_messages import ErrorMessages
-from .utils.token_class import Operators, Delimiters, Comment, KeyWords
-from .utils.lexer import Lexer
+from .utils.token_class import Delimiters
+from .utils.declaration_context import DeclarationContext
+from .utils.lexer import Lexer, FIXED_LEXEMES, NON_ASCII_PATTERN
+from .utils.line_index import LineIndex
 from .utils.symbol_table import SymbolTable
 from .utils.token_factory import TokenTypeFactory
+from .utils.token import Token
 from .utils.token_list import TokenListTable
 
+_BALANCED_CODES = frozenset(
+    (
+        Delimiters.START.code,
+        Delimiters.END.code,
+        Delimiters.LEFT_PAR.code,
+        Delimiters.RIGHT_PAR.code,
+    )
+)
+_OPENING_CODES = {Delimiters.START.code, Delimiters.LEFT_PAR.code}
+_CLOSING_CODES = {
+    Delimiters.END.code: Delimiters.START.code,
+    Delimiters.RIGHT_PAR.code: Delimiters.LEFT_PAR.code,
+}
+_OPENING_LEXEMES = frozenset((Delimiters.START.lexeme, Delimiters.LEFT_PAR.lexeme))
+_CLOSING_LEXEMES = {
+    Delimiters.END.lexeme: Delimiters.START.lexeme,
+    Delimiters.RIGHT_PAR.lexeme: Delimiters.LEFT_PAR.lexeme,
+}
+
 
 class Tokenizer:
     def __init__(
@@ -22,143 +47,304 @@ class Tokenizer:
         self._symbol_table = symbol_table
         self._token_factory = token_factory
 
-    def read_file(self, path_file: str) -> list[tuple[str, int]]:
-        lines = []
+    def analise_line(self, path_file: str) -> None:
         with open(path_file, "r", encoding="utf-8") as file:
-            for i, line in enumerate(file, start=1):
-                lines.append((line, i))
-        return lines
-
-    def string_separator(
-        self, line: list[tuple[str, int]]
-    ) -> list[tuple[str, int, int]]:
-        fixed_separators = [
-            Delimiters.COLON.lexeme,
-            Delimiters.SEMICOLON.lexeme,
-            Delimiters.COMMA.lexeme,
-            Delimiters.LEFT_PAR.lexeme,
-            Delimiters.RIGHT_PAR.lexeme,
-        ]
-        fixed_sep_pattern = "".join(re.escape(c) for c in fixed_separators)
-
-        multi_char_operators = [
-            Operators.EQUAL.lexeme,
-            Operators.NOT_EQUAL.lexeme,
-            Operators.LESS_EQUAL.lexeme,
-            Operators.GREATER_EQUAL.lexeme,
-        ]
-        multi_char_pattern = "|".join(re.escape(op) for op in multi_char_operators)
-
-        pattern = (
-            rf'("(?:[^"\\]|\\.)*")'
-            + r"|(//)"
-            + rf"|({multi_char_pattern})"
-            + r"|(\d+\.\d+)"
-            + r"|(\w+)"
-            + rf"|([{fixed_sep_pattern}])"
-            + r"|([^\w\s])"
-        )
+            source = self._token_list.source
+            add_token = self._token_list.add_token
+            for code, lexeme, offset in self._resolve(self._scan_lines(file, source), source):
+                add_token(code, lexeme, offset)
 
-        tokens = []
-        for line_chars, line_number in line:
-            for match in re.finditer(pattern, line_chars):
-                token = match.group(0)
-                pos = match.start()
+    def iter_tokens(self, stream: Iterable[str]) -> Iterator[Token]:
+        """
+        Lazily tokenizes ``stream`` (an open file or any iterable of lines) and
+        yields one ``Token`` at a time.
 
-                if token == Comment.COMMENT.lexeme:
-                    break
+        Tokens are not stored in the token list, and between lines only the
+        delimiter stack and the declaration context are kept. Delimiter
+        balance is checked as tokens are produced.
 
-                tokens.append((token, pos, line_number))
+        Memory is not bounded, though: the tokens resolve their line and
+        column through one ``LineIndex`` for the whole stream, which keeps the
+        8-byte start offset of every line read so far (8 MB for a million
+        lines) while any of them is alive. A consumer dropping each token once
+        parsed still holds O(lines) memory, against O(tokens) for
+        ``analise_line``. The index cannot forget old lines, since tokens
+        already handed out and the error for an unclosed ``inicio`` resolve
+        their positions through it.
+        """
+        source = LineIndex()
+        build_token = self._token_list.build_token
+        for code, lexeme, offset in self._resolve(self._scan_lines(stream, source), source):
+            yield build_token(code, lexeme, offset, source)
 
-        return tokens
+    def analise_mmap(self, path_file: str) -> None:
+        """
+        Tokenizes ``path_file`` like ``analise_line`` but scans the memory-mapped
+        bytes directly instead of decoding the file line by line.
 
-    def analise_line(self, path_file: str) -> None:
-        lines = self.read_file(path_file)
-        lexemes = self.string_separator(lines)
-
-        self.verified_balanced_delimiters(self.filter_list(lexemes))
-
-        for lexeme, column, line_number in lexemes:
-            if lexeme:
-                try:
-                    token_code = self._lexer.analyze(lexeme, line_number, column)
-                    if token_code is None:
-                        symbol = self._symbol_table.get_by_code_lexeme(lexeme)
-                        if symbol is None:
-                            token_code = self._symbol_table.add_symbol(lexeme, self.filter_id_type())
-                        else:
-                            token_code = symbol
-                    self._token_list.add_token(token_code, lexeme, line_number, column)
-                except LexicalError as e:
-                    raise e
-
-    def filter_id_type(self) -> str | None:
+        Only identifiers, literals and invalid lexemes are decoded; the text of
+        keywords, delimiters and operators is shared with ``token_class``.
+        Lines containing non-ASCII bytes are decoded and scanned as text so
+        columns and diagnostics match the text path.
+        """
+        import mmap
+
+        with open(path_file, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            source = self._token_list.source
+            lexemes = self._scan_buffer(buffer, source)
+            try:
+                add_token = self._token_list.add_token
+                for code, lexeme, offset in self._resolve(lexemes, source):
+                    add_token(code, lexeme, offset)
+            finally:
+                # Pending matches keep the map exported until the scan is closed.
+                lexemes.close()
+                buffer.close()
+
+    def analise_parallel(
+        self, path_file: str, workers: int | None = None, chunk_size: int = 1 << 20
+    ) -> None:
+        """
+        Tokenizes ``path_file`` like ``analise_line`` with the scanning spread
+        over a pool of ``workers`` processes (default: one per CPU).
+
+        Comments and text literals end with their line, so the file is split
+        into chunks of about ``chunk_size`` bytes at line boundaries and each
+        chunk is scanned independently. The results are merged in order by a
+        sequential pass that indexes lines and resolves identifiers,
+        declaration types and delimiter balance, so errors are still reported
+        in source order.
+        """
+        bounds = [0]
+        with open(path_file, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            while bounds[-1] < size:
+                position = bounds[-1] + chunk_size
+                if position >= size:
+                    bounds.append(size)
+                else:
+                    file.seek(position)
+                    file.readline()
+                    bounds.append(file.tell())
+
+        if len(bounds) <= 2:
+            self._merge_chunks(
+                [_scan_chunk(self._lexer, path_file, start, end) for start, end in zip(bounds, bounds[1:])]
+            )
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(workers)
+        try:
+            self._merge_chunks(
+                pool.map(_scan_chunk, repeat(self._lexer), repeat(path_file), bounds, bounds[1:])
+            )
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _merge_chunks(self, chunks: Iterable[tuple[list, list[int]]]) -> None:
+        source = self._token_list.source
+
+        def records():
+            for chunk_records, line_lengths in chunks:
+                chunk_start = source.end
+                for length in line_lengths:
+                    source.add_line(length)
+                for code, lexeme, offset in chunk_records:
+                    yield code, lexeme, chunk_start + offset
+
+        add_token = self._token_list.add_token
+        for code, lexeme, offset in self._resolve(records(), source):
+            add_token(code, lexeme, offset)
+
+    def relex_lines(self, first_line: int, last_line: int, new_lines: Iterable[str]) -> None:
+        """
+        Re-tokenizes an edited line range of the script held in the token list.
+
+        Lines ``first_line`` to ``last_line`` (1-based, inclusive) of the previous
+        source are replaced by ``new_lines``; use ``last_line = first_line - 1``
+        for a pure insertion. Comments and text literals never cross a line, so
+        only the new lines are scanned. Their tokens are spliced into the token
+        list and the tokens after the edit are shifted by the change in text
+        length. The token list is left untouched if the new lines are invalid.
+        """
+        new_lines = list(new_lines)
+        line_delta = len(new_lines) - (last_line - first_line + 1)
         tokens = self._token_list.get_tokens()
-        if not tokens:
-            return None
-
-        valid_types = {
-            KeyWords.INTEGER.value[1]: KeyWords.INTEGER,
-            KeyWords.TEXT.value[1]: KeyWords.TEXT,
-            KeyWords.BOOLEAN.value[1]: KeyWords.BOOLEAN,
-            KeyWords.FLOAT.value[1]: KeyWords.FLOAT,
-        }
-
-        last_index = len(tokens) - 1
-        last_token = tokens[last_index]
-
-        if last_token.lexeme == ",":
-            i = last_index
-            while i >= 0 and tokens[i].lexeme != ":":
-                i -= 1
-
-            if i < 0 or i + 1 >= len(tokens):
-                return None
-
-            next_token = tokens[i + 1]
-            if isinstance(next_token.lexeme, str) and next_token.lexeme in valid_types:
-                return valid_types[next_token.lexeme].value[1]
-            else:
-                return None
+        source = self._token_list.source
+        start, end = self._token_list.line_range(first_line, last_line)
+
+        edited = LineIndex(first_line, source.line_start(first_line))
+        records = list(
+            self._resolve(
+                self._scan_lines(new_lines, edited),
+                edited,
+                tokens,
+                start,
+                check_balance=False,
+            )
+        )
+
+        old_delimiters = [t.kind for t in tokens[start:end] if t.kind in _BALANCED_CODES]
+        new_delimiters = [r[0] for r in records if r[0] in _BALANCED_CODES]
+        if old_delimiters != new_delimiters:
+            self.verified_balanced_delimiters(
+                [(t.lexeme, t.column, t.line) for t in tokens[:start] if t.kind in _BALANCED_CODES]
+                + [
+                    (lexeme, *reversed(edited.position(offset)))
+                    for code, lexeme, offset in records
+                    if code in _BALANCED_CODES
+                ]
+                + [
+                    (t.lexeme, t.column, t.line + line_delta)
+                    for t in tokens[end:]
+                    if t.kind in _BALANCED_CODES
+                ]
+            )
+
+        offset_delta = source.splice(first_line, last_line, (len(line) for line in new_lines))
+        self._token_list.splice(start, end, records, offset_delta)
 
-        elif last_token.lexeme == ":":
-            i = last_index
-            if i - 1 < 0:
-                return None
+    def _scan_lines(
+        self, lines: Iterable[str], source: LineIndex
+    ) -> Iterator[tuple[int | None, str, int]]:
+        """Scans ``lines`` into ``(code, lexeme, offset)`` records, indexing them in ``source``."""
+        for line_chars in lines:
+            line_start = source.add_line(len(line_chars))
+            for code, lexeme, column in self._lexer.scan(line_chars):
+                yield code, lexeme, line_start + column
 
-            previous_token = tokens[i - 1]
-            if isinstance(previous_token.lexeme, str) and previous_token.lexeme in valid_types:
-                return valid_types[previous_token.lexeme].value[1]
+    def _scan_buffer(self, buffer, source: LineIndex) -> Iterator[tuple[int | None, str, int]]:
+        size = len(buffer)
+        line_start = 0
+        next_non_ascii = self._find_non_ascii(buffer, 0, size)
+        next_return = self._find_return(buffer, 0, size)
+        while line_start < size:
+            line_end = buffer.find(b"\n", line_start)
+            line_end = size if line_end == -1 else line_end + 1
+            # Lines end like in text mode (universal newlines): a lone '\r'
+            # ends a line too, and '\r\n' counts as a single '\n'.
+            extra = 0
+            if next_return < line_end:
+                if next_return == line_end - 2 and buffer[line_end - 1] == 0x0A:
+                    extra = 1
+                else:
+                    line_end = next_return + 1
+                next_return = self._find_return(buffer, line_end, size)
+
+            if next_non_ascii < line_end:
+                line_chars = buffer[line_start:line_end].decode("utf-8")
+                char_start = source.add_line(len(line_chars) - extra)
+                for code, lexeme, column in self._lexer.scan(line_chars):
+                    yield code, lexeme, char_start + column
+                next_non_ascii = self._find_non_ascii(buffer, line_end, size)
             else:
-                return None
+                char_start = source.add_line(line_end - line_start - extra) - line_start
+                for code, start, end in self._lexer.scan_bytes(buffer, line_start, line_end):
+                    lexeme = FIXED_LEXEMES.get(code)
+                    if lexeme is None:
+                        lexeme = buffer[start:end].decode("ascii")
+                    yield code, lexeme, char_start + start
 
-        return None
+            line_start = line_end
 
-    def filter_list(
-        self, lexemes: list[tuple[str, int, int]]
-    ) -> list[tuple[str, int, int]]:
-        delimiters_set = {d.value[1] for d in Delimiters}
-        return [item for item in lexemes if item[0] in delimiters_set]
+    @staticmethod
+    def _find_return(buffer, start: int, end: int) -> int:
+        position = buffer.find(b"\r", start, end)
+        return end if position == -1 else position
 
-    def verified_balanced_delimiters(self, delimiters: list[tuple[str, int, int]]):
-        opened_delimiters = [Delimiters.START.value[1], Delimiters.LEFT_PAR.value[1]]
-        closed_delimiters = {
-            Delimiters.END.value[1]: Delimiters.START.value[1],
-            Delimiters.RIGHT_PAR.value[1]: Delimiters.LEFT_PAR.value[1],
-        }
+    @staticmethod
+    def _find_non_ascii(buffer, start: int, end: int) -> int:
+        match = NON_ASCII_PATTERN.search(buffer, start, end)
+        return end if match is None else match.start()
+
+    def _resolve(
+        self,
+        lexemes: Iterable[tuple[int | None, str, int]],
+        source: LineIndex,
+        tokens: Sequence[Token] = (),
+        index: int = 0,
+        check_balance: bool = True,
+    ) -> Iterator[tuple[int, str, int]]:
+        """
+        Turns scanned ``(code, lexeme, offset)`` records into final token
+        records: reports invalid lexemes, resolves identifiers through the
+        symbol table and keeps the delimiter balance stack. ``source`` maps
+        the offsets back to lines and columns for diagnostics.
 
+        ``tokens[:index]`` are the tokens already emitted before ``lexemes``;
+        they are only consulted to resume an open declaration.
+        """
+        stack = []
+        declaration = DeclarationContext.resume(tokens, index)
+
+        for code, lexeme, offset in lexemes:
+            if code == Lexer.INVALID:
+                code = self._lexer.analyze(lexeme, *source.position(offset))
+            if code is None:
+                code = self._symbol_table.get_by_code_lexeme(lexeme)
+                if code is None:
+                    code = self._symbol_table.add_symbol(lexeme, declaration.declared_type)
+            elif check_balance and code in _BALANCED_CODES:
+                self._check_balance(stack, code, lexeme, offset, source)
+            declaration.feed(code, lexeme)
+
+            yield code, lexeme, offset
+
+        if stack:
+            _, lexeme, offset = stack[0]
+            raise LexicalError(
+                ErrorMessages.DELIMITER_OPENED_ERROR.value,
+                symbol=lexeme,
+                offset=offset,
+                source=source,
+            )
+
+    @staticmethod
+    def _check_balance(
+        stack: list[tuple[int, str, int]],
+        code: int,
+        lexeme: str,
+        offset: int,
+        source: LineIndex,
+    ) -> None:
+        if code in _OPENING_CODES:
+            stack.append((code, lexeme, offset))
+            return
+
+        if not stack:
+            raise LexicalError(
+                ErrorMessages.DELIMITER_CLOSED_ERROR.value,
+                symbol=lexeme,
+                offset=offset,
+                source=source,
+            )
+        last_open = stack.pop()
+        if _CLOSING_CODES[code] != last_open[0]:
+            raise LexicalError(
+                ErrorMessages.DELIMITER_NOT_CLOSED_ERROR.value,
+                symbol=lexeme,
+                offset=offset,
+                source=source,
+            )
+
+    def verified_balanced_delimiters(self, delimiters: list[tuple[str, int, int]]):
         stack = []
 
         for d, column, line in delimiters:
-            if d in opened_delimiters:
+            if d in _OPENING_LEXEMES:
                 stack.append((d, column, line))
-            elif d in closed_delimiters:
+            elif d in _CLOSING_LEXEMES:
                 if not stack:
                     raise LexicalError(
                         ErrorMessages.DELIMITER_CLOSED_ERROR.value, line, column, d
                     )
                 last_open = stack.pop()
-                if closed_delimiters[d] != last_open[0]:
+                if _CLOSING_LEXEMES[d] != last_open[0]:
                     raise LexicalError(
                         ErrorMessages.DELIMITER_NOT_CLOSED_ERROR.value, line, column, d
                     )
@@ -170,4 +356,28 @@ class Tokenizer:
                 delimiter[1],
                 delimiter[0],
             )
-        return True
\ No newline at end of file
+        return True
+
+
+def _scan_chunk(
+    lexer: Lexer, path_file: str, start: int, end: int
+) -> tuple[list[tuple[int | None, str, int]], list[int]]:
+    """
+    Scans bytes ``start:end`` of ``path_file`` (whole lines) in a worker
+    process. Returns the records with offsets relative to the chunk and the
+    length of every line read. Fixed lexemes are replaced by their shared
+    canonical text, which keeps the pickled result small.
+    """
+    with open(path_file, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+
+    records = []
+    line_lengths = []
+    line_start = 0
+    for line_chars in io.StringIO(text, newline=None):
+        for code, lexeme, column in lexer.scan(line_chars):
+            records.append((code, FIXED_LEXEMES.get(code, lexeme), line_start + column))
+        line_lengths.append(len(line_chars))
+        line_start += len(line_chars)
+    return records, line_lengths
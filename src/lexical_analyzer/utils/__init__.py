@@ -1,4 +1,5 @@
 from .lexer import Lexer
+from .dfa_lexer import DfaLexer
 from .symbol_table import SymbolTable
 from .token_class import Comment, Delimiters, KeyWords, Operators
 from .token_factory import TokenTypeFactory
@@ -0,0 +1,67 @@
+from collections.abc import Sequence
+
+from .token import Token
+from .token_class import Delimiters, FIRST_IDENTIFIER_CODE, KeyWords
+
+_TYPE_NAMES = {
+    KeyWords.INTEGER.code: KeyWords.INTEGER.lexeme,
+    KeyWords.TEXT.code: KeyWords.TEXT.lexeme,
+    KeyWords.BOOLEAN.code: KeyWords.BOOLEAN.lexeme,
+    KeyWords.FLOAT.code: KeyWords.FLOAT.lexeme,
+}
+
+_OUTSIDE = 0
+_AFTER_TYPE = 1
+_EXPECTING_NAME = 2
+_AFTER_NAME = 3
+
+
+class DeclarationContext:
+    """
+    Tracks whether the tokens being emitted are the name list of a
+    declaration (``tipo : a, b, c``), so every new identifier gets its
+    declared type in constant time.
+    """
+
+    __slots__ = ("_state", "_type")
+
+    def __init__(self) -> None:
+        self._state = _OUTSIDE
+        self._type: str | None = None
+
+    @property
+    def declared_type(self) -> str | None:
+        """Type of an identifier emitted next, or ``None`` outside a name list."""
+        return self._type if self._state == _EXPECTING_NAME else None
+
+    def feed(self, code: int, lexeme) -> None:
+        state = self._state
+        if state == _EXPECTING_NAME and code >= FIRST_IDENTIFIER_CODE:
+            self._state = _AFTER_NAME
+        elif state == _AFTER_NAME and code == Delimiters.COMMA.code:
+            self._state = _EXPECTING_NAME
+        elif state == _AFTER_TYPE and code == Delimiters.COLON.code:
+            self._state = _EXPECTING_NAME
+        elif _TYPE_NAMES.get(code) == lexeme:
+            self._state = _AFTER_TYPE
+            self._type = lexeme
+        else:
+            self._state = _OUTSIDE
+
+    @classmethod
+    def resume(cls, tokens: Sequence[Token], index: int) -> "DeclarationContext":
+        """
+        Rebuilds the context in effect after ``tokens[:index]``, replaying only
+        the declaration that may still be open at that point.
+        """
+        start = index
+        while start > 0 and (
+            tokens[start - 1].kind >= FIRST_IDENTIFIER_CODE
+            or tokens[start - 1].kind == Delimiters.COMMA.code
+        ):
+            start -= 1
+
+        context = cls()
+        for token in tokens[max(start - 2, 0):index]:
+            context.feed(token.kind, token.lexeme)
+        return context
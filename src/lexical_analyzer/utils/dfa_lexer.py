@@ -0,0 +1,420 @@
+from array import array
+
+from .lexer import Lexer, _SYMBOL_CODES, _WORD_CODES, _WORD_CODES_BYTES
+from .token_class import Comment, KeyWords
+
+# The DFA runs over character classes. ASCII characters are their own input
+# symbols; every other character is folded into one of four symbols by the
+# Unicode properties the scanner rules depend on (``\d``, ``\w``, ``\s``).
+_NON_ASCII_DIGIT = 128
+_NON_ASCII_WORD = 129
+_NON_ASCII_SPACE = 130
+_NON_ASCII_OTHER = 131
+_ALPHABET = range(132)
+
+_NO_MATCH = -2
+_IDENTIFIER = -1
+
+_TABLE_FORMAT = 1
+
+
+def _symbols(predicate) -> tuple[int, ...]:
+    return tuple(symbol for symbol in _ALPHABET if predicate(symbol))
+
+
+def _non_ascii_symbol(char: str) -> int:
+    if char.isdecimal():
+        return _NON_ASCII_DIGIT
+    if char.isalnum():
+        return _NON_ASCII_WORD
+    if char.isspace():
+        return _NON_ASCII_SPACE
+    return _NON_ASCII_OTHER
+
+
+def _is_digit(symbol: int) -> bool:
+    return symbol == _NON_ASCII_DIGIT or chr(symbol) in "0123456789"
+
+
+def _is_word(symbol: int) -> bool:
+    if symbol >= 128:
+        return symbol in (_NON_ASCII_DIGIT, _NON_ASCII_WORD)
+    return chr(symbol).isalnum() or symbol == ord("_")
+
+
+def _is_space(symbol: int) -> bool:
+    return symbol == _NON_ASCII_SPACE if symbol >= 128 else chr(symbol).isspace()
+
+
+def _chars(predicate):
+    return ("chars", _symbols(predicate))
+
+
+def _literal(text: str):
+    return ("seq", tuple(("chars", (ord(char),)) for char in text))
+
+
+def _seq(*nodes):
+    return ("seq", nodes)
+
+
+def _alt(*nodes):
+    return ("alt", nodes)
+
+
+def _star(node):
+    return ("star", node)
+
+
+def _plus(node):
+    return _seq(node, _star(node))
+
+
+def lexer_rules() -> tuple:
+    """
+    Scanner rules as ``(label, pattern)`` pairs, highest priority first.
+
+    They mirror ``SCAN_PATTERN``: with longest match and ties broken by rule
+    order, the DFA splits a line exactly like the regex alternation. Labels are
+    token codes, ``Lexer.INVALID`` or ``-1`` for identifiers and keywords.
+    """
+    digit = _chars(_is_digit)
+    ascii_letter = _chars(lambda s: s < 128 and (chr(s).isalpha() or chr(s) == "_"))
+    ascii_word = _chars(lambda s: s < 128 and (chr(s).isalnum() or chr(s) == "_"))
+
+    text_char = _alt(
+        _chars(lambda s: s not in (ord('"'), ord("\\"))),
+        _seq(_literal("\\"), _chars(lambda s: s != ord("\n"))),
+    )
+    rules = [
+        (KeyWords.TEXT.code, _seq(_literal('"'), _star(text_char), _literal('"'))),
+        (Comment.COMMENT.code, _literal(Comment.COMMENT.lexeme)),
+    ]
+    rules += [
+        (code, _literal(lexeme))
+        for lexeme, code in sorted(_SYMBOL_CODES.items(), key=lambda item: item[1])
+    ]
+    rules += [
+        (KeyWords.FLOAT.code, _seq(_plus(digit), _literal("."), _plus(digit))),
+        (_IDENTIFIER, _seq(ascii_letter, _star(ascii_word))),
+        (KeyWords.INTEGER.code, _plus(digit)),
+        (Lexer.INVALID, _plus(_chars(_is_word))),
+        (Lexer.INVALID, _chars(lambda s: not _is_word(s) and not _is_space(s))),
+    ]
+    return tuple(rules)
+
+
+class _Nfa:
+    def __init__(self) -> None:
+        self.edges: list[list[tuple[tuple[int, ...], int]]] = []
+        self.epsilons: list[list[int]] = []
+        self.accepts: dict[int, tuple[int, int]] = {}
+
+    def new_state(self) -> int:
+        self.edges.append([])
+        self.epsilons.append([])
+        return len(self.edges) - 1
+
+    def add(self, node, start: int) -> int:
+        """Adds the fragment for ``node`` starting at ``start`` and returns its end."""
+        kind, value = node
+        if kind == "chars":
+            end = self.new_state()
+            self.edges[start].append((value, end))
+            return end
+        if kind == "seq":
+            for child in value:
+                start = self.add(child, start)
+            return start
+        if kind == "alt":
+            end = self.new_state()
+            for child in value:
+                branch = self.new_state()
+                self.epsilons[start].append(branch)
+                self.epsilons[self.add(child, branch)].append(end)
+            return end
+        loop = self.new_state()
+        self.epsilons[start].append(loop)
+        self.epsilons[self.add(value, loop)].append(loop)
+        return loop
+
+    def closure(self, states) -> frozenset[int]:
+        seen = set(states)
+        pending = list(states)
+        while pending:
+            for target in self.epsilons[pending.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    pending.append(target)
+        return frozenset(seen)
+
+
+def _character_classes(nfa: _Nfa) -> list[int]:
+    """Groups alphabet symbols that no edge tells apart; returns symbol -> class."""
+    char_sets = sorted({chars for edges in nfa.edges for chars, _ in edges})
+    signatures: dict[tuple[int, ...], int] = {}
+    classes = []
+    for symbol in _ALPHABET:
+        signature = tuple(i for i, chars in enumerate(char_sets) if symbol in chars)
+        classes.append(signatures.setdefault(signature, len(signatures)))
+    return classes
+
+
+def _determinize(nfa: _Nfa, start: int, symbol_classes: list[int]):
+    width = max(symbol_classes) + 1
+    edges_by_class = [
+        [(target, frozenset(symbol_classes[s] for s in chars)) for chars, target in edges]
+        for edges in nfa.edges
+    ]
+
+    # DFA state 0 is the dead state, 1 the start state.
+    start_set = nfa.closure([start])
+    ids = {frozenset(): 0, start_set: 1}
+    order = [frozenset(), start_set]
+    transitions = [0] * width
+    index = 1
+    while index < len(order):
+        current = order[index]
+        row = [0] * width
+        for cls in range(width):
+            targets = [
+                target
+                for state in current
+                for target, classes in edges_by_class[state]
+                if cls in classes
+            ]
+            if not targets:
+                continue
+            target_set = nfa.closure(targets)
+            if target_set not in ids:
+                ids[target_set] = len(order)
+                order.append(target_set)
+            row[cls] = ids[target_set]
+        transitions.extend(row)
+        index += 1
+
+    accept = []
+    for states in order:
+        matches = [nfa.accepts[state] for state in states if state in nfa.accepts]
+        accept.append(min(matches)[1] if matches else _NO_MATCH)
+    return width, transitions, accept
+
+
+def _minimize(width: int, transitions: list[int], accept: list[int]):
+    """Moore partition refinement; keeps the dead state at 0 and the start at 1."""
+    count = len(accept)
+    blocks = [("dead",) if state == 0 else (accept[state],) for state in range(count)]
+    while True:
+        signatures = [
+            (blocks[state],)
+            + tuple(blocks[transitions[state * width + cls]] for cls in range(width))
+            for state in range(count)
+        ]
+        numbering: dict = {}
+        refined = [numbering.setdefault(signature, len(numbering)) for signature in signatures]
+        if len(numbering) == len(set(blocks)):
+            break
+        blocks = refined
+
+    order = {blocks[0]: 0, blocks[1]: 1}
+    for state in range(count):
+        order.setdefault(blocks[state], len(order))
+    representative = {}
+    for state in range(count):
+        representative.setdefault(order[blocks[state]], state)
+
+    minimized = []
+    minimized_accept = []
+    for new_state in range(len(order)):
+        state = representative[new_state]
+        minimized.extend(
+            order[blocks[transitions[state * width + cls]]] for cls in range(width)
+        )
+        minimized_accept.append(accept[state])
+    return minimized, minimized_accept
+
+
+def build_lexer_table(rules: tuple = None) -> dict:
+    """
+    Compiles ``rules`` (default ``lexer_rules()``) into a minimized DFA.
+
+    Returns a JSON-friendly dict with the class of every alphabet symbol, the
+    row-major transition table (state 0 is dead, 1 is the start) and the label
+    accepted in each state.
+    """
+    rules = lexer_rules() if rules is None else rules
+    nfa = _Nfa()
+    start = nfa.new_state()
+    for priority, (label, pattern) in enumerate(rules):
+        branch = nfa.new_state()
+        nfa.epsilons[start].append(branch)
+        nfa.accepts[nfa.add(pattern, branch)] = (priority, label)
+
+    symbol_classes = _character_classes(nfa)
+    width, transitions, accept = _determinize(nfa, start, symbol_classes)
+    transitions, accept = _minimize(width, transitions, accept)
+    return {
+        "classes": symbol_classes,
+        "width": width,
+        "transitions": transitions,
+        "accept": accept,
+    }
+
+
+def _is_lexer_table(table, rules: tuple) -> bool:
+    """
+    Whether ``table`` has the shape ``build_lexer_table`` gives it for
+    ``rules``, so the scanning loop can follow it without checks.
+    """
+    if not isinstance(table, dict) or set(table) != {"classes", "width", "transitions", "accept"}:
+        return False
+    width, classes, transitions, accept = table["width"], table["classes"], table["transitions"], table["accept"]
+    if type(width) is not int or width < 1:
+        return False
+    if not isinstance(classes, list) or len(classes) != len(_ALPHABET):
+        return False
+    if not all(type(symbol_class) is int and 0 <= symbol_class < width for symbol_class in classes):
+        return False
+    if not isinstance(accept, list) or len(accept) < 2:
+        return False
+    labels = {label for label, _ in rules} | {_NO_MATCH}
+    if not all(type(label) is int and label in labels for label in accept):
+        return False
+    return (
+        isinstance(transitions, list)
+        and len(transitions) == len(accept) * width
+        and all(type(state) is int and 0 <= state < len(accept) for state in transitions)
+    )
+
+
+class LexerTable:
+    """Compact, ready-to-run form of a table built by ``build_lexer_table``."""
+
+    def __init__(self, table: dict) -> None:
+        classes = table["classes"]
+        width = table["width"]
+        # States are stored as the offset of their row so the scanning loop
+        # indexes the table without a multiplication; the dead state is 0.
+        self.start = width
+        self.transitions = array("I", (state * width for state in table["transitions"]))
+        self.accept = array("b", (label for label in table["accept"] for _ in range(width)))
+        # bytes.translate tables mapping an ASCII byte to its class; non-ASCII
+        # bytes never reach them (those lines are scanned as text).
+        self.byte_classes = bytes(
+            classes[b] if b < 128 else classes[_NON_ASCII_OTHER] for b in range(256)
+        )
+        self.char_classes = _CharClasses(classes)
+
+
+class _CharClasses(dict):
+    """``str.translate`` table that classifies non-ASCII characters on demand."""
+
+    def __init__(self, classes: list[int]) -> None:
+        super().__init__((code, chr(classes[code])) for code in range(128))
+        self._classes = classes
+
+    def __missing__(self, code: int) -> str:
+        value = chr(self._classes[_non_ascii_symbol(chr(code))])
+        self[code] = value
+        return value
+
+
+_TABLE: LexerTable | None = None
+
+
+def load_lexer_table() -> LexerTable:
+    """
+    Returns the DFA for the current token definitions, building it only when
+    the on-disk cache (see ``src.cache``) has no table for them.
+    """
+    global _TABLE
+    if _TABLE is None:
+        # Only callers of the DFA lexer pay for the cache's imports.
+        from src.cache import cache_key, load_json, store_json
+
+        rules = lexer_rules()
+        key = cache_key("lexer-dfa", _TABLE_FORMAT, rules)
+        table = load_json("lexer-dfa", key, lambda value: _is_lexer_table(value, rules))
+        if table is None:
+            table = build_lexer_table(rules)
+            store_json("lexer-dfa", key, table)
+        _TABLE = LexerTable(table)
+    return _TABLE
+
+
+class DfaLexer(Lexer):
+    """
+    ``Lexer`` whose ``scan``/``scan_bytes`` run a precomputed minimized DFA
+    instead of the backtracking ``SCAN_PATTERN`` alternation, so scanning time
+    is linear in the line length whatever the input. ``analyze`` still builds
+    the diagnostics for invalid lexemes.
+    """
+
+    def __init__(self, table: LexerTable | None = None):
+        super().__init__()
+        self._table = load_lexer_table() if table is None else table
+
+    def _matches(self, classes: bytes):
+        """Longest-match loop; yields ``(label, start, end)`` for every lexeme."""
+        transitions = self._table.transitions
+        accept = self._table.accept
+        initial = self._table.start
+        no_match = _NO_MATCH
+        position = 0
+        end = len(classes)
+        while position < end:
+            row = transitions[initial + classes[position]]
+            position += 1
+            if not row:
+                continue
+            start = position - 1
+            label = accept[row]
+            match_end = position
+            while position < end:
+                row = transitions[row + classes[position]]
+                if not row:
+                    break
+                position += 1
+                if accept[row] != no_match:
+                    label = accept[row]
+                    match_end = position
+            position = match_end
+            yield label, start, match_end
+
+    def scan(self, line: str):
+        if line.isascii():
+            classes = line.encode("ascii").translate(self._table.byte_classes)
+        else:
+            classes = line.translate(self._table.char_classes).encode("latin-1")
+
+        for label, start, end in self._matches(classes):
+            if label == _IDENTIFIER:
+                lexeme = line[start:end]
+                code = _WORD_CODES.get(lexeme)
+            elif label == Comment.COMMENT.code:
+                return
+            else:
+                lexeme = line[start:end]
+                code = label
+                if label == KeyWords.TEXT.code and '"' in lexeme[1:-1]:
+                    code = Lexer.INVALID
+            yield code, lexeme, start
+
+    def scan_bytes(self, buffer, start: int, end: int):
+        classes = buffer[start:end].translate(self._table.byte_classes)
+        for label, lexeme_start, lexeme_end in self._matches(classes):
+            lexeme_start += start
+            lexeme_end += start
+            if label == _IDENTIFIER:
+                code = _WORD_CODES_BYTES.get(buffer[lexeme_start:lexeme_end])
+            elif label == Comment.COMMENT.code:
+                return
+            elif label == KeyWords.TEXT.code:
+                code = (
+                    Lexer.INVALID
+                    if buffer.find(b'"', lexeme_start + 1, lexeme_end - 1) != -1
+                    else label
+                )
+            else:
+                code = label
+            yield code, lexeme_start, lexeme_end
@@ -1,36 +1,189 @@
+import functools
 import re
 
 from src.errors.error import LexicalError
 from src.errors.error_messages import ErrorMessages
 from .token_class import Comment, KeyWords, Delimiters, Operators
 
+_LITERAL_WORDS = {
+    "verdadeiro": KeyWords.BOOLEAN.code,
+    "falso": KeyWords.BOOLEAN.code,
+}
+
+_CODES_BY_KIND = {
+    "KEYWORD": {e.lexeme: e.code for e in KeyWords},
+    "DELIMITER": {e.lexeme: e.code for e in Delimiters},
+    "OPERATOR": {e.lexeme: e.code for e in Operators},
+    "COMMENT": {e.lexeme: e.code for e in Comment},
+}
+
+# Word lexemes (keywords, ``inicio``/``fim`` and the boolean literals) are
+# resolved with a dict lookup once the scanner has matched an identifier.
+_WORD_CODES = {
+    lexeme: code
+    for codes in _CODES_BY_KIND.values()
+    for lexeme, code in codes.items()
+    if lexeme.isidentifier()
+}
+_WORD_CODES.update(_LITERAL_WORDS)
+
+# Quotes are only valid as part of a closed text literal.
+_SYMBOL_CODES = {
+    lexeme: code
+    for kind in ("DELIMITER", "OPERATOR")
+    for lexeme, code in _CODES_BY_KIND[kind].items()
+    if not lexeme.isidentifier()
+    and lexeme not in (Delimiters.QUOTATION_MARK.lexeme, Delimiters.SINGLE_QUOTE.lexeme)
+}
+
+_MULTI_CHAR_SYMBOLS = sorted(
+    (lexeme for lexeme in _SYMBOL_CODES if len(lexeme) > 1), key=len, reverse=True
+)
+
+SCAN_PATTERN = re.compile(
+    r'(?P<TEXT>"(?:[^"\\]|\\.)*")'
+    + rf"|(?P<COMMENT>{re.escape(Comment.COMMENT.lexeme)})"
+    + rf"|(?P<SYMBOL>{'|'.join(re.escape(s) for s in _MULTI_CHAR_SYMBOLS)})"
+    + r"|(?P<FLOAT>\d+\.\d+)"
+    + r"|(?P<ID>[a-zA-Z_][a-zA-Z0-9_]*(?!\w))"
+    + r"|(?P<INTEGER>\d+(?!\w))"
+    + r"|(?P<WORD>\w+)"
+    + r"|(?P<CHAR>[^\w\s])"
+)
+
+# Same scanner over raw bytes. ``\w``/``\d``/``\s`` are ASCII-only here, so it
+# is only used on lines without non-ASCII bytes. The bytes ``\s`` leaves out
+# the separators \x1c-\x1f, which ``str.isspace`` counts, so they are added.
+BYTES_SCAN_PATTERN = re.compile(
+    SCAN_PATTERN.pattern.replace(r"[^\w\s]", r"[^\w\s\x1c-\x1f]").encode("ascii")
+)
+NON_ASCII_PATTERN = re.compile(rb"[^\x00-\x7f]")
+
+_WORD_CODES_BYTES = {lexeme.encode("ascii"): code for lexeme, code in _WORD_CODES.items()}
+_SYMBOL_CODES_BYTES = {lexeme.encode("ascii"): code for lexeme, code in _SYMBOL_CODES.items()}
+
+# Canonical text of every token whose code identifies a single lexeme. Codes
+# shared by a type keyword and its literals (inteiro/150, texto/"...") are left
+# out because their text has to be read from the source.
+FIXED_LEXEMES = {
+    code: lexeme
+    for codes in (_WORD_CODES, _SYMBOL_CODES)
+    for lexeme, code in codes.items()
+    if code not in (
+        KeyWords.INTEGER.code,
+        KeyWords.TEXT.code,
+        KeyWords.BOOLEAN.code,
+        KeyWords.FLOAT.code,
+    )
+}
+
+TOKEN_SPECS = [
+    ("KEYWORD", f"\\b({'|'.join(re.escape(e.lexeme) for e in KeyWords)})\\b"),
+    ("DELIMITER", f"{'|'.join(re.escape(e.lexeme) for e in Delimiters)}"),
+    (
+        "OPERATOR",
+        f"{'|'.join(sorted((re.escape(e.lexeme) for e in Operators), key=len, reverse=True))}",
+    ),
+    ("BOOLEAN", r"\b(verdadeiro|falso)\b"),
+    ("FLOAT", r"\d+\.\d+"),
+    ("INTEGER", r"\d+"),
+    ("TEXT", r'"[^"\n]*"'),
+    ("ID", r"[a-zA-Z_][a-zA-Z0-9_]*"),
+]
+_UNKNOWN_SYMBOL_PATTERN = re.compile(r"[^a-zA-Z0-9_\s\"'()\[\]{}\.,;:+\-*/%=<>!&|^~?]")
+_INVALID_FIRST_SYMBOL_PATTERN = re.compile(r"^[^a-zA-Z_]")
+
+
+@functools.cache
+def analyze_pattern() -> re.Pattern:
+    """
+    Master pattern ``analyze`` uses to classify a lexeme the scanner rejected.
+    It is only needed to report errors, so it is compiled on first use and
+    then shared by every ``Lexer``.
+    """
+    return re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in TOKEN_SPECS))
+
 
 class Lexer:
+    INVALID = 0
+
     def __init__(self):
-        self.token_specs = [
-            ("KEYWORD", f"\\b({'|'.join(re.escape(e.lexeme) for e in KeyWords)})\\b"),
-            ("DELIMITER", f"{'|'.join(re.escape(e.lexeme) for e in Delimiters)}"),
-            (
-                "OPERATOR",
-                f"{'|'.join(sorted((re.escape(e.lexeme) for e in Operators), key=len, reverse=True))}",
-            ),
-            ("BOOLEAN", r"\b(verdadeiro|falso)\b"),
-            ("FLOAT", r"\d+\.\d+"),
-            ("INTEGER", r"\d+"),
-            ("TEXT", r'"[^"\n]*"'),
-            ("ID", r"[a-zA-Z_][a-zA-Z0-9_]*"),
-        ]
-
-        self.regex = re.compile(
-            "|".join(f"(?P<{name}>{pattern})" for name, pattern in self.token_specs)
-        )
+        self.token_specs = TOKEN_SPECS
+
+    @property
+    def regex(self) -> re.Pattern:
+        return analyze_pattern()
+
+    @staticmethod
+    def scan(line: str):
+        """
+        Splits and classifies a source line in a single pass.
+
+        Yields ``(code, lexeme, column)`` for every lexeme up to a comment.
+        ``code`` is ``None`` for identifiers (resolved by the symbol table) and
+        ``Lexer.INVALID`` for lexemes that must be reported through ``analyze``.
+        """
+        for match in SCAN_PATTERN.finditer(line):
+            kind = match.lastgroup
+            lexeme = match.group()
+
+            if kind == "ID":
+                code = _WORD_CODES.get(lexeme)
+            elif kind == "CHAR" or kind == "SYMBOL":
+                code = _SYMBOL_CODES.get(lexeme, Lexer.INVALID)
+            elif kind == "INTEGER":
+                code = KeyWords.INTEGER.code
+            elif kind == "TEXT":
+                code = Lexer.INVALID if '"' in lexeme[1:-1] else KeyWords.TEXT.code
+            elif kind == "FLOAT":
+                code = KeyWords.FLOAT.code
+            elif kind == "COMMENT":
+                return
+            else:
+                code = Lexer.INVALID
+
+            yield code, lexeme, match.start()
+
+    @staticmethod
+    def scan_bytes(buffer, start: int, end: int):
+        """
+        Byte-level counterpart of ``scan`` for the ASCII region
+        ``buffer[start:end]`` (a line of an ``mmap`` or ``bytes`` object).
+
+        Yields ``(code, lexeme_start, lexeme_end)`` with absolute offsets into
+        ``buffer`` instead of allocating the lexeme text.
+        """
+        for match in BYTES_SCAN_PATTERN.finditer(buffer, start, end):
+            kind = match.lastgroup
+
+            if kind == "ID":
+                code = _WORD_CODES_BYTES.get(match.group())
+            elif kind == "CHAR" or kind == "SYMBOL":
+                code = _SYMBOL_CODES_BYTES.get(match.group(), Lexer.INVALID)
+            elif kind == "INTEGER":
+                code = KeyWords.INTEGER.code
+            elif kind == "TEXT":
+                lexeme_start, lexeme_end = match.span()
+                code = (
+                    Lexer.INVALID
+                    if buffer.find(b'"', lexeme_start + 1, lexeme_end - 1) != -1
+                    else KeyWords.TEXT.code
+                )
+            elif kind == "FLOAT":
+                code = KeyWords.FLOAT.code
+            elif kind == "COMMENT":
+                return
+            else:
+                code = Lexer.INVALID
+
+            yield code, match.start(), match.end()
 
     @staticmethod
     def verify_error_id_not_match(self, lexeme: str, line: int, column: int) -> None:
-        if re.match(r"[^a-zA-Z0-9_\s\"'()\[\]{}\.,;:+\-*/%=<>!&|^~?]", lexeme):
+        if _UNKNOWN_SYMBOL_PATTERN.match(lexeme):
             raise LexicalError(ErrorMessages.UNKNOWN_SYMBOL.value, line, column, lexeme)
 
-        if re.match(r"^[^a-zA-Z_]", lexeme):
+        if _INVALID_FIRST_SYMBOL_PATTERN.match(lexeme):
             raise LexicalError(ErrorMessages.FIRST_SYMBOL.value, line, column, lexeme)
 
         raise LexicalError(ErrorMessages.UNKNOWN_SYMBOL.value, line, column, lexeme)
@@ -70,18 +223,11 @@ class Lexer:
     def get_code_by_token(
         token_type: str, lexeme: str, line: int, column: int
     ) -> int | None:
-        enum_map = {
-            "KEYWORD": KeyWords,
-            "DELIMITER": Delimiters,
-            "OPERATOR": Operators,
-            "COMMENT": Comment,
-        }
-
-        enum_class = enum_map.get(token_type)
-        if enum_class is None:
+        codes = _CODES_BY_KIND.get(token_type)
+        if codes is None:
             raise LexicalError(ErrorMessages.UNKNOWN_SYMBOL.value, line, column, lexeme)
 
-        for item in enum_class:
-            if item.lexeme == lexeme:
-                return item.code
-        raise LexicalError(ErrorMessages.UNKNOWN_SYMBOL.value, line, column, lexeme)
\ No newline at end of file
+        code = codes.get(lexeme)
+        if code is None:
+            raise LexicalError(ErrorMessages.UNKNOWN_SYMBOL.value, line, column, lexeme)
+        return code
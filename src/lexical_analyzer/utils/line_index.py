@@ -0,0 +1,68 @@
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+
+
+class LineIndex:
+    """
+    Sorted start offsets of the lines of a source text.
+
+    Tokens only carry an absolute character offset into the text; the line and
+    column are recovered with a binary search when they are actually needed,
+    e.g. when a diagnostic is formatted.
+    """
+
+    __slots__ = ("_first_line", "_starts")
+
+    def __init__(self, first_line: int = 1, start: int = 0) -> None:
+        self._first_line = first_line
+        # Start of every line followed by the offset where the next line would
+        # begin, so ``_starts[-1]`` is always the end of the indexed text.
+        self._starts = array("q", [start])
+
+    @property
+    def end(self) -> int:
+        return self._starts[-1]
+
+    @property
+    def line_count(self) -> int:
+        return len(self._starts) - 1
+
+    def add_line(self, length: int) -> int:
+        """Appends a line of ``length`` characters and returns its start offset."""
+        start = self._starts[-1]
+        self._starts.append(start + length)
+        return start
+
+    def line_start(self, line: int) -> int:
+        """Offset of ``line``; lines past the end start at ``end``."""
+        index = min(max(line - self._first_line, 0), len(self._starts) - 1)
+        return self._starts[index]
+
+    def offset(self, line: int, column: int) -> int:
+        return self.line_start(line) + column
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Returns the ``(line, column)`` of ``offset``."""
+        index = min(bisect_right(self._starts, offset) - 1, len(self._starts) - 2)
+        index = max(index, 0)
+        return self._first_line + index, offset - self._starts[index]
+
+    def splice(self, first_line: int, last_line: int, lengths: Iterable[int]) -> int:
+        """
+        Replaces lines ``first_line..last_line`` with lines of the given
+        ``lengths`` and returns how far the text after them moved.
+        """
+        first = first_line - self._first_line
+        last = last_line - self._first_line + 1
+        starts = array("q")
+        offset = self._starts[first]
+        for length in lengths:
+            starts.append(offset)
+            offset += length
+        delta = offset - self._starts[last]
+        self._starts[first:last] = starts
+        if delta:
+            tail = first + len(starts)
+            self._starts[tail:] = array("q", (start + delta for start in self._starts[tail:]))
+        return delta
@@ -1,45 +1,51 @@
-from .token_class import Comment
+from .token_class import FIRST_IDENTIFIER_CODE
 
 
 class SymbolTable:
     def __init__(self) -> None:
-        self._symbols: list[dict] = []
-        self._ref_symbol = Comment.COMMENT.value[0]
+        self._first_ref = FIRST_IDENTIFIER_CODE
+        self._ref_symbol = self._first_ref - 1
+        # Symbol ``code`` is stored at index ``code - self._first_ref``.
+        self._lexemes: list[str] = []
+        self._types: list[str | None] = []
+        self._codes_by_lexeme: dict[str, int] = {}
 
     def add_symbol(self, lexeme: str, type: str) -> int:
         self._ref_symbol += 1
-        symbol = {
-            "type": type,
-            "value": "IDENTIFIER",
-            "lexeme": lexeme,
-            "code": self._ref_symbol,
-        }
-        self._symbols.append(symbol)
+        self._lexemes.append(lexeme)
+        self._types.append(type)
+        self._codes_by_lexeme.setdefault(lexeme, self._ref_symbol)
         return self._ref_symbol
 
-    def get_by_code(self, symbol_ref: int) -> str | None:
-        for symbol in self._symbols:
-            if symbol["code"] == symbol_ref:
-                return symbol["type"]
+    def _index(self, symbol_ref: int) -> int | None:
+        index = symbol_ref - self._first_ref
+        if 0 <= index < len(self._lexemes):
+            return index
         return None
 
+    def get_by_code(self, symbol_ref: int) -> str | None:
+        index = self._index(symbol_ref)
+        return None if index is None else self._types[index]
+
     def get_by_code_with_value(self, symbol_ref: int):
-        for symbol in self._symbols:
-            if symbol["code"] == symbol_ref:
-                return symbol["value"]
-        return None
+        return None if self._index(symbol_ref) is None else "IDENTIFIER"
 
     def get_by_code_lexeme(self, lexeme: str) -> int | None:
-        for symbol in self._symbols:
-            if symbol["lexeme"] == lexeme:
-                return symbol["code"]
-        return None
+        return self._codes_by_lexeme.get(lexeme)
 
     def get_by_lexeme(self, lexeme: str) -> str | None:
-        for symbol in self._symbols:
-            if symbol["lexeme"] == lexeme:
-                return symbol["type"]
-        return None
+        code = self._codes_by_lexeme.get(lexeme)
+        return None if code is None else self._types[code - self._first_ref]
 
     def get_symbols(self) -> list[dict]:
-        return self._symbols
\ No newline at end of file
+        return [
+            {
+                "type": type,
+                "value": "IDENTIFIER",
+                "lexeme": lexeme,
+                "code": code,
+            }
+            for code, lexeme, type in zip(
+                range(self._first_ref, self._ref_symbol + 1), self._lexemes, self._types
+            )
+        ]
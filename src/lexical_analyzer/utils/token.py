@@ -1,9 +1,28 @@
+from .line_index import LineIndex
+from .token_class import token_name
+
+
 class Token:
-    def __init__(self, token_type: str, lexeme: str, line: int, column: int):
-        self.token_type = token_type
+    __slots__ = ("kind", "lexeme", "offset", "source")
+
+    def __init__(self, kind: int, lexeme: str, offset: int, source: LineIndex):
+        self.kind = kind
         self.lexeme = lexeme
-        self.line = line
-        self.column = column
+        self.offset = offset
+        self.source = source
+
+    @property
+    def token_type(self) -> str:
+        return token_name(self.kind)
+
+    @property
+    def line(self) -> int:
+        return self.source.position(self.offset)[0]
+
+    @property
+    def column(self) -> int:
+        return self.source.position(self.offset)[1]
 
     def __repr__(self):
-        return f"Token(type='{self.token_type}', lexeme='{self.lexeme}', line={self.line}, column={self.column})"
\ No newline at end of file
+        line, column = self.source.position(self.offset)
+        return f"Token(type='{self.token_type}', lexeme='{self.lexeme}', line={line}, column={column})"
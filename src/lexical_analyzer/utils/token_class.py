@@ -31,10 +31,8 @@ class KeyWords(Enum):
 
   @classmethod
   def get_by_code(cls, code: int) -> str | None:
-    for item in cls:
-      if item.code == code:
-        return item.name
-    return None
+    name = TOKEN_NAMES.get(code)
+    return name if name in cls.__members__ else None
 
 class Delimiters(Enum):
   START = (16, "inicio")
@@ -60,10 +58,8 @@ class Delimiters(Enum):
 
   @classmethod
   def get_by_code(cls, code: int) -> str | None:
-    for item in cls:
-      if item.code == code:
-        return item.name
-    return None
+    name = TOKEN_NAMES.get(code)
+    return name if name in cls.__members__ else None
 
 
 class Operators(Enum):
@@ -94,10 +90,8 @@ class Operators(Enum):
 
   @classmethod
   def get_by_code(cls, code: int) -> str | None:
-    for item in cls:
-      if item.code == code:
-        return item.name
-    return None
+    name = TOKEN_NAMES.get(code)
+    return name if name in cls.__members__ else None
 
 
 class Comment(Enum):
@@ -117,7 +111,20 @@ class Comment(Enum):
 
   @classmethod
   def get_by_code(cls, code: int) -> str | None:
-    for item in cls:
-      if item.code == code:
-        return item.name
-    return None
\ No newline at end of file
+    name = TOKEN_NAMES.get(code)
+    return name if name in cls.__members__ else None
+
+
+# Code -> enum name, used for diagnostics and token reprs only.
+TOKEN_NAMES = {
+  item.code: item.name
+  for enum_class in (KeyWords, Delimiters, Operators, Comment)
+  for item in enum_class
+}
+
+# Codes from here on are assigned to identifiers by the symbol table.
+FIRST_IDENTIFIER_CODE = Comment.COMMENT.code + 1
+
+
+def token_name(code: int) -> str:
+  return TOKEN_NAMES.get(code, "IDENTIFIER")
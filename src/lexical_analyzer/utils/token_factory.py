@@ -1,4 +1,4 @@
-from .token_class import KeyWords, Operators, Comment, Delimiters
+from .token_class import FIRST_IDENTIFIER_CODE, TOKEN_NAMES
 from .symbol_table import SymbolTable
 
 
@@ -7,15 +7,6 @@ class TokenTypeFactory:
         self.symbol_table = symbol_table
 
     def factory(self, code: int) -> str | None:
-        if 1 <= code <= 15:
-            return KeyWords.get_by_code(code)
-        elif 16 <= code <= 24:
-            return Delimiters.get_by_code(code)
-        elif 25 <= code <= 36:
-            return Operators.get_by_code(code)
-        elif code == 37:
-            return Comment.get_by_code(code)
-        elif code >= 36:
+        if code >= FIRST_IDENTIFIER_CODE:
             return self.symbol_table.get_by_code_with_value(code)
-        else:
-            return None
\ No newline at end of file
+        return TOKEN_NAMES.get(code)
\ No newline at end of file
@@ -1,39 +1,185 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+
 from src.errors.error_messages import ErrorMessages
 from src.errors.error import LexicalError
+from .line_index import LineIndex
 from .token import Token
 from .token_class import KeyWords
 from .token_factory import TokenTypeFactory
 
 
 class TokenListTable:
-    def __init__(self, token_factory: TokenTypeFactory) -> None:
-        self._token_list: list[Token] = []
+    """
+    Ordered list of the tokens produced by the tokenizer.
+
+    Tokens store an absolute character offset; ``source`` holds the line
+    starts of the tokenized text and turns offsets back into lines/columns.
+
+    With ``compact=True`` tokens are not kept as ``Token`` instances: their
+    code, offset and interned lexeme id live in parallel ``array`` buffers and
+    ``get_tokens()`` returns a ``CompactTokenList`` that builds ``Token`` views
+    on demand.
+    """
+
+    def __init__(self, token_factory: TokenTypeFactory, compact: bool = False) -> None:
         self._token_factory = token_factory
+        self._compact = compact
+        self._source = LineIndex()
+        if compact:
+            self._codes = array("i")
+            self._offsets = array("q")
+            self._lexeme_ids = array("i")
+            self._lexemes: list = []
+            self._lexeme_ids_by_text: dict[str, int] = {}
+            # The parser peeks the same token several times in a row.
+            self._last_view: tuple[int, Token | None] = (-1, None)
+            self._token_list = CompactTokenList(self)
+        else:
+            self._token_list: list[Token] = []
 
     @property
-    def token_list(self) -> list[Token]:
+    def token_list(self) -> "list[Token] | CompactTokenList":
         return self._token_list
 
     @property
     def token_factory(self) -> TokenTypeFactory:
         return self._token_factory
 
-    def add_token(self, ref_type: int, lexeme: str, line: int, column: int) -> None:
-        token_type = self.token_factory.factory(ref_type)
+    @property
+    def compact(self) -> bool:
+        return self._compact
+
+    @property
+    def source(self) -> LineIndex:
+        return self._source
+
+    def add_token(self, ref_type: int, lexeme: str, offset: int) -> None:
+        if not self._compact:
+            self.token_list.append(self.build_token(ref_type, lexeme, offset))
+            return
+
+        self._codes.append(ref_type)
+        self._offsets.append(offset)
+        self._lexeme_ids.append(self._intern(ref_type, lexeme))
+
+    def build_token(
+        self, ref_type: int, lexeme: str, offset: int, source: LineIndex | None = None
+    ) -> Token:
+        return Token(
+            ref_type,
+            self._convert_lexeme(ref_type, lexeme),
+            offset,
+            self._source if source is None else source,
+        )
+
+    @staticmethod
+    def _convert_lexeme(ref_type: int, lexeme: str):
+        if ref_type == KeyWords.FLOAT.code and lexeme != KeyWords.FLOAT.lexeme:
+            return float(lexeme)
+        if ref_type == KeyWords.INTEGER.code and lexeme != KeyWords.INTEGER.lexeme:
+            return int(lexeme)
+        return lexeme
+
+    def _intern(self, ref_type: int, lexeme: str) -> int:
+        # A lexeme's text always maps to the same token code, so its converted
+        # value can be shared by every occurrence.
+        lexeme_id = self._lexeme_ids_by_text.get(lexeme)
+        if lexeme_id is None:
+            lexeme_id = len(self._lexemes)
+            self._lexemes.append(self._convert_lexeme(ref_type, lexeme))
+            self._lexeme_ids_by_text[lexeme] = lexeme_id
+        return lexeme_id
+
+    def _token_at(self, index: int) -> Token:
+        last_index, last_token = self._last_view
+        if index == last_index:
+            return last_token
+
+        token = Token(
+            self._codes[index],
+            self._lexemes[self._lexeme_ids[index]],
+            self._offsets[index],
+            self._source,
+        )
+        self._last_view = (index, token)
+        return token
+
+    def line_range(self, first_line: int, last_line: int) -> tuple[int, int]:
+        """Returns the slice ``[start, end)`` of tokens on lines ``first_line..last_line``."""
+        first_offset = self._source.line_start(first_line)
+        end_offset = max(self._source.line_start(last_line + 1), first_offset)
+        if self._compact:
+            start = bisect_left(self._offsets, first_offset)
+            return start, bisect_left(self._offsets, end_offset, lo=start)
+
+        start = bisect_left(self.token_list, first_offset, key=_token_offset)
+        end = bisect_left(self.token_list, end_offset, lo=start, key=_token_offset)
+        return start, end
+
+    def splice(
+        self,
+        start: int,
+        end: int,
+        records: Iterable[tuple[int, str, int]],
+        offset_delta: int,
+    ) -> None:
+        """
+        Replaces tokens ``[start, end)`` with new ``(code, lexeme, offset)``
+        records and moves every token after them by ``offset_delta``
+        characters. ``source`` must already describe the edited text.
+        """
+        if not self._compact:
+            tokens = [self.build_token(*record) for record in records]
+            self.token_list[start:end] = tokens
+            if offset_delta:
+                for token in self.token_list[start + len(tokens):]:
+                    token.offset += offset_delta
+            return
+
+        records = list(records)
+        tail = start + len(records)
+        self._last_view = (-1, None)
+        self._codes[start:end] = array("i", (r[0] for r in records))
+        self._lexeme_ids[start:end] = array("i", (self._intern(r[0], r[1]) for r in records))
+        self._offsets[start:end] = array("q", (r[2] for r in records))
+        if offset_delta:
+            self._offsets[tail:] = array(
+                "q", (offset + offset_delta for offset in self._offsets[tail:])
+            )
+
+    def get_tokens(self) -> "list[Token] | CompactTokenList":
+        return self.token_list
+
+
+class CompactTokenList(Sequence):
+    """Read-only sequence of ``Token`` views over a compact ``TokenListTable``."""
+
+    def __init__(self, table: TokenListTable) -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table._codes)
 
-        if token_type == KeyWords.FLOAT.name and lexeme != KeyWords.FLOAT.value[1]:
-            lexeme = float(lexeme)
-        elif (
-            token_type == KeyWords.INTEGER.name and lexeme != KeyWords.INTEGER.value[1]
-        ):
-            lexeme = int(lexeme)
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._table._token_at(i) for i in range(*index.indices(len(self)))]
+        size = len(self._table._codes)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("token index out of range")
+        return self._table._token_at(index)
 
-        if token_type is None:
-            token_type = "IDENTIFIER"
+    def __iter__(self):
+        token_at = self._table._token_at
+        for index in range(len(self)):
+            yield token_at(index)
 
-        token = Token(token_type, lexeme, line, column)
+    def __repr__(self) -> str:
+        return repr(list(self))
 
-        self.token_list.append(token)
 
-    def get_tokens(self) -> list[Token]:
-        return self.token_list
\ No newline at end of file
+def _token_offset(token: Token) -> int:
+    return token.offset
@@ -1,10 +1,13 @@
 import sys
 
-from src.code_generator.gerador import CodeGenerator
 from src.lexical_analyzer.tokenizer import Tokenizer
 from src.lexical_analyzer.utils import TokenTypeFactory, TokenListTable, SymbolTable, Lexer
-from src.parser.parser import ParserLL1, pretty_print_ast_util
-from src.semantic_analyzer.semantico import analyze_program
+
+# Phases after lexing (parser, semantic analysis, code generation) are
+# imported where they are used, so ``--lex`` runs only pay for the lexer.
+
+LEX_ONLY_OPTION = "--lex"
+TABLE_PARSER_OPTION = "--ll1-table"
 
 
 class TurtleScriptCompiler:
@@ -13,7 +16,7 @@ class TurtleScriptCompiler:
         self.lexer_instance = Lexer()
         self.token_factory_instance = TokenTypeFactory(self.symbol_table_instance)
         self.token_list_instance = TokenListTable(self.token_factory_instance)
-        self.generator = CodeGenerator()
+        self._generator = None
 
         self.tokenizer = Tokenizer(
             lexer=self.lexer_instance,
@@ -22,13 +25,44 @@ class TurtleScriptCompiler:
             token_factory=self.token_factory_instance,
         )
 
-    def compile_script(self, path):
+    @property
+    def generator(self):
+        if self._generator is None:
+            from src.code_generator.gerador import CodeGenerator
+
+            self._generator = CodeGenerator()
+        return self._generator
+
+    def tokenize_script(self, path):
+        # One item per line, like pprint, without importing it (and the
+        # dataclasses/inspect modules it pulls in) at startup.
+        self.tokenizer.analise_line(path)
+        print("List<TokenList>: \n")
+        print("\n".join(map(repr, self.token_list_instance.get_tokens())))
+        print("\n")
+        print("List<SymbolsTable>: \n")
+        print("\n".join(map(repr, self.symbol_table_instance.get_symbols())))
+
+    def compile_script(self, path, table_driven=False):
+        from src.parser.parser import ParserLL1, pretty_print_ast_util
+        from src.semantic_analyzer.semantico import analyze_program
+
         self.tokenizer.analise_line(path)
         print("\n\nToken List:")
         print(self.token_list_instance.get_tokens())
-        parser = ParserLL1(self.token_list_instance.get_tokens())
+        if table_driven:
+            from src.parser.table_parser import TableParserLL1
+
+            parser = TableParserLL1(self.token_list_instance.get_tokens())
+        else:
+            parser = ParserLL1(self.token_list_instance.get_tokens(), recover=True)
         try:
             ast = parser.parse()
+            errors = getattr(parser, "errors", None)
+            if errors:
+                for error in errors:
+                    print(f"✗ Erro de sintaxe: {error}")
+                return None
             print("Árvore Sintática Abstrata (AST) gerada com sucesso:")
             print(ast)
 
@@ -47,13 +81,20 @@ class TurtleScriptCompiler:
 
 
 def main(args):
+    lex_only = LEX_ONLY_OPTION in args
+    table_driven = TABLE_PARSER_OPTION in args
+    args = [arg for arg in args if arg not in (LEX_ONLY_OPTION, TABLE_PARSER_OPTION)]
     if not args:
         raise ValueError("no input file")
     path = args[0]
 
     compiler = TurtleScriptCompiler()
 
-    generated_python_code = compiler.compile_script(path)
+    if lex_only:
+        compiler.tokenize_script(path)
+        return
+
+    generated_python_code = compiler.compile_script(path, table_driven)
 
     if generated_python_code:
         print("\n--- CÓDIGO PYTHON GERADO ---\n")
@@ -63,4 +104,4 @@ def main(args):
 
 
 if __name__ == "__main__":
-    main(sys.argv[1:])
\ No newline at end of file
+    main(sys.argv[1:])
@@ -0,0 +1,99 @@
+"""
+Semantic actions of ``TURTLESCRIPT_GRAMMAR``.
+
+Parsers run an action when they reach its ``@`` marker in a production. The
+action rewrites the top of the value stack, where the parser also pushes the
+tokens of ``VALUE_TERMINALS`` as it matches them.
+"""
+from src.lexical_analyzer.utils.token_class import KeyWords
+from src.semantic_analyzer.syntatic_tree import Assignment, BinaryExpression, Command, IfStatement, Literal, \
+    Program, RepeatLoop, VariableDeclaration, VariableReference, WhileLoop
+
+
+def _list(values: list) -> None:
+    values.append([])
+
+
+def _append(values: list) -> None:
+    item = values.pop()
+    values[-1].append(item)
+
+
+def _none(values: list) -> None:
+    values.append(None)
+
+
+def _program(values: list) -> None:
+    commands = values.pop()
+    values.append(Program(values.pop(), commands))
+
+
+def _declaration(values: list) -> None:
+    names = [token.lexeme for token in values.pop()]
+    values.append(VariableDeclaration(values.pop().lexeme, names))
+
+
+def _assignment(values: list) -> None:
+    expression = values.pop()
+    values.append(Assignment(values.pop().lexeme, expression))
+
+
+def _call(values: list) -> None:
+    args = values.pop()
+    values.append(Command(values.pop().lexeme, args))
+
+
+def _if(values: list) -> None:
+    false_branch = values.pop()
+    true_branch = values.pop()
+    values.append(IfStatement(values.pop(), true_branch, false_branch))
+
+
+def _while(values: list) -> None:
+    body = values.pop()
+    values.append(WhileLoop(values.pop(), body))
+
+
+def _repeat(values: list) -> None:
+    body = values.pop()
+    values.append(RepeatLoop(values.pop(), body))
+
+
+def _binary(values: list) -> None:
+    right = values.pop()
+    operator = values.pop().lexeme
+    values.append(BinaryExpression(values.pop(), operator, right))
+
+
+def _variable(values: list) -> None:
+    values.append(VariableReference(values.pop().lexeme))
+
+
+def _literal(values: list) -> None:
+    token = values.pop()
+    kind = token.kind
+    if kind == KeyWords.TEXT.code:
+        values.append(Literal(token.lexeme.strip('"'), KeyWords.TEXT.lexeme))
+    elif kind == KeyWords.BOOLEAN.code:
+        values.append(Literal(token.lexeme == 'verdadeiro', KeyWords.BOOLEAN.lexeme))
+    elif kind == KeyWords.FLOAT.code:
+        values.append(Literal(token.lexeme, KeyWords.FLOAT.lexeme))
+    else:
+        values.append(Literal(token.lexeme, KeyWords.INTEGER.lexeme))
+
+
+ACTIONS = {
+    '@list': _list,
+    '@append': _append,
+    '@none': _none,
+    '@program': _program,
+    '@declaration': _declaration,
+    '@assignment': _assignment,
+    '@call': _call,
+    '@if': _if,
+    '@while': _while,
+    '@repeat': _repeat,
+    '@binary': _binary,
+    '@variable': _variable,
+    '@literal': _literal,
+}
@@ -0,0 +1,210 @@
+"""
+A flat, arena-backed store for ``syntatic_tree`` nodes.
+
+A ``NodeArena`` keeps every node as one row of parallel typed arrays: its kind
+and up to three integer fields, which hold the index of a child node, of a
+string, of a literal value or of a list. Lists live in one more array, each
+as its length followed by its items. Strings and literal values are stored
+once. A node costs about 13 bytes plus 4 per list it belongs to, instead of a
+Python object with its own lists.
+
+``node(index)`` returns a view of a node: an instance of a subclass of its
+``syntatic_tree`` class whose fields are read from the arena on access, so
+``analyze_program`` and ``CodeGenerator`` walk views like any other AST. Views
+are read-only and made on demand; two views of the same node are equal but
+not identical.
+
+Fill an arena from an AST with ``add`` or straight from ``encode_ast``'s bytes
+with ``decode_ast(data, arena)``.
+"""
+from array import array
+
+from src.parser.ast_codec import decode_ast, encode_ast
+from src.semantic_analyzer.syntatic_tree import Assignment, BinaryExpression, Command, CommentNode, IfStatement, \
+    Literal, Program, RepeatLoop, VariableDeclaration, VariableReference, WhileLoop
+
+# Node kinds, the row index of each view class in ``_VIEWS``.
+_PROGRAM = 0
+_VARIABLE_DECLARATION = 1
+_BINARY_EXPRESSION = 2
+_ASSIGNMENT = 3
+_IF_STATEMENT = 4
+_WHILE_LOOP = 5
+_REPEAT_LOOP = 6
+_COMMAND = 7
+_LITERAL = 8
+_VARIABLE_REFERENCE = 9
+_COMMENT = 10
+
+# An IfStatement without 'senao' has this in place of its false branch.
+_NO_LIST = -1
+
+
+class NodeArena:
+
+    def __init__(self):
+        self.kinds = array('B')
+        self.first = array('i')
+        self.second = array('i')
+        self.third = array('i')
+        self.lists = array('i')
+        self.strings = []
+        self.constants = []
+        self._string_indexes = {}
+        self._constant_indexes = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def add(self, node):
+        """Copies ``node`` and everything under it into the arena; returns the view of the copy."""
+        return decode_ast(encode_ast(node), self)
+
+    def node(self, index: int):
+        """The view of node ``index``."""
+        view_class = _VIEWS[self.kinds[index]]
+        view = view_class.__new__(view_class)
+        view._arena = self
+        view._index = index
+        return view
+
+    # Constructors with the signatures of the node classes; each adds a node
+    # whose children are given as indexes and returns its own index.
+
+    def program(self, declarations: list[int], commands: list[int]) -> int:
+        return self._add(_PROGRAM, self._list(declarations), self._list(commands))
+
+    def variable_declaration(self, var_type: str | int | float, names: list[str]) -> int:
+        # The index of a string, or for a numeric type (``var 1 : lado;``
+        # parses) the complement of the index of a constant.
+        declared_type = self._string(var_type) if isinstance(var_type, str) else ~self._constant(var_type)
+        return self._add(_VARIABLE_DECLARATION, declared_type, self._list(map(self._string, names)))
+
+    def binary_expression(self, left: int, operator: str, right: int) -> int:
+        return self._add(_BINARY_EXPRESSION, left, self._string(operator), right)
+
+    def assignment(self, var_name: str, expression: int) -> int:
+        return self._add(_ASSIGNMENT, self._string(var_name), expression)
+
+    def if_statement(self, condition: int, true_branch: list[int], false_branch: list[int] = None) -> int:
+        false_list = _NO_LIST if false_branch is None else self._list(false_branch)
+        return self._add(_IF_STATEMENT, condition, self._list(true_branch), false_list)
+
+    def while_loop(self, condition: int, body: list[int]) -> int:
+        return self._add(_WHILE_LOOP, condition, self._list(body))
+
+    def repeat_loop(self, count: int, body: list[int]) -> int:
+        return self._add(_REPEAT_LOOP, count, self._list(body))
+
+    def command(self, name: str, args: list[int] = None) -> int:
+        return self._add(_COMMAND, self._string(name), self._list(args or ()))
+
+    def literal(self, value, type_: str) -> int:
+        return self._add(_LITERAL, self._constant(value), self._string(type_))
+
+    def variable_reference(self, name: str) -> int:
+        return self._add(_VARIABLE_REFERENCE, self._string(name))
+
+    def comment_node(self, text: str) -> int:
+        return self._add(_COMMENT, self._string(text))
+
+    def _add(self, kind: int, first: int, second: int = 0, third: int = 0) -> int:
+        self.kinds.append(kind)
+        self.first.append(first)
+        self.second.append(second)
+        self.third.append(third)
+        return len(self.kinds) - 1
+
+    def _string(self, text: str) -> int:
+        index = self._string_indexes.get(text)
+        if index is None:
+            index = self._string_indexes[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+    def _constant(self, value) -> int:
+        # True == 1, so the type is part of the key.
+        key = (type(value), value)
+        index = self._constant_indexes.get(key)
+        if index is None:
+            index = self._constant_indexes[key] = len(self.constants)
+            self.constants.append(value)
+        return index
+
+    def _list(self, items) -> int:
+        lists = self.lists
+        start = len(lists)
+        lists.append(0)
+        lists.extend(items)
+        lists[start] = len(lists) - start - 1
+        return start
+
+    def _nodes(self, start: int) -> list:
+        lists = self.lists
+        return [self.node(index) for index in lists[start + 1:start + 1 + lists[start]]]
+
+    def _optional_nodes(self, start: int) -> list | None:
+        return None if start == _NO_LIST else self._nodes(start)
+
+    def _strings(self, start: int) -> list[str]:
+        lists, strings = self.lists, self.strings
+        return [strings[index] for index in lists[start + 1:start + 1 + lists[start]]]
+
+
+class _View:
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if isinstance(other, _View):
+            return self._arena is other._arena and self._index == other._index
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._arena), self._index))
+
+
+def _field(column: str, load):
+    def get(view):
+        arena = view._arena
+        return load(arena, getattr(arena, column)[view._index])
+
+    return property(get)
+
+
+def _node(arena: NodeArena, index: int):
+    return arena.node(index)
+
+
+def _string(arena: NodeArena, index: int) -> str:
+    return arena.strings[index]
+
+
+def _constant(arena: NodeArena, index: int):
+    return arena.constants[index]
+
+
+def _declared_type(arena: NodeArena, index: int):
+    return arena.strings[index] if index >= 0 else arena.constants[~index]
+
+
+def _view(node_class: type, **fields) -> type:
+    namespace = {'__slots__': ('_arena', '_index')}
+    for name, (column, load) in fields.items():
+        namespace[name] = _field(column, load)
+    return type(node_class.__name__ + 'View', (_View, node_class), namespace)
+
+
+_VIEWS = (
+    _view(Program, declarations=('first', NodeArena._nodes), commands=('second', NodeArena._nodes)),
+    _view(VariableDeclaration, var_type=('first', _declared_type), names=('second', NodeArena._strings)),
+    _view(BinaryExpression, left=('first', _node), operator=('second', _string), right=('third', _node)),
+    _view(Assignment, var_name=('first', _string), expression=('second', _node)),
+    _view(IfStatement, condition=('first', _node), true_branch=('second', NodeArena._nodes),
+          false_branch=('third', NodeArena._optional_nodes)),
+    _view(WhileLoop, condition=('first', _node), body=('second', NodeArena._nodes)),
+    _view(RepeatLoop, count=('first', _node), body=('second', NodeArena._nodes)),
+    _view(Command, name=('first', _string), args=('second', NodeArena._nodes)),
+    _view(Literal, value=('first', _constant), type_=('second', _string)),
+    _view(VariableReference, name=('first', _string)),
+    _view(CommentNode, text=('first', _string)),
+)
@@ -0,0 +1,315 @@
+"""
+A compact, versioned binary encoding of the ``syntatic_tree`` nodes, so parsed
+programs can be cached on disk or handed to other tools without lexing and
+parsing the source again.
+
+Layout, with every count and index an unsigned LEB128 varint:
+
+* the magic ``b"TSAST"`` and ``FORMAT_VERSION``;
+* the string table: its length, then each string as its UTF-8 byte length and
+  bytes. Names, operators, types and text literals are stored once there and
+  referred to by index;
+* the nodes in post-order, each a one-byte tag followed by its fields. Child
+  nodes come before their parent, which only records how many of them belong
+  to each of its lists, so the loader rebuilds the tree with a value stack
+  (like ``TableParserLL1``) and no recursion, however deep the program nests.
+
+Integer literals are zigzag varints and float literals little-endian doubles.
+A declaration whose type is a number (``var 1 : lado;`` parses) stores it the
+same way, in place of the index of its type.
+"""
+import struct
+from types import SimpleNamespace
+
+from src.semantic_analyzer.syntatic_tree import Assignment, BinaryExpression, Command, CommentNode, IfStatement, \
+    Literal, Program, RepeatLoop, VariableDeclaration, VariableReference, WhileLoop
+
+FORMAT_VERSION = 1
+
+_MAGIC = b"TSAST"
+
+# Node tags.
+_PROGRAM = 0
+_VARIABLE_DECLARATION = 1
+_BINARY_EXPRESSION = 2
+_ASSIGNMENT = 3
+_IF_STATEMENT = 4
+_WHILE_LOOP = 5
+_REPEAT_LOOP = 6
+_COMMAND = 7
+_VARIABLE_REFERENCE = 8
+_COMMENT = 9
+# Literals: the index of their type, then the value unless the tag holds it.
+_INTEGER = 10
+_FLOAT = 11
+_TEXT = 12
+_TRUE = 13
+_FALSE = 14
+# Declarations of a numeric type: the number of names, the type like an
+# integer or float literal's value, then the names.
+_INTEGER_TYPED_DECLARATION = 15
+_FLOAT_TYPED_DECLARATION = 16
+
+_DOUBLE = struct.Struct("<d")
+
+# What ``decode_ast`` builds nodes with; a ``NodeArena`` has the same methods.
+_NODE_CLASSES = SimpleNamespace(
+    program=Program, variable_declaration=VariableDeclaration, binary_expression=BinaryExpression,
+    assignment=Assignment, if_statement=IfStatement, while_loop=WhileLoop, repeat_loop=RepeatLoop,
+    command=Command, literal=Literal, variable_reference=VariableReference, comment_node=CommentNode,
+)
+_ENCODABLE = frozenset(vars(_NODE_CLASSES).values())
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    """Reads the varint at ``position``; returns it and the position after it."""
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_ast(node) -> bytes:
+    """Encodes ``node``, usually a ``Program``, and everything under it."""
+    strings = {}
+
+    def index(text: str) -> int:
+        found = strings.get(text)
+        if found is None:
+            found = strings[text] = len(strings)
+        return found
+
+    # Visiting each node before its children, right to left, and reversing
+    # the records gives post-order.
+    records = []
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        record = bytearray()
+        kind = type(node)
+        if kind not in _ENCODABLE:
+            # Subclasses, like arena views, are encoded as the node they extend.
+            kind = next((base for base in kind.__mro__ if base in _ENCODABLE), kind)
+        if kind is Command:
+            record.append(_COMMAND)
+            _write_varint(record, index(node.name))
+            _write_varint(record, len(node.args))
+            pending.extend(node.args)
+        elif kind is Literal:
+            value = node.value
+            if value is True or value is False:
+                record.append(_TRUE if value else _FALSE)
+                _write_varint(record, index(node.type_))
+            elif type(value) is int:
+                record.append(_INTEGER)
+                _write_varint(record, index(node.type_))
+                _write_varint(record, value << 1 if value >= 0 else (-value << 1) - 1)
+            elif type(value) is float:
+                record.append(_FLOAT)
+                _write_varint(record, index(node.type_))
+                record += _DOUBLE.pack(value)
+            elif type(value) is str:
+                record.append(_TEXT)
+                _write_varint(record, index(node.type_))
+                _write_varint(record, index(value))
+            else:
+                raise TypeError(f"cannot encode literal value of type {type(value).__name__}")
+        elif kind is VariableReference:
+            record.append(_VARIABLE_REFERENCE)
+            _write_varint(record, index(node.name))
+        elif kind is BinaryExpression:
+            record.append(_BINARY_EXPRESSION)
+            _write_varint(record, index(node.operator))
+            pending.append(node.left)
+            pending.append(node.right)
+        elif kind is Assignment:
+            record.append(_ASSIGNMENT)
+            _write_varint(record, index(node.var_name))
+            pending.append(node.expression)
+        elif kind is RepeatLoop or kind is WhileLoop:
+            head = node.count if kind is RepeatLoop else node.condition
+            record.append(_REPEAT_LOOP if kind is RepeatLoop else _WHILE_LOOP)
+            _write_varint(record, len(node.body))
+            pending.append(head)
+            pending.extend(node.body)
+        elif kind is IfStatement:
+            record.append(_IF_STATEMENT)
+            _write_varint(record, len(node.true_branch))
+            # 0 for no 'senao', else one more than its length.
+            false_branch = node.false_branch
+            _write_varint(record, 0 if false_branch is None else len(false_branch) + 1)
+            pending.append(node.condition)
+            pending.extend(node.true_branch)
+            if false_branch is not None:
+                pending.extend(false_branch)
+        elif kind is VariableDeclaration:
+            var_type = node.var_type
+            if type(var_type) is int:
+                record.append(_INTEGER_TYPED_DECLARATION)
+                _write_varint(record, len(node.names))
+                _write_varint(record, var_type << 1 if var_type >= 0 else (-var_type << 1) - 1)
+            elif type(var_type) is float:
+                record.append(_FLOAT_TYPED_DECLARATION)
+                _write_varint(record, len(node.names))
+                record += _DOUBLE.pack(var_type)
+            else:
+                record.append(_VARIABLE_DECLARATION)
+                _write_varint(record, index(var_type))
+                _write_varint(record, len(node.names))
+            for name in node.names:
+                _write_varint(record, index(name))
+        elif kind is Program:
+            record.append(_PROGRAM)
+            _write_varint(record, len(node.declarations))
+            _write_varint(record, len(node.commands))
+            pending.extend(node.declarations)
+            pending.extend(node.commands)
+        elif kind is CommentNode:
+            record.append(_COMMENT)
+            _write_varint(record, index(node.text))
+        else:
+            raise TypeError(f"cannot encode AST node of type {kind.__name__}")
+        records.append(record)
+    records.reverse()
+
+    header = bytearray(_MAGIC)
+    _write_varint(header, FORMAT_VERSION)
+    _write_varint(header, len(strings))
+    for text in strings:
+        encoded = text.encode("utf-8")
+        _write_varint(header, len(encoded))
+        header += encoded
+    records.insert(0, header)
+    return b"".join(records)
+
+
+def decode_ast(data: bytes, arena=None):
+    """
+    Rebuilds the node encoded by ``encode_ast``; raises ``ValueError`` on
+    malformed data. With a ``NodeArena``, the nodes are added to ``arena``
+    and the view of the root is returned.
+    """
+    if data[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("not an encoded TurtleScript AST")
+    try:
+        if arena is None:
+            return _decode(data, _NODE_CLASSES)
+        return arena.node(_decode(data, arena))
+    except (IndexError, struct.error, UnicodeDecodeError) as error:
+        raise ValueError(f"malformed encoded AST: {error}") from None
+
+
+def _decode(data: bytes, nodes):
+    version, position = _read_varint(data, len(_MAGIC))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported encoded AST version {version}, expected {FORMAT_VERSION}")
+    count, position = _read_varint(data, position)
+    strings = []
+    for _ in range(count):
+        length, position = _read_varint(data, position)
+        end = position + length
+        if end > len(data):
+            raise IndexError("string table runs past the end of the data")
+        strings.append(data[position:end].decode("utf-8"))
+        position = end
+
+    program, variable_declaration, binary_expression = nodes.program, nodes.variable_declaration, \
+        nodes.binary_expression
+    assignment, if_statement, while_loop, repeat_loop = nodes.assignment, nodes.if_statement, nodes.while_loop, \
+        nodes.repeat_loop
+    command, literal, variable_reference, comment_node = nodes.command, nodes.literal, nodes.variable_reference, \
+        nodes.comment_node
+
+    # Every record starts with a tag and a varint operand; most operands are
+    # below 0x80, so their byte is read inline.
+    values = []
+    end = len(data)
+    while position < end:
+        tag = data[position]
+        operand = data[position + 1]
+        position += 2
+        if operand >= 0x80:
+            operand, position = _read_varint(data, position - 1)
+
+        if tag == _VARIABLE_REFERENCE:
+            values.append(variable_reference(strings[operand]))
+        elif tag == _INTEGER:
+            value, position = _read_varint(data, position)
+            values.append(literal((value >> 1) ^ -(value & 1), strings[operand]))
+        elif tag == _TEXT:
+            value, position = _read_varint(data, position)
+            values.append(literal(strings[value], strings[operand]))
+        elif tag == _TRUE or tag == _FALSE:
+            values.append(literal(tag == _TRUE, strings[operand]))
+        elif tag == _FLOAT:
+            (value,) = _DOUBLE.unpack_from(data, position)
+            position += _DOUBLE.size
+            values.append(literal(value, strings[operand]))
+        elif tag == _BINARY_EXPRESSION:
+            right = values.pop()
+            values[-1] = binary_expression(values[-1], strings[operand], right)
+        elif tag == _COMMAND:
+            count, position = _read_varint(data, position)
+            values.append(command(strings[operand], _pop(values, count)))
+        elif tag == _ASSIGNMENT:
+            values[-1] = assignment(strings[operand], values[-1])
+        elif tag == _REPEAT_LOOP or tag == _WHILE_LOOP:
+            body = _pop(values, operand)
+            values[-1] = (repeat_loop if tag == _REPEAT_LOOP else while_loop)(values[-1], body)
+        elif tag == _IF_STATEMENT:
+            false_count, position = _read_varint(data, position)
+            false_branch = _pop(values, false_count - 1) if false_count else None
+            true_branch = _pop(values, operand)
+            values[-1] = if_statement(values[-1], true_branch, false_branch)
+        elif tag == _VARIABLE_DECLARATION:
+            count, position = _read_varint(data, position)
+            names = []
+            for _ in range(count):
+                name, position = _read_varint(data, position)
+                names.append(strings[name])
+            values.append(variable_declaration(strings[operand], names))
+        elif tag == _INTEGER_TYPED_DECLARATION or tag == _FLOAT_TYPED_DECLARATION:
+            if tag == _INTEGER_TYPED_DECLARATION:
+                value, position = _read_varint(data, position)
+                var_type = (value >> 1) ^ -(value & 1)
+            else:
+                (var_type,) = _DOUBLE.unpack_from(data, position)
+                position += _DOUBLE.size
+            names = []
+            for _ in range(operand):
+                name, position = _read_varint(data, position)
+                names.append(strings[name])
+            values.append(variable_declaration(var_type, names))
+        elif tag == _PROGRAM:
+            count, position = _read_varint(data, position)
+            commands = _pop(values, count)
+            values.append(program(_pop(values, operand), commands))
+        elif tag == _COMMENT:
+            values.append(comment_node(strings[operand]))
+        else:
+            raise ValueError(f"unknown AST node tag {tag} at byte {position - 2}")
+
+    if position != end or len(values) != 1:
+        raise ValueError("encoded AST does not hold exactly one root node")
+    return values[0]
+
+
+def _pop(values: list, count: int) -> list:
+    """Removes and returns the last ``count`` values."""
+    if count > len(values):
+        raise IndexError("a node has fewer children than it records")
+    start = len(values) - count
+    items = values[start:]
+    del values[start:]
+    return items
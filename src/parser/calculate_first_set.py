@@ -1,4 +1,7 @@
-from typing import List, Set, Dict
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Set
+
+from src.parser.numbered_grammar import NumberedGrammar
 
 
 def calculate_first_set_for_sequence(sequence: List[str], grammar_rules: Dict,
@@ -9,6 +12,8 @@ def calculate_first_set_for_sequence(sequence: List[str], grammar_rules: Dict,
     result = set()
 
     for symbol in sequence:
+        if symbol == '#':
+            continue
         if symbol in terminal_symbols:
             result.add(symbol)
             break
@@ -22,32 +27,21 @@ def calculate_first_set_for_sequence(sequence: List[str], grammar_rules: Dict,
 
     return result
 
-def calculate_first_sets(grammar_rules: Dict, terminal_symbols: Set[str]) -> Dict:
-    """Calcula os conjuntos FIRST para todos os símbolos."""
-    first_sets = {}
-
-    for terminal in terminal_symbols:
-        first_sets[terminal] = {terminal}
-
-    for non_terminal in grammar_rules:
-        first_sets[non_terminal] = set()
-
-    changed = True
-    while changed:
-        changed = False
-        for lhs, productions in grammar_rules.items():
-            for production in productions:
-                if not production or production == ['#']:
-                    if '#' not in first_sets[lhs]:
-                        first_sets[lhs].add('#')
-                        changed = True
-                else:
-                    old_size = len(first_sets[lhs])
-                    prod_first = calculate_first_set_for_sequence(production, grammar_rules, terminal_symbols,
-                                                                  first_sets)
-                    first_sets[lhs].update(prod_first)
-                    if len(first_sets[lhs]) > old_size:
-                        changed = True
-
-    return first_sets
 
+def nullable_non_terminals(grammar_rules: Dict, non_terminals: Iterable[str]) -> Set[str]:
+    """Non-terminals that derive the empty string."""
+    grammar = NumberedGrammar(grammar_rules, non_terminals)
+    return {name for name, nullable in zip(grammar.non_terminals, grammar.nullable()) if nullable}
+
+
+def compute_all_first_sets_for_grammar(grammar_rules: Dict, non_terminals: Set[str],
+                                       terminal_symbols: Set[str]) -> Mapping:
+    """FIRST of every terminal, non-terminal and of ``'#'`` itself."""
+    grammar = NumberedGrammar(grammar_rules, non_terminals, terminal_symbols)
+    return grammar.first_view(grammar.first_masks(), with_epsilon=True)
+
+
+def calculate_first_sets(grammar_rules: Dict, terminal_symbols: Set[str]) -> Mapping:
+    """Calcula os conjuntos FIRST para todos os símbolos."""
+    grammar = NumberedGrammar(grammar_rules, (), terminal_symbols)
+    return grammar.first_view(grammar.first_masks())
@@ -1,35 +1,23 @@
-from typing import Dict
+from collections.abc import Mapping
+from typing import Dict, Iterable
 
-from src.parser.calculate_first_set import calculate_first_set_for_sequence
+from src.parser.numbered_grammar import NumberedGrammar, SymbolSets
 
 
-def calculate_follow_sets(grammar_rules: Dict, start_symbol: str, first_sets: Dict) -> Dict:
-    follow_sets = {nt: set() for nt in grammar_rules}
-    follow_sets[start_symbol].add('$')
+def compute_all_follows(start_symbol: str, grammar_rules: Dict, non_terminals: Iterable[str],
+                        first_sets: Dict) -> Mapping:
+    """FOLLOW of every non-terminal, given the FIRST sets of the grammar."""
+    if (isinstance(first_sets, SymbolSets) and first_sets.grammar.grammar_rules is grammar_rules
+            and all(name in first_sets.masks for name in non_terminals)):
+        # FIRST sets computed for this very grammar: reuse its numbering
+        # instead of decoding and re-encoding every set.
+        grammar = first_sets.grammar
+        first = [first_sets.masks[non_terminal] for non_terminal in grammar.non_terminals]
+    else:
+        grammar = NumberedGrammar(grammar_rules, non_terminals)
+        first = [grammar.mask(first_sets.get(non_terminal, ())) for non_terminal in grammar.non_terminals]
+    return grammar.follow_view(grammar.follow_masks(start_symbol, first))
 
-    changed = True
-    while changed:
-        changed = False
-        for lhs, productions in grammar_rules.items():
-            for production in productions:
-                for i, symbol in enumerate(production):
-                    if symbol in grammar_rules:
-                        rest = production[i + 1:]
-                        if rest:
-                            first_rest = calculate_first_set_for_sequence(rest, grammar_rules,
-                                                                          set(first_sets.keys()) - set(
-                                                                              grammar_rules.keys()),
-                                                                          first_sets)
-                            old_size = len(follow_sets[symbol])
-                            follow_sets[symbol].update(first_rest - {'#'})
-                            if '#' in first_rest:
-                                follow_sets[symbol].update(follow_sets[lhs])
-                            if len(follow_sets[symbol]) > old_size:
-                                changed = True
-                        else:
-                            old_size = len(follow_sets[symbol])
-                            follow_sets[symbol].update(follow_sets[lhs])
-                            if len(follow_sets[symbol]) > old_size:
-                                changed = True
 
-    return follow_sets
+def calculate_follow_sets(grammar_rules: Dict, start_symbol: str, first_sets: Dict) -> Mapping:
+    return compute_all_follows(start_symbol, grammar_rules, grammar_rules, first_sets)
@@ -0,0 +1,48 @@
+def propagate_inclusions(masks: list[int], includes: list[list[int]]) -> None:
+    """
+    ORs into every ``masks[x]`` the masks of all the nodes that ``x``
+    includes, directly or transitively through ``includes``.
+
+    This is DeRemer and Pennello's digraph algorithm: a depth-first walk that
+    finds the strongly connected components (Tarjan) and merges every mask
+    once per edge, children before parents; all members of a cycle end with
+    the same mask. The walk keeps its own stack, so deep grammars do not hit
+    the recursion limit.
+    """
+    count = len(masks)
+    finished = count + 1
+    depth = [0] * count
+    stack = []
+
+    for root in range(count):
+        if depth[root]:
+            continue
+        stack.append(root)
+        depth[root] = len(stack)
+        work = [(root, len(stack), iter(includes[root]))]
+
+        while work:
+            node, position, children = work[-1]
+            for child in children:
+                if not depth[child]:
+                    stack.append(child)
+                    depth[child] = len(stack)
+                    work.append((child, len(stack), iter(includes[child])))
+                    break
+                if depth[child] < depth[node]:
+                    depth[node] = depth[child]
+                masks[node] |= masks[child]
+            else:
+                work.pop()
+                if depth[node] == position:
+                    while True:
+                        member = stack.pop()
+                        depth[member] = finished
+                        if member == node:
+                            break
+                        masks[member] = masks[node]
+                if work:
+                    parent = work[-1][0]
+                    if depth[node] < depth[parent]:
+                        depth[parent] = depth[node]
+                    masks[parent] |= masks[node]
@@ -0,0 +1,493 @@
+# Generated by src/parser/parser_generator.py from TURTLESCRIPT_GRAMMAR; do not edit.
+# Regenerate with: python -m src.parser.parser_generator
+from src.parser.actions import ACTIONS
+from src.parser.parser import unexpected_token
+
+_action_list = ACTIONS['@list']
+_action_program = ACTIONS['@program']
+_action_append = ACTIONS['@append']
+_action_declaration = ACTIONS['@declaration']
+_action_assignment = ACTIONS['@assignment']
+_action_call = ACTIONS['@call']
+_action_if = ACTIONS['@if']
+_action_none = ACTIONS['@none']
+_action_while = ACTIONS['@while']
+_action_repeat = ACTIONS['@repeat']
+_action_binary = ACTIONS['@binary']
+_action_variable = ACTIONS['@variable']
+_action_literal = ACTIONS['@literal']
+
+_END_COLUMN = 37
+_IDENTIFIER_COLUMN = 4
+_FIRST_IDENTIFIER_CODE = 38
+_KIND_COLUMNS = (-1, 6, 8, 9, 7, 2, 16, 17, 18, 19, 20, 21, 22, 23, 25, 24, 0, 1, 3, 5, -1, 12, 14, 15, -1, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 13, 36, -1)
+_LITERAL_COLUMNS = {1: (int, 10), 4: (float, 11)}
+
+_LOOKAHEAD_0 = frozenset((1, 4, 16, 20, 23))
+_LOOKAHEAD_1 = frozenset((4, 16, 20, 23))
+_LOOKAHEAD_2 = frozenset((1, 18, 19, 22, 25))
+_LOOKAHEAD_3 = frozenset((4, 5, 8, 9, 10, 11, 14))
+_LOOKAHEAD_4 = frozenset((4, 8, 9, 10, 11))
+_LOOKAHEAD_5 = frozenset((4, 8, 9, 10, 11, 14))
+_LOOKAHEAD_6 = frozenset((5, 12, 15, 17, 21, 24, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36))
+_LOOKAHEAD_7 = frozenset((26, 27, 28, 29, 30, 31))
+_LOOKAHEAD_8 = frozenset((5, 12, 15, 17, 21, 24))
+_LOOKAHEAD_9 = frozenset((32, 33))
+_LOOKAHEAD_10 = frozenset((5, 12, 15, 17, 21, 24, 26, 27, 28, 29, 30, 31))
+_LOOKAHEAD_11 = frozenset((34, 35, 36))
+_LOOKAHEAD_12 = frozenset((5, 12, 15, 17, 21, 24, 26, 27, 28, 29, 30, 31, 32, 33))
+
+
+def _column(token):
+    kind = token.kind
+    if kind >= _FIRST_IDENTIFIER_CODE:
+        return _IDENTIFIER_COLUMN
+    literal = _LITERAL_COLUMNS.get(kind)
+    if literal is not None and isinstance(token.lexeme, literal[0]):
+        return literal[1]
+    return _KIND_COLUMNS[kind]
+
+
+def _unexpected(tokens, position, expected):
+    return unexpected_token(expected, tokens[position] if position < len(tokens) else None)
+
+
+def _parse_Program(tokens, columns, values, position):
+    if columns[position] != 0:
+        raise _unexpected(tokens, position, ('START',))
+    position += 1
+    _action_list(values)
+    position = _parse_Declarations(tokens, columns, values, position)
+    _action_list(values)
+    position = _parse_Commands(tokens, columns, values, position)
+    if columns[position] != 1:
+        raise _unexpected(tokens, position, ('END',))
+    position += 1
+    _action_program(values)
+    return position
+
+
+def _parse_Declarations(tokens, columns, values, position):
+    while True:
+        column = columns[position]
+        if column == 2:
+            position = _parse_Declaration(tokens, columns, values, position)
+            _action_append(values)
+            continue
+        if column in _LOOKAHEAD_0:
+            return position
+        raise _unexpected(tokens, position, ('END', 'VAR', 'IDENTIFIER', 'IF', 'WHILE', 'REPEAT'))
+
+
+def _parse_Declaration(tokens, columns, values, position):
+    if columns[position] != 2:
+        raise _unexpected(tokens, position, ('VAR',))
+    position += 1
+    position = _parse_Type(tokens, columns, values, position)
+    if columns[position] != 3:
+        raise _unexpected(tokens, position, ('COLON',))
+    position += 1
+    _action_list(values)
+    if columns[position] != 4:
+        raise _unexpected(tokens, position, ('IDENTIFIER',))
+    values.append(tokens[position])
+    position += 1
+    _action_append(values)
+    position = _parse_MoreNames(tokens, columns, values, position)
+    if columns[position] != 5:
+        raise _unexpected(tokens, position, ('SEMICOLON',))
+    position += 1
+    _action_declaration(values)
+    return position
+
+
+def _parse_Type(tokens, columns, values, position):
+    column = columns[position]
+    if column == 6:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 7:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 8:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 9:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 10:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 11:
+        values.append(tokens[position])
+        position += 1
+        return position
+    raise _unexpected(tokens, position, ('INTEGER', 'FLOAT', 'TEXT', 'BOOLEAN'))
+
+
+def _parse_MoreNames(tokens, columns, values, position):
+    while True:
+        column = columns[position]
+        if column == 12:
+            position += 1
+            if columns[position] != 4:
+                raise _unexpected(tokens, position, ('IDENTIFIER',))
+            values.append(tokens[position])
+            position += 1
+            _action_append(values)
+            continue
+        if column == 5:
+            return position
+        raise _unexpected(tokens, position, ('SEMICOLON', 'COMMA'))
+
+
+def _parse_Commands(tokens, columns, values, position):
+    while True:
+        column = columns[position]
+        if column in _LOOKAHEAD_1:
+            position = _parse_Command(tokens, columns, values, position)
+            _action_append(values)
+            continue
+        if column in _LOOKAHEAD_2:
+            return position
+        raise _unexpected(tokens, position, ('END', 'IDENTIFIER', 'IF', 'END_IF', 'ELSE', 'WHILE', 'END_WHILE', 'REPEAT', 'END_REPEAT'))
+
+
+def _parse_Command(tokens, columns, values, position):
+    column = columns[position]
+    if column == 4:
+        values.append(tokens[position])
+        position += 1
+        return _parse_CommandTail(tokens, columns, values, position)
+    if column == 16:
+        return _parse_IfStatement(tokens, columns, values, position)
+    if column == 20:
+        return _parse_WhileLoop(tokens, columns, values, position)
+    if column == 23:
+        return _parse_RepeatLoop(tokens, columns, values, position)
+    raise _unexpected(tokens, position, ('IDENTIFIER', 'IF', 'WHILE', 'REPEAT'))
+
+
+def _parse_CommandTail(tokens, columns, values, position):
+    column = columns[position]
+    if column == 13:
+        position += 1
+        position = _parse_Expression(tokens, columns, values, position)
+        if columns[position] != 5:
+            raise _unexpected(tokens, position, ('SEMICOLON',))
+        position += 1
+        _action_assignment(values)
+        return position
+    if column in _LOOKAHEAD_3:
+        _action_list(values)
+        position = _parse_Arguments(tokens, columns, values, position)
+        if columns[position] != 5:
+            raise _unexpected(tokens, position, ('SEMICOLON',))
+        position += 1
+        _action_call(values)
+        return position
+    raise _unexpected(tokens, position, ('IDENTIFIER', 'SEMICOLON', 'TEXT', 'BOOLEAN', 'INTEGER_LITERAL', 'FLOAT_LITERAL', 'ASSIGN', 'LEFT_PAR'))
+
+
+def _parse_Arguments(tokens, columns, values, position):
+    column = columns[position]
+    if column == 14:
+        position += 1
+        position = _parse_ArgumentList(tokens, columns, values, position)
+        if columns[position] != 15:
+            raise _unexpected(tokens, position, ('RIGHT_PAR',))
+        position += 1
+        return position
+    if column in _LOOKAHEAD_4:
+        position = _parse_Argument(tokens, columns, values, position)
+        _action_append(values)
+        return position
+    if column == 5:
+        return position
+    raise _unexpected(tokens, position, ('IDENTIFIER', 'SEMICOLON', 'TEXT', 'BOOLEAN', 'INTEGER_LITERAL', 'FLOAT_LITERAL', 'LEFT_PAR'))
+
+
+def _parse_ArgumentList(tokens, columns, values, position):
+    column = columns[position]
+    if column in _LOOKAHEAD_5:
+        position = _parse_Expression(tokens, columns, values, position)
+        _action_append(values)
+        return _parse_MoreArguments(tokens, columns, values, position)
+    if column == 15:
+        return position
+    raise _unexpected(tokens, position, ('IDENTIFIER', 'TEXT', 'BOOLEAN', 'INTEGER_LITERAL', 'FLOAT_LITERAL', 'LEFT_PAR', 'RIGHT_PAR'))
+
+
+def _parse_MoreArguments(tokens, columns, values, position):
+    while True:
+        column = columns[position]
+        if column == 12:
+            position += 1
+            position = _parse_Expression(tokens, columns, values, position)
+            _action_append(values)
+            continue
+        if column == 15:
+            return position
+        raise _unexpected(tokens, position, ('COMMA', 'RIGHT_PAR'))
+
+
+def _parse_IfStatement(tokens, columns, values, position):
+    if columns[position] != 16:
+        raise _unexpected(tokens, position, ('IF',))
+    position += 1
+    position = _parse_Expression(tokens, columns, values, position)
+    if columns[position] != 17:
+        raise _unexpected(tokens, position, ('THEN',))
+    position += 1
+    _action_list(values)
+    position = _parse_Commands(tokens, columns, values, position)
+    position = _parse_ElseBranch(tokens, columns, values, position)
+    if columns[position] != 18:
+        raise _unexpected(tokens, position, ('END_IF',))
+    position += 1
+    if columns[position] != 5:
+        raise _unexpected(tokens, position, ('SEMICOLON',))
+    position += 1
+    _action_if(values)
+    return position
+
+
+def _parse_ElseBranch(tokens, columns, values, position):
+    column = columns[position]
+    if column == 19:
+        position += 1
+        _action_list(values)
+        return _parse_Commands(tokens, columns, values, position)
+    if column == 18:
+        _action_none(values)
+        return position
+    raise _unexpected(tokens, position, ('END_IF', 'ELSE'))
+
+
+def _parse_WhileLoop(tokens, columns, values, position):
+    if columns[position] != 20:
+        raise _unexpected(tokens, position, ('WHILE',))
+    position += 1
+    position = _parse_Expression(tokens, columns, values, position)
+    if columns[position] != 21:
+        raise _unexpected(tokens, position, ('DO',))
+    position += 1
+    _action_list(values)
+    position = _parse_Commands(tokens, columns, values, position)
+    if columns[position] != 22:
+        raise _unexpected(tokens, position, ('END_WHILE',))
+    position += 1
+    if columns[position] != 5:
+        raise _unexpected(tokens, position, ('SEMICOLON',))
+    position += 1
+    _action_while(values)
+    return position
+
+
+def _parse_RepeatLoop(tokens, columns, values, position):
+    if columns[position] != 23:
+        raise _unexpected(tokens, position, ('REPEAT',))
+    position += 1
+    position = _parse_Expression(tokens, columns, values, position)
+    if columns[position] != 24:
+        raise _unexpected(tokens, position, ('TIMES',))
+    position += 1
+    _action_list(values)
+    position = _parse_Commands(tokens, columns, values, position)
+    if columns[position] != 25:
+        raise _unexpected(tokens, position, ('END_REPEAT',))
+    position += 1
+    if columns[position] != 5:
+        raise _unexpected(tokens, position, ('SEMICOLON',))
+    position += 1
+    _action_repeat(values)
+    return position
+
+
+def _parse_Expression(tokens, columns, values, position):
+    position = _parse_Primary(tokens, columns, values, position)
+    return _parse_ExpressionTail(tokens, columns, values, position)
+
+
+def _parse_Argument(tokens, columns, values, position):
+    position = _parse_Value(tokens, columns, values, position)
+    return _parse_ExpressionTail(tokens, columns, values, position)
+
+
+def _parse_ExpressionTail(tokens, columns, values, position):
+    position = _parse_Factors(tokens, columns, values, position)
+    position = _parse_Terms(tokens, columns, values, position)
+    return _parse_Comparisons(tokens, columns, values, position)
+
+
+def _parse_Comparisons(tokens, columns, values, position):
+    while True:
+        column = columns[position]
+        if column in _LOOKAHEAD_7:
+            position = _parse_ComparisonOperator(tokens, columns, values, position)
+            position = _parse_Sum(tokens, columns, values, position)
+            _action_binary(values)
+            continue
+        if column in _LOOKAHEAD_8:
+            return position
+        raise _unexpected(tokens, position, ('SEMICOLON', 'COMMA', 'RIGHT_PAR', 'THEN', 'DO', 'TIMES', 'EQUAL', 'NOT_EQUAL', 'LESS_THAN', 'LESS_EQUAL', 'GREATER_THAN', 'GREATER_EQUAL'))
+
+
+def _parse_Sum(tokens, columns, values, position):
+    position = _parse_Product(tokens, columns, values, position)
+    return _parse_Terms(tokens, columns, values, position)
+
+
+def _parse_Terms(tokens, columns, values, position):
+    while True:
+        column = columns[position]
+        if column in _LOOKAHEAD_9:
+            position = _parse_AdditionOperator(tokens, columns, values, position)
+            position = _parse_Product(tokens, columns, values, position)
+            _action_binary(values)
+            continue
+        if column in _LOOKAHEAD_10:
+            return position
+        raise _unexpected(tokens, position, ('SEMICOLON', 'COMMA', 'RIGHT_PAR', 'THEN', 'DO', 'TIMES', 'EQUAL', 'NOT_EQUAL', 'LESS_THAN', 'LESS_EQUAL', 'GREATER_THAN', 'GREATER_EQUAL', 'PLUS', 'MINUS'))
+
+
+def _parse_Product(tokens, columns, values, position):
+    position = _parse_Primary(tokens, columns, values, position)
+    return _parse_Factors(tokens, columns, values, position)
+
+
+def _parse_Factors(tokens, columns, values, position):
+    while True:
+        column = columns[position]
+        if column in _LOOKAHEAD_11:
+            position = _parse_MultiplicationOperator(tokens, columns, values, position)
+            position = _parse_Primary(tokens, columns, values, position)
+            _action_binary(values)
+            continue
+        if column in _LOOKAHEAD_12:
+            return position
+        raise _unexpected(tokens, position, ('SEMICOLON', 'COMMA', 'RIGHT_PAR', 'THEN', 'DO', 'TIMES', 'EQUAL', 'NOT_EQUAL', 'LESS_THAN', 'LESS_EQUAL', 'GREATER_THAN', 'GREATER_EQUAL', 'PLUS', 'MINUS', 'MULTIPLICATION', 'DIVISIVE', 'PERCENTAGE'))
+
+
+def _parse_Primary(tokens, columns, values, position):
+    column = columns[position]
+    if column == 14:
+        position += 1
+        position = _parse_Expression(tokens, columns, values, position)
+        if columns[position] != 15:
+            raise _unexpected(tokens, position, ('RIGHT_PAR',))
+        position += 1
+        return position
+    if column in _LOOKAHEAD_4:
+        return _parse_Value(tokens, columns, values, position)
+    raise _unexpected(tokens, position, ('IDENTIFIER', 'TEXT', 'BOOLEAN', 'INTEGER_LITERAL', 'FLOAT_LITERAL', 'LEFT_PAR'))
+
+
+def _parse_Value(tokens, columns, values, position):
+    column = columns[position]
+    if column == 4:
+        values.append(tokens[position])
+        position += 1
+        _action_variable(values)
+        return position
+    if column == 10:
+        values.append(tokens[position])
+        position += 1
+        _action_literal(values)
+        return position
+    if column == 11:
+        values.append(tokens[position])
+        position += 1
+        _action_literal(values)
+        return position
+    if column == 8:
+        values.append(tokens[position])
+        position += 1
+        _action_literal(values)
+        return position
+    if column == 9:
+        values.append(tokens[position])
+        position += 1
+        _action_literal(values)
+        return position
+    raise _unexpected(tokens, position, ('IDENTIFIER', 'TEXT', 'BOOLEAN', 'INTEGER_LITERAL', 'FLOAT_LITERAL'))
+
+
+def _parse_ComparisonOperator(tokens, columns, values, position):
+    column = columns[position]
+    if column == 26:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 27:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 28:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 29:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 30:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 31:
+        values.append(tokens[position])
+        position += 1
+        return position
+    raise _unexpected(tokens, position, ('EQUAL', 'NOT_EQUAL', 'LESS_THAN', 'LESS_EQUAL', 'GREATER_THAN', 'GREATER_EQUAL'))
+
+
+def _parse_AdditionOperator(tokens, columns, values, position):
+    column = columns[position]
+    if column == 32:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 33:
+        values.append(tokens[position])
+        position += 1
+        return position
+    raise _unexpected(tokens, position, ('PLUS', 'MINUS'))
+
+
+def _parse_MultiplicationOperator(tokens, columns, values, position):
+    column = columns[position]
+    if column == 34:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 35:
+        values.append(tokens[position])
+        position += 1
+        return position
+    if column == 36:
+        values.append(tokens[position])
+        position += 1
+        return position
+    raise _unexpected(tokens, position, ('MULTIPLICATION', 'DIVISIVE', 'PERCENTAGE'))
+
+
+class GeneratedParserLL1:
+    """Recursive-descent parser generated from the LL(1) grammar; builds the same AST as ParserLL1."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.current = 0
+
+    def parse(self):
+        tokens = self.tokens
+        columns = [_column(token) for token in tokens]
+        columns.append(_END_COLUMN)
+        values = []
+        self.current = _parse_Program(tokens, columns, values, self.current)
+        return values.pop()
@@ -0,0 +1,131 @@
+"""
+Declarative LL(1) grammar of TurtleScript.
+
+Productions are lists of symbols in the format used by the grammar utilities
+(``calculate_first_sets``, ``left_factoring_concise``...): non-terminals are
+the keys of ``TURTLESCRIPT_GRAMMAR``, ``'#'`` is the empty string and every
+other name is a terminal, i.e. a token name (``token_name``) or one of
+``LITERAL_TERMINALS``.
+
+Symbols starting with ``@`` are semantic actions. They derive nothing, so they
+are dropped before FIRST/FOLLOW are computed; the table-driven parser runs
+them when they are popped, to build the ``Program`` AST on its value stack.
+"""
+from src.lexical_analyzer.utils.token_class import TOKEN_NAMES, KeyWords
+
+EPSILON = '#'
+END_OF_INPUT = '$'
+ACTION_PREFIX = '@'
+
+START_SYMBOL = 'Program'
+
+# Numbers share their token code with the type keywords; the lexeme tells them
+# apart (the token list already converted literals to int/float).
+LITERAL_TERMINALS = {
+    'INTEGER_LITERAL': (KeyWords.INTEGER.code, int),
+    'FLOAT_LITERAL': (KeyWords.FLOAT.code, float),
+}
+
+# Terminals whose token is pushed onto the value stack when matched; the
+# actions consume them. Keywords and delimiters only drive the parse.
+VALUE_TERMINALS = frozenset((
+    'IDENTIFIER', 'INTEGER_LITERAL', 'FLOAT_LITERAL',
+    'INTEGER', 'FLOAT', 'TEXT', 'BOOLEAN',
+    'EQUAL', 'NOT_EQUAL', 'LESS_THAN', 'LESS_EQUAL', 'GREATER_THAN', 'GREATER_EQUAL',
+    'PLUS', 'MINUS', 'MULTIPLICATION', 'DIVISIVE', 'PERCENTAGE',
+))
+
+TURTLESCRIPT_GRAMMAR = {
+    'Program': [['START', '@list', 'Declarations', '@list', 'Commands', 'END', '@program']],
+    'Declarations': [['Declaration', '@append', 'Declarations'], ['#']],
+    'Declaration': [
+        ['VAR', 'Type', 'COLON', '@list', 'IDENTIFIER', '@append', 'MoreNames', 'SEMICOLON', '@declaration'],
+    ],
+    # ParserLL1 only checks the token code here, so a number in place of the
+    # type keyword is accepted like the keyword sharing its code.
+    'Type': [['INTEGER'], ['FLOAT'], ['TEXT'], ['BOOLEAN'], ['INTEGER_LITERAL'], ['FLOAT_LITERAL']],
+    'MoreNames': [['COMMA', 'IDENTIFIER', '@append', 'MoreNames'], ['#']],
+
+    'Commands': [['Command', '@append', 'Commands'], ['#']],
+    'Command': [['IDENTIFIER', 'CommandTail'], ['IfStatement'], ['WhileLoop'], ['RepeatLoop']],
+    'CommandTail': [
+        ['ASSIGN', 'Expression', 'SEMICOLON', '@assignment'],
+        ['@list', 'Arguments', 'SEMICOLON', '@call'],
+    ],
+    # A '(' right after the function name always opens an argument list, so a
+    # single unparenthesized argument cannot start with '(' (see Argument).
+    'Arguments': [['LEFT_PAR', 'ArgumentList', 'RIGHT_PAR'], ['Argument', '@append'], ['#']],
+    'ArgumentList': [['Expression', '@append', 'MoreArguments'], ['#']],
+    'MoreArguments': [['COMMA', 'Expression', '@append', 'MoreArguments'], ['#']],
+    'IfStatement': [
+        ['IF', 'Expression', 'THEN', '@list', 'Commands', 'ElseBranch', 'END_IF', 'SEMICOLON', '@if'],
+    ],
+    'ElseBranch': [['ELSE', '@list', 'Commands'], ['@none']],
+    'WhileLoop': [['WHILE', 'Expression', 'DO', '@list', 'Commands', 'END_WHILE', 'SEMICOLON', '@while']],
+    'RepeatLoop': [['REPEAT', 'Expression', 'TIMES', '@list', 'Commands', 'END_REPEAT', 'SEMICOLON', '@repeat']],
+
+    # Comparison -> Sum (op Sum)*, Sum -> Product (op Product)*,
+    # Product -> Primary (op Primary)*, with the repetitions as right-recursive
+    # tails that fold the operands left-associatively with '@binary'.
+    'Expression': [['Primary', 'ExpressionTail']],
+    'Argument': [['Value', 'ExpressionTail']],
+    'ExpressionTail': [['Factors', 'Terms', 'Comparisons']],
+    'Comparisons': [['ComparisonOperator', 'Sum', '@binary', 'Comparisons'], ['#']],
+    'Sum': [['Product', 'Terms']],
+    'Terms': [['AdditionOperator', 'Product', '@binary', 'Terms'], ['#']],
+    'Product': [['Primary', 'Factors']],
+    'Factors': [['MultiplicationOperator', 'Primary', '@binary', 'Factors'], ['#']],
+    'Primary': [['LEFT_PAR', 'Expression', 'RIGHT_PAR'], ['Value']],
+    'Value': [
+        ['IDENTIFIER', '@variable'],
+        ['INTEGER_LITERAL', '@literal'],
+        ['FLOAT_LITERAL', '@literal'],
+        ['TEXT', '@literal'],
+        ['BOOLEAN', '@literal'],
+    ],
+    'ComparisonOperator': [
+        ['EQUAL'], ['NOT_EQUAL'], ['LESS_THAN'], ['LESS_EQUAL'], ['GREATER_THAN'], ['GREATER_EQUAL'],
+    ],
+    'AdditionOperator': [['PLUS'], ['MINUS']],
+    'MultiplicationOperator': [['MULTIPLICATION'], ['DIVISIVE'], ['PERCENTAGE']],
+}
+
+
+def is_action(symbol: str) -> bool:
+    return symbol.startswith(ACTION_PREFIX)
+
+
+def without_actions(grammar_rules: dict) -> dict:
+    """Copy of ``grammar_rules`` with the actions removed; emptied productions become ``['#']``."""
+    return {
+        non_terminal: [
+            [symbol for symbol in production if not is_action(symbol)] or [EPSILON]
+            for production in productions
+        ]
+        for non_terminal, productions in grammar_rules.items()
+    }
+
+
+def reported_terminals(terminals) -> tuple[str, ...]:
+    """
+    The names to put in a syntax error for the expected ``terminals``: a
+    literal terminal expected along with the token name it shares its code
+    with is left out, since then every token of that code is accepted and
+    the message reads like ``ParserLL1``'s.
+    """
+    terminals = tuple(terminals)
+    return tuple(
+        terminal for terminal in terminals
+        if terminal not in LITERAL_TERMINALS or TOKEN_NAMES[LITERAL_TERMINALS[terminal][0]] not in terminals
+    )
+
+
+def grammar_terminals(grammar_rules: dict) -> list[str]:
+    """Terminals of ``grammar_rules`` in order of first appearance."""
+    terminals = {}
+    for productions in grammar_rules.values():
+        for production in productions:
+            for symbol in production:
+                if symbol not in grammar_rules and symbol != EPSILON and not is_action(symbol):
+                    terminals.setdefault(symbol)
+    return list(terminals)
@@ -0,0 +1,215 @@
+"""
+Incremental reparsing of ``Program`` ASTs after an edit of the token stream.
+
+``parse_program`` keeps, next to the AST, how many tokens every command spans.
+Commands in a block body or in the program are contiguous and always end with
+';', so a run of them can be parsed on its own and spliced back.
+``reparse_program`` reparses the commands an edit touches in the innermost
+body that contains it. It falls back to the whole enclosing block, and
+eventually the whole program, when the edit changes the block structure. Every
+node outside the reparsed region is reused by identity. Only the blocks on the
+path to the edit are copied, so the old AST is never mutated.
+"""
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+from src.lexical_analyzer.utils.token import Token
+from src.parser.parser import ParserLL1
+from src.semantic_analyzer.syntatic_tree import IfStatement, Program, RepeatLoop, WhileLoop
+
+# Every block ends with its 'fim_*' keyword and ';'.
+_BLOCK_END_LENGTH = 2
+
+
+class _MeasuringParser(ParserLL1):
+    """``ParserLL1`` that records how many tokens each command spans."""
+
+    def __init__(self, tokens: list[Token], lengths: dict):
+        super().__init__(tokens)
+        self.lengths = lengths
+
+    def parse_command(self):
+        start = self.current
+        command = super().parse_command()
+        self.lengths[command] = self.current - start
+        return command
+
+
+class ParsedProgram:
+    """
+    A ``Program``, the tokens it was parsed from, and the token length of each
+    command. ``bounds`` holds the token index where each top-level command
+    starts, followed by the index of the closing 'fim'.
+    """
+
+    def __init__(self, program: Program, tokens: list[Token], lengths: dict, bounds: list[int]):
+        self.program = program
+        self.tokens = tokens
+        self.lengths = lengths
+        self.bounds = bounds
+
+
+def parse_program(tokens: list[Token]) -> ParsedProgram:
+    """Parses ``tokens`` from scratch, keeping what ``reparse_program`` needs."""
+    lengths = {}
+    parser = _MeasuringParser(tokens, lengths)
+    program = parser.parse()
+    lengths[program] = parser.current
+    commands_start = parser.current - 1 - sum(map(lengths.__getitem__, program.commands))
+    return ParsedProgram(program, tokens, lengths,
+                         list(accumulate(map(lengths.__getitem__, program.commands), initial=commands_start)))
+
+
+def _bodies(node, start: int, length: int, lengths: dict) -> list[tuple[str, int, int]]:
+    """The ``(attribute, start, end)`` token ranges of the command lists of block ``node``."""
+    if isinstance(node, IfStatement):
+        true_length = sum(map(lengths.__getitem__, node.true_branch))
+        if node.false_branch is None:
+            body_start = start + length - _BLOCK_END_LENGTH - true_length
+            return [('true_branch', body_start, body_start + true_length)]
+        false_length = sum(map(lengths.__getitem__, node.false_branch))
+        false_start = start + length - _BLOCK_END_LENGTH - false_length
+        # 'senao' sits between the two branches.
+        true_start = false_start - 1 - true_length
+        return [('true_branch', true_start, true_start + true_length),
+                ('false_branch', false_start, false_start + false_length)]
+    if isinstance(node, (WhileLoop, RepeatLoop)):
+        body_length = sum(map(lengths.__getitem__, node.body))
+        body_start = start + length - _BLOCK_END_LENGTH - body_length
+        return [('body', body_start, body_start + body_length)]
+    return []
+
+
+def _replace(node, attribute: str, commands: list):
+    """A copy of ``node`` with its command list ``attribute`` replaced."""
+    if isinstance(node, Program):
+        return Program(node.declarations, commands)
+    if isinstance(node, IfStatement):
+        if attribute == 'true_branch':
+            return IfStatement(node.condition, commands, node.false_branch)
+        return IfStatement(node.condition, node.true_branch, commands)
+    if isinstance(node, WhileLoop):
+        return WhileLoop(node.condition, commands)
+    return RepeatLoop(node.count, commands)
+
+
+def _parse_commands(tokens: list[Token], start: int, end: int) -> tuple[list, dict] | None:
+    """Parses ``tokens[start:end]`` as a run of commands, or returns None if they are not exactly that."""
+    lengths = {}
+    parser = _MeasuringParser(tokens, lengths)
+    parser.current = start
+    commands = []
+    try:
+        while parser.current < end:
+            commands.append(parser.parse_command())
+    except SyntaxError:
+        return None
+    if parser.current != end:
+        return None
+    return commands, lengths
+
+
+def reparse_program(previous: ParsedProgram, tokens: list[Token], start: int, old_end: int,
+                    new_end: int) -> ParsedProgram:
+    """
+    Parses ``tokens``, which are ``previous.tokens`` with ``[start, old_end)``
+    replaced by ``tokens[start:new_end]``. The AST is the same as
+    ``parse_program(tokens)`` would build, and syntax errors are the ones it
+    would raise.
+
+    The result shares its length table with ``previous``, so ``previous``
+    cannot be reparsed again afterwards; that raises ``ValueError``.
+    """
+    lengths = previous.lengths
+    program = previous.program
+    if program not in lengths:
+        raise ValueError("this parse was already superseded by reparse_program")
+    delta = new_end - old_end
+    if not (previous.bounds[0] <= start and old_end <= previous.bounds[-1]):
+        return parse_program(tokens)
+
+    # The command lists around the edit, outermost first, as
+    # [node, attribute, commands, command boundaries, index of the inner block].
+    path = []
+    node, attribute, commands, bounds = program, 'commands', program.commands, previous.bounds
+    while True:
+        path.append([node, attribute, commands, bounds, None])
+        first, last = _touched(bounds, start, old_end)
+        if first != last:
+            break
+        # A single command is touched: go into the body of a block that holds the whole edit.
+        inner = [
+            (name, body_start)
+            for name, body_start, body_end in _bodies(commands[first], bounds[first], lengths[commands[first]],
+                                                      lengths)
+            if body_start <= start and old_end <= body_end
+        ]
+        if not inner:
+            break
+        path[-1][4] = first
+        node = commands[first]
+        attribute, list_start = inner[0]
+        commands = getattr(node, attribute)
+        bounds = list(accumulate(map(lengths.__getitem__, commands), initial=list_start))
+
+    # Reparse the touched commands; if the edit does not parse as commands
+    # there, reparse the whole enclosing block one level up instead.
+    region_start, region_end = start, old_end
+    while True:
+        node, attribute, commands, bounds, _ = path[-1]
+        first, last = _touched(bounds, region_start, region_end)
+        if first <= last:
+            region_start, region_end = min(region_start, bounds[first]), max(region_end, bounds[last + 1])
+        parsed = _parse_commands(tokens, region_start, region_end + delta)
+        if parsed is not None:
+            break
+        path.pop()
+        if not path:
+            return parse_program(tokens)
+        block = path[-1][4]
+        region_start, region_end = path[-1][3][block], path[-1][3][block + 1]
+
+    new_commands, new_lengths = parsed
+    lengths.update(new_lengths)
+    for removed in commands[first:last + 1]:
+        _forget(removed, lengths)
+
+    # Copy the blocks on the path, innermost first, around the new commands.
+    replacement = commands[:first] + new_commands + commands[max(first, last + 1):]
+    if len(path) == 1:
+        new_bounds = bounds[:first] + list(accumulate(map(lengths.__getitem__, new_commands), initial=region_start))
+        following = bounds[max(first, last + 1) + 1:]
+    else:
+        block = path[0][4]
+        new_bounds = path[0][3][:block + 1]
+        following = path[0][3][block + 1:]
+    new_bounds += [bound + delta for bound in following] if delta else following
+
+    while path:
+        node, attribute, _, _, _ = path.pop()
+        copy = _replace(node, attribute, replacement)
+        lengths[copy] = lengths.pop(node) + delta
+        if path:
+            commands, block = path[-1][2], path[-1][4]
+            replacement = commands[:block] + [copy] + commands[block + 1:]
+    return ParsedProgram(copy, tokens, lengths, new_bounds)
+
+
+def _touched(bounds: list[int], start: int, end: int) -> tuple[int, int]:
+    """
+    The first and last index of the commands (between ``bounds``) that overlap
+    ``[start, end)``; ``last < first`` for an insertion between two commands.
+    """
+    first = bisect_right(bounds, start) - 1
+    last = min(bisect_left(bounds, end), len(bounds) - 1) - 1
+    return first, last
+
+
+def _forget(node, lengths: dict) -> None:
+    """Drops the lengths of ``node`` and every command nested in it."""
+    pending = [node]
+    while pending:
+        node = pending.pop()
+        lengths.pop(node, None)
+        for attribute in ('true_branch', 'false_branch', 'body'):
+            pending.extend(getattr(node, attribute, None) or ())
@@ -1,3 +1,6 @@
+from collections import deque
+
+
 def left_factoring_concise(grammar_rules_dict):
     """
     Applies left factoring to grammar rules to remove common prefixes.
@@ -50,4 +53,85 @@ def left_factoring_concise(grammar_rules_dict):
 
     factored_grammar.update(newly_generated_rules_temp)
 
-    return factored_grammar
\ No newline at end of file
+    return factored_grammar
+
+def left_factoring(grammar_rules_dict):
+    """
+    Left factors the grammar completely: afterwards no two alternatives of a
+    non-terminal start with the same symbol.
+
+    The productions of each non-terminal are inserted into a prefix trie.
+    Every trie node with more than one way to continue (several next symbols,
+    or a next symbol and the end of a production) becomes a new non-terminal,
+    and the chains of single-child nodes between them become the longest
+    common prefixes. Nested common prefixes are factored in the same pass, so
+    the result is already the fixed point of repeated factoring. The running
+    time is linear in the total length of the productions.
+
+    Args:
+        grammar_rules_dict (dict): A dictionary where keys are non-terminals (LHS)
+                                   and values are lists of their productions (RHS).
+                                   Example: {'A': [['a', 'b', 'c'], ['a', 'b', 'd'], ['a', 'x']]}
+
+    Returns:
+        dict: The factored grammar; generated non-terminals follow the original ones.
+              Empty alternatives are written as ['#'].
+              Example: {'A': [['a', "A'"]], "A'": [['b', "A'1"], ['x']], "A'1": [['c'], ['d']]}
+    """
+    factored_grammar = {}
+    newly_generated_rules = {}
+    taken_names = set(grammar_rules_dict)
+
+    for current_non_terminal, productions in grammar_rules_dict.items():
+        # A key of None marks the end of a production.
+        trie = {}
+        for production_sequence in productions:
+            node = trie
+            for symbol in production_sequence:
+                if symbol != '#':
+                    node = node.setdefault(symbol, {})
+            node[None] = None
+
+        generated = 0
+        pending = deque([(current_non_terminal, trie)])
+        while pending:
+            name, node = pending.popleft()
+            alternatives = []
+            for symbol, child in node.items():
+                if symbol is None:
+                    alternatives.append(['#'])
+                    continue
+
+                prefix = [symbol]
+                while len(child) == 1 and None not in child:
+                    (symbol, child), = child.items()
+                    prefix.append(symbol)
+
+                if len(child) == 1:
+                    alternatives.append(prefix)
+                    continue
+
+                # A', then A'1, A'2...: the counter only moves forward, so
+                # each candidate name is built and checked once.
+                generated_non_terminal = _generated_name(current_non_terminal, generated)
+                generated += 1
+                while generated_non_terminal in taken_names:
+                    generated_non_terminal = _generated_name(current_non_terminal, generated)
+                    generated += 1
+                taken_names.add(generated_non_terminal)
+
+                alternatives.append(prefix + [generated_non_terminal])
+                pending.append((generated_non_terminal, child))
+
+            if name == current_non_terminal:
+                factored_grammar[name] = alternatives
+            else:
+                newly_generated_rules[name] = alternatives
+
+    factored_grammar.update(newly_generated_rules)
+    return factored_grammar
+
+
+def _generated_name(non_terminal: str, number: int) -> str:
+    """Name of the ``number``-th non-terminal factored out of ``non_terminal``: A', A'1, A'2..."""
+    return f"{non_terminal}'" if number == 0 else f"{non_terminal}'{number}"
@@ -0,0 +1,224 @@
+from collections.abc import Iterable, Iterator, Mapping
+
+from src.parser.digraph import propagate_inclusions
+
+EPSILON_BIT = 1
+END_BIT = 2
+
+
+class NumberedGrammar:
+    """
+    Grammar whose symbols are numbered so that sets of terminals are int
+    bitmasks.
+
+    Bit 0 stands for ``'#'`` (a FIRST mask with it is nullable), bit 1 for
+    ``'$'`` and the other bits for the terminals. Non-terminals are indexes
+    into the per-non-terminal mask lists; in encoded productions they are
+    ``>= 0`` and terminal ``b`` (bit ``1 << b``) is ``~b``.
+    """
+
+    def __init__(self, grammar_rules: dict, non_terminals: Iterable[str] = (),
+                 terminal_symbols: Iterable[str] = ()) -> None:
+        self.grammar_rules = grammar_rules
+        self.non_terminals = list(dict.fromkeys([*grammar_rules, *sorted(non_terminals)]))
+        self.non_terminal_index = {name: index for index, name in enumerate(self.non_terminals)}
+        self.terminals = ['#', '$']
+        self.terminal_position = {'#': 0, '$': 1}
+        for terminal in sorted(terminal_symbols):
+            self._position(terminal)
+
+        self.productions = []
+        self.alternatives = [[] for _ in self.non_terminals]
+        for lhs, productions in grammar_rules.items():
+            lhs_index = self.non_terminal_index[lhs]
+            for production in productions:
+                self.alternatives[lhs_index].append(len(self.productions))
+                self.productions.append((lhs_index, tuple(
+                    self._encode(symbol) for symbol in production if symbol != '#'
+                )))
+
+    def _position(self, terminal: str) -> int:
+        position = self.terminal_position.get(terminal)
+        if position is None:
+            position = self.terminal_position[terminal] = len(self.terminals)
+            self.terminals.append(terminal)
+        return position
+
+    def _encode(self, symbol: str) -> int:
+        index = self.non_terminal_index.get(symbol)
+        return index if index is not None else ~self._position(symbol)
+
+    def mask(self, terminals: Iterable[str]) -> int:
+        """Bitmask of ``terminals``; unknown names get new bits."""
+        mask = 0
+        for terminal in terminals:
+            mask |= 1 << self._position(terminal)
+        return mask
+
+    def symbols(self, mask: int) -> set[str]:
+        terminals = self.terminals
+        return {terminals[position] for position, bit in enumerate(bin(mask)[:1:-1]) if bit == '1'}
+
+    def nullable(self) -> list[bool]:
+        """
+        Whether each non-terminal derives the empty string.
+
+        Every production counts its symbols not yet known to be nullable;
+        when a non-terminal becomes nullable only the productions that use it
+        are updated, so the grammar is traversed a constant number of times.
+        """
+        nullable = [False] * len(self.non_terminals)
+        pending = []
+        remaining = []
+        uses = [[] for _ in self.non_terminals]
+
+        for index, (lhs, body) in enumerate(self.productions):
+            remaining.append(len(body))
+            if any(symbol < 0 for symbol in body):
+                continue
+            if not body and not nullable[lhs]:
+                nullable[lhs] = True
+                pending.append(lhs)
+            for symbol in body:
+                uses[symbol].append(index)
+
+        while pending:
+            for index in uses[pending.pop()]:
+                remaining[index] -= 1
+                lhs = self.productions[index][0]
+                if not remaining[index] and not nullable[lhs]:
+                    nullable[lhs] = True
+                    pending.append(lhs)
+        return nullable
+
+    def first_masks(self) -> list[int]:
+        """
+        FIRST of every non-terminal: the terminals that start its productions
+        directly, plus the FIRST of every non-terminal that begins one of them
+        after a nullable prefix.
+        """
+        nullable = self.nullable()
+        first = [0] * len(self.non_terminals)
+        includes = [[] for _ in self.non_terminals]
+
+        for lhs, body in self.productions:
+            for symbol in body:
+                if symbol < 0:
+                    first[lhs] |= 1 << ~symbol
+                    break
+                if symbol != lhs:
+                    includes[lhs].append(symbol)
+                if not nullable[symbol]:
+                    break
+
+        propagate_inclusions(first, includes)
+        return [mask | EPSILON_BIT if nullable[index] else mask for index, mask in enumerate(first)]
+
+    def follow_masks(self, start_symbol: str, first: list[int]) -> list[int]:
+        """
+        FOLLOW of every non-terminal, given their FIRST masks.
+
+        Each production is walked once from right to left carrying the FIRST
+        of the suffix after the current symbol. A non-terminal that ends a
+        production (up to a nullable suffix) includes the FOLLOW of its left
+        side; ``propagate_inclusions`` closes those.
+        """
+        follow = [0] * len(self.non_terminals)
+        includes = [[] for _ in self.non_terminals]
+        start = self.non_terminal_index.get(start_symbol)
+        if start is not None:
+            follow[start] = END_BIT
+
+        for lhs, body in self.productions:
+            suffix = 0
+            suffix_nullable = True
+            for symbol in reversed(body):
+                if symbol < 0:
+                    suffix = 1 << ~symbol
+                    suffix_nullable = False
+                    continue
+                follow[symbol] |= suffix
+                if suffix_nullable and symbol != lhs:
+                    includes[symbol].append(lhs)
+                symbol_first = first[symbol]
+                if symbol_first & EPSILON_BIT:
+                    suffix |= symbol_first ^ EPSILON_BIT
+                else:
+                    suffix = symbol_first
+                    suffix_nullable = False
+
+        propagate_inclusions(follow, includes)
+        return follow
+
+    def sequence_first(self, body: tuple[int, ...], first: list[int]) -> int:
+        mask = 0
+        for symbol in body:
+            if symbol < 0:
+                return mask | 1 << ~symbol
+            mask |= first[symbol] & ~EPSILON_BIT
+            if not first[symbol] & EPSILON_BIT:
+                return mask
+        return mask | EPSILON_BIT
+
+    def predict_masks(self, first: list[int], follow: list[int]) -> list[int]:
+        """Terminals (and ``'$'``) on which an LL(1) parser picks each production."""
+        predict = []
+        for lhs, body in self.productions:
+            mask = self.sequence_first(body, first)
+            if mask & EPSILON_BIT:
+                mask = mask ^ EPSILON_BIT | follow[lhs]
+            predict.append(mask)
+        return predict
+
+    def conflicts(self, predict: list[int]) -> Iterator[tuple[str, int]]:
+        """Yields ``(non_terminal, mask)`` for the lookaheads shared by its alternatives."""
+        for lhs, alternatives in enumerate(self.alternatives):
+            seen = 0
+            shared = 0
+            for production in alternatives:
+                shared |= seen & predict[production]
+                seen |= predict[production]
+            if shared:
+                yield self.non_terminals[lhs], shared
+
+    def first_view(self, first: list[int], with_terminals: bool = True,
+                   with_epsilon: bool = False) -> "SymbolSets":
+        """FIRST sets as a read-only ``{symbol: set}`` mapping."""
+        masks = {}
+        if with_terminals:
+            masks.update((terminal, 1 << position) for terminal, position in self.terminal_position.items()
+                         if position > 1)
+        if with_epsilon:
+            masks['#'] = EPSILON_BIT
+        masks.update(zip(self.non_terminals, first))
+        return SymbolSets(self, masks)
+
+    def follow_view(self, follow: list[int]) -> "SymbolSets":
+        return SymbolSets(self, dict(zip(self.non_terminals, follow)))
+
+
+class SymbolSets(Mapping):
+    """
+    Read-only ``{symbol: set of terminals}`` view of masks; each set is
+    decoded the first time it is looked up.
+    """
+
+    def __init__(self, grammar: NumberedGrammar, masks: dict[str, int]) -> None:
+        self.grammar = grammar
+        self.masks = masks
+        self._decoded = {}
+
+    def __getitem__(self, symbol: str) -> set[str]:
+        decoded = self._decoded.get(symbol)
+        if decoded is None:
+            decoded = self._decoded[symbol] = self.grammar.symbols(self.masks[symbol])
+        return decoded
+
+    def __iter__(self):
+        return iter(self.masks)
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
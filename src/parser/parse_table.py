@@ -0,0 +1,85 @@
+from typing import Dict, Iterator, List, Set, Tuple
+
+from src.parser.calculate_first_set import calculate_first_set_for_sequence
+
+
+def predict_sets(grammar_rules: Dict, first_sets: Dict, follow_sets: Dict,
+                 terminal_symbols: Set[str]) -> Iterator[Tuple[str, List[str], Set[str]]]:
+    """
+    Yields ``(lhs, production, lookaheads)`` for every production: the
+    terminals (or ``'$'``) on which an LL(1) parser chooses it.
+    """
+    for lhs, productions in grammar_rules.items():
+        for production in productions:
+            if not production or production == ['#']:
+                first = {'#'}
+            else:
+                first = calculate_first_set_for_sequence(production, grammar_rules, terminal_symbols, first_sets)
+            lookaheads = first - {'#'}
+            if '#' in first:
+                lookaheads |= follow_sets.get(lhs, set())
+            yield lhs, production, lookaheads
+
+
+def create_ll1_parse_table(grammar_rules: Dict, first_sets: Dict, follow_sets: Dict,
+                           terminal_symbols: Set[str], non_terminals: Set[str]) -> Tuple[Dict, bool]:
+    """
+    Builds the LL(1) table as ``{non_terminal: {terminal: 'A->x y'}}`` with a
+    column for every terminal and ``'$'``; empty cells hold ``''``.
+
+    Conflicting productions are joined with ``' | '`` in the same cell and the
+    second value returned is ``False``.
+    """
+    columns = sorted(set(terminal_symbols) | {'$'})
+    parse_table = {nt: {terminal: '' for terminal in columns} for nt in sorted(non_terminals)}
+    is_ll1 = True
+
+    for lhs, production, lookaheads in predict_sets(grammar_rules, first_sets, follow_sets, terminal_symbols):
+        row = parse_table.get(lhs)
+        if row is None:
+            continue
+        entry = f"{lhs}->{' '.join(production) or '#'}"
+        for terminal in lookaheads:
+            if terminal not in row:
+                continue
+            if row[terminal]:
+                row[terminal] = f"{row[terminal]} | {entry}"
+                is_ll1 = False
+            else:
+                row[terminal] = entry
+
+    return parse_table, is_ll1
+
+
+def parse_ll1_string(parsing_table: Dict, is_ll1_grammar: bool, terminal_symbols: Set[str],
+                     non_terminals: Set[str], start_symbol: str, input_tokens: List[str]) -> str:
+    """Runs the table built by ``create_ll1_parse_table`` over a list of terminals."""
+    if not is_ll1_grammar:
+        return "\nErro: A gramática não é LL(1). Não é possível realizar o parsing."
+
+    tokens = list(input_tokens) + ['$']
+    position = 0
+    stack = ['$', start_symbol]
+
+    while stack:
+        top = stack.pop()
+        lookahead = tokens[position]
+
+        if top == '$':
+            if lookahead != '$':
+                return f"\nCadeia Inválida! Entrada restante a partir de '{lookahead}'."
+        elif top == '#':
+            continue
+        elif top in terminal_symbols:
+            if top != lookahead:
+                return f"\nCadeia Inválida! Esperado '{top}', encontrado '{lookahead}'."
+            position += 1
+        elif top in non_terminals:
+            rule = parsing_table.get(top, {}).get(lookahead, '')
+            if not rule:
+                return f"\nCadeia Inválida! Nenhuma regra encontrada na tabela de parsing para ({top}, {lookahead})."
+            stack.extend(reversed(rule.split('->', 1)[1].split()))
+        else:
+            return f"\nCadeia Inválida! Símbolo desconhecido na pilha: '{top}'."
+
+    return "\nCadeia Válida!"
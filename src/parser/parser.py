@@ -1,18 +1,108 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
 from enum import Enum
 
 from src.lexical_analyzer.utils import KeyWords, Delimiters, Operators
+from src.lexical_analyzer.utils.line_index import LineIndex
 from src.lexical_analyzer.utils.token import Token
+from src.lexical_analyzer.utils.token_class import FIRST_IDENTIFIER_CODE, token_name
+from src.parser.parse_table import create_ll1_parse_table, parse_ll1_string
 from src.semantic_analyzer.syntatic_tree import VariableDeclaration, Assignment, Command, RepeatLoop, WhileLoop, \
     IfStatement, VariableReference, Literal, BinaryExpression, CommentNode, Program
 
+_TYPE_KINDS = (KeyWords.INTEGER.code, KeyWords.FLOAT.code, KeyWords.TEXT.code, KeyWords.BOOLEAN.code)
+_INTEGER_KIND, _FLOAT_KIND, _TEXT_KIND, _BOOLEAN_KIND = _TYPE_KINDS
+_INTEGER_TYPE, _FLOAT_TYPE, _TEXT_TYPE, _BOOLEAN_TYPE = (
+    KeyWords.INTEGER.lexeme, KeyWords.FLOAT.lexeme, KeyWords.TEXT.lexeme, KeyWords.BOOLEAN.lexeme)
+_LEFT_PAR_KIND = Delimiters.LEFT_PAR.code
+# Binary operators by token kind: (binding power, right associative, AST
+# operator). Operators of higher power bind tighter; all of them are left
+# associative today, so 'a - b - c' is '(a - b) - c' and 'a < b <= c' is
+# '(a < b) <= c'.
+_BINARY_OPERATORS = {
+    Operators.EQUAL.code: (1, False, Operators.EQUAL.lexeme),
+    Operators.NOT_EQUAL.code: (1, False, Operators.NOT_EQUAL.lexeme),
+    Operators.LESS_THAN.code: (1, False, Operators.LESS_THAN.lexeme),
+    Operators.LESS_EQUAL.code: (1, False, Operators.LESS_EQUAL.lexeme),
+    Operators.GREATER_THAN.code: (1, False, Operators.GREATER_THAN.lexeme),
+    Operators.GREATER_EQUAL.code: (1, False, Operators.GREATER_EQUAL.lexeme),
+    Operators.PLUS.code: (2, False, Operators.PLUS.lexeme),
+    Operators.MINUS.code: (2, False, Operators.MINUS.lexeme),
+    Operators.MULTIPLICATION.code: (3, False, Operators.MULTIPLICATION.lexeme),
+    Operators.DIVISIVE.code: (3, False, Operators.DIVISIVE.lexeme),
+    Operators.PERCENTAGE.code: (3, False, Operators.PERCENTAGE.lexeme),
+}
+_PROGRAM_END = frozenset((Delimiters.END.code,))
+# Tokens that end a block body; with recovery on, a body also stops at the
+# closer of any block still open, so a missing 'fim_*' is reported once by the
+# block that lacks it.
+_BLOCK_CLOSERS = frozenset((
+    KeyWords.ELSE.code, KeyWords.END_IF.code, KeyWords.END_WHILE.code, KeyWords.END_REPEAT.code, Delimiters.END.code,
+))
+# The keyword that closes the block each opening keyword starts.
+_BLOCK_CLOSER_OF = {
+    KeyWords.IF.code: KeyWords.END_IF.code,
+    KeyWords.WHILE.code: KeyWords.END_WHILE.code,
+    KeyWords.REPEAT.code: KeyWords.END_REPEAT.code,
+}
+_IF_BLOCK_END = frozenset((KeyWords.ELSE.code, KeyWords.END_IF.code))
+_ELSE_BLOCK_END = frozenset((KeyWords.END_IF.code,))
+_WHILE_BLOCK_END = frozenset((KeyWords.END_WHILE.code,))
+_REPEAT_BLOCK_END = frozenset((KeyWords.END_REPEAT.code,))
+
+
+def unexpected_token(expected_types: tuple[str, ...], token: Token | None) -> SyntaxError:
+    if not token:
+        return SyntaxError(f"Expected one of {expected_types}, but reached end of file.")
+    return SyntaxError(
+        f"Expected one of {expected_types}, got {token.token_type} ('{token.lexeme}') at line {token.line}, column {token.column}")
+
+
+_SYNCHRONIZING_KINDS: frozenset[int] | None = None
+
+
+def synchronizing_kinds() -> frozenset[int]:
+    """
+    Token kinds where panic-mode recovery resumes parsing: FOLLOW(Command) in
+    ``TURTLESCRIPT_GRAMMAR`` ('se', 'enquanto', 'repita', 'senao', 'fim' and
+    the 'fim_*' keywords). Identifiers are left out, since they also occur
+    inside commands. Computed on first use.
+    """
+    global _SYNCHRONIZING_KINDS
+    if _SYNCHRONIZING_KINDS is None:
+        from src.lexical_analyzer.utils.token_class import TOKEN_NAMES
+        from src.parser.calculate_first_set import calculate_first_sets
+        from src.parser.calculate_follow_set import calculate_follow_sets
+        from src.parser.grammar import START_SYMBOL, TURTLESCRIPT_GRAMMAR, grammar_terminals, without_actions
+
+        grammar = without_actions(TURTLESCRIPT_GRAMMAR)
+        first_sets = calculate_first_sets(grammar, set(grammar_terminals(grammar)))
+        follow = calculate_follow_sets(grammar, START_SYMBOL, first_sets)['Command']
+        _SYNCHRONIZING_KINDS = frozenset(
+            kind for kind, name in TOKEN_NAMES.items() if name in follow and name != 'IDENTIFIER'
+        )
+    return _SYNCHRONIZING_KINDS
+
+
 class ParserLL1:
-    def __init__(self, tokens: list[Token]):
+    def __init__(self, tokens: list[Token], recover: bool = False):
+        """
+        With ``recover``, syntax errors do not stop the parse: each one is
+        appended to ``errors`` and parsing resumes at the next ';' or
+        ``synchronizing_kinds()`` token, leaving the broken command out of
+        the AST.
+        """
         self.tokens = tokens
         self.current = 0
-
-    def peek(self) -> Token | None:
-        if self.current < len(self.tokens):
-            return self.tokens[self.current]
+        self.recover = recover
+        self.errors: list[SyntaxError] = []
+        # Closing keywords of the blocks being parsed, innermost last.
+        self.open_blocks: list[int] = []
+
+    def peek(self, ahead: int = 0) -> Token | None:
+        index = self.current + ahead
+        if index < len(self.tokens):
+            return self.tokens[index]
         return None
 
     def advance(self) -> Token | None:
@@ -22,54 +112,144 @@ class ParserLL1:
             return token
         return None
 
-    def expect(self, *expected_types: str) -> Token:
+    def expect(self, *expected_kinds: int) -> Token:
 
         token = self.peek()
-        if not token:
-            raise SyntaxError(f"Expected one of {expected_types}, but reached end of file.")
-        if token.token_type in expected_types:
+        if token and token.kind in expected_kinds:
             return self.advance()
-        else:
-            raise SyntaxError(
-                f"Expected one of {expected_types}, got {token.token_type} ('{token.lexeme}') at line {token.line}, column {token.column}")
+        raise self._unexpected(tuple(token_name(kind) for kind in expected_kinds), token)
 
-    def parse(self) -> Program:
+    def expect_identifier(self) -> Token:
 
-        self.expect(Delimiters.START.name)
-
-        declarations = []
-        while self.peek() and self.peek().token_type == KeyWords.VAR.name:
-            declarations.append(self.parse_variable_declaration())
+        token = self.peek()
+        if token and token.kind >= FIRST_IDENTIFIER_CODE:
+            return self.advance()
+        raise self._unexpected(('IDENTIFIER',), token)
+
+    @staticmethod
+    def _unexpected(expected_types: tuple[str, ...], token: Token | None) -> SyntaxError:
+        return unexpected_token(expected_types, token)
+
+    def expect_or_record(self, *expected_kinds: int) -> Token | None:
+        """``expect``, except that with recovery on a mismatch is recorded and nothing is consumed."""
+        try:
+            return self.expect(*expected_kinds)
+        except SyntaxError as error:
+            if not self.recover:
+                raise
+            self.errors.append(error)
+            return None
+
+    def synchronize(self, error: SyntaxError, start: int, depth: int) -> None:
+        """
+        Records ``error``, raised by a command or declaration that began at
+        ``start`` with ``depth`` blocks open, and skips past it: through the
+        end of every block it opened, or else to the next ';' or
+        ``synchronizing_kinds()`` token.
+        """
+        self.errors.append(error)
+        if len(self.open_blocks) > depth:
+            self._skip_open_blocks(depth)
+            return
+        if self.current == start:
+            # Nothing was consumed: drop the offending token so parsing moves on.
+            token = self.advance()
+            if token and token.kind == Delimiters.SEMICOLON.code:
+                return
+        synchronizing = synchronizing_kinds()
+        while (token := self.peek()) and not (token.kind in synchronizing and self._resumes_at(token.kind)):
+            self.advance()
+            if token.kind == Delimiters.SEMICOLON.code:
+                return
+
+    def _resumes_at(self, kind: int) -> bool:
+        """Whether a synchronizing token can continue the parse: a closer must end a block still open."""
+        if kind not in _BLOCK_CLOSERS or kind == Delimiters.END.code:
+            return True
+        if kind == KeyWords.ELSE.code:
+            return KeyWords.END_IF.code in self.open_blocks
+        return kind in self.open_blocks
+
+    def _body_stop_kinds(self, stop_kinds: frozenset[int]) -> frozenset[int]:
+        """``stop_kinds`` of a block body, plus with recovery the closers of every open block."""
+        if not self.recover:
+            return stop_kinds
+        return stop_kinds | frozenset(kind for kind in _BLOCK_CLOSERS if self._resumes_at(kind))
+
+    def _skip_open_blocks(self, depth: int) -> None:
+        blocks = self.open_blocks
+        while len(blocks) > depth and (token := self.peek()):
+            kind = token.kind
+            if kind in _BLOCK_CLOSER_OF:
+                blocks.append(_BLOCK_CLOSER_OF[kind])
+                self.advance()
+            elif kind == blocks[-1]:
+                blocks.pop()
+                self.advance()
+                if len(blocks) == depth and (token := self.peek()) and token.kind == Delimiters.SEMICOLON.code:
+                    self.advance()
+            elif kind in _BLOCK_CLOSERS and kind != KeyWords.ELSE.code and self._resumes_at(kind):
+                # The closer of an outer block: the inner one lacks its own.
+                blocks.pop()
+            else:
+                # Stray closers, matching no open block, are skipped like any other token.
+                self.advance()
+        del blocks[depth:]
 
-        commands = []
-        while self.peek() and self.peek().token_type != Delimiters.END.name:
-            if self.peek() is None:
-                raise SyntaxError("Expected 'fim' but reached end of file.")
-            commands.append(self.parse_command())
+    def parse(self) -> Program:
 
-        self.expect(Delimiters.END.name)
+        self.expect_or_record(Delimiters.START.code)
+        declarations = list(self.iter_declarations())
+        commands = list(self.iter_commands(_PROGRAM_END))
+        self.expect_or_record(Delimiters.END.code)
 
         return Program(declarations, commands)
 
+    def iter_declarations(self) -> Iterator[VariableDeclaration]:
+
+        while (token := self.peek()) and token.kind == KeyWords.VAR.code:
+            start, depth = self.current, len(self.open_blocks)
+            try:
+                declaration = self.parse_variable_declaration()
+            except SyntaxError as error:
+                if not self.recover:
+                    raise
+                self.synchronize(error, start, depth)
+                continue
+            yield declaration
+
+    def iter_commands(self, stop_kinds: frozenset[int]) -> Iterator:
+
+        while (token := self.peek()) and token.kind not in stop_kinds:
+            start, depth = self.current, len(self.open_blocks)
+            try:
+                command = self.parse_command()
+            except SyntaxError as error:
+                if not self.recover:
+                    raise
+                self.synchronize(error, start, depth)
+                continue
+            yield command
+
     def parse_variable_declaration(self) -> VariableDeclaration:
         """
         Regra: VariableDeclaration -> 'var' TYPE ':' IDENTIFIER (',' IDENTIFIER)* ';'
         """
-        self.expect(KeyWords.VAR.name)
+        self.expect(KeyWords.VAR.code)
 
-        type_token = self.expect(KeyWords.INTEGER.name, KeyWords.FLOAT.name, KeyWords.TEXT.name, KeyWords.BOOLEAN.name)
+        type_token = self.expect(*_TYPE_KINDS)
         var_type = type_token.lexeme
 
-        self.expect(Delimiters.COLON.name)
+        self.expect(Delimiters.COLON.code)
 
         names = []
-        names.append(self.expect('IDENTIFIER').lexeme)
+        names.append(self.expect_identifier().lexeme)
 
-        while self.peek() and self.peek().token_type == Delimiters.COMMA.name:
+        while self.peek() and self.peek().kind == Delimiters.COMMA.code:
             self.advance()
-            names.append(self.expect('IDENTIFIER').lexeme)
+            names.append(self.expect_identifier().lexeme)
 
-        self.expect(Delimiters.SEMICOLON.name)
+        self.expect(Delimiters.SEMICOLON.code)
         return VariableDeclaration(var_type, names)
 
     def parse_command(self):
@@ -80,18 +260,19 @@ class ParserLL1:
         if not current_token:
             raise SyntaxError("Unexpected end of tokens while parsing command.")
 
-        if current_token.token_type == 'IDENTIFIER':
-            next_token = self.tokens[self.current + 1] if self.current + 1 < len(self.tokens) else None
+        kind = current_token.kind
+        if kind >= FIRST_IDENTIFIER_CODE:
+            next_token = self.peek(1)
 
-            if next_token and next_token.token_type == Operators.ASSIGN.name:
+            if next_token and next_token.kind == Operators.ASSIGN.code:
                 return self.parse_assignment()
             else:
                 return self.parse_function_call()
-        elif current_token.token_type == KeyWords.IF.name:
+        elif kind == KeyWords.IF.code:
             return self.parse_if_statement()
-        elif current_token.token_type == KeyWords.WHILE.name:
+        elif kind == KeyWords.WHILE.code:
             return self.parse_while_loop()
-        elif current_token.token_type == KeyWords.REPEAT.name:
+        elif kind == KeyWords.REPEAT.code:
             return self.parse_repeat_loop()
         else:
             raise SyntaxError(
@@ -99,148 +280,348 @@ class ParserLL1:
 
     def parse_assignment(self) -> Assignment:
 
-        var_name = self.expect('IDENTIFIER').lexeme
-        self.expect(Operators.ASSIGN.name)
+        var_name = self.expect_identifier().lexeme
+        self.expect(Operators.ASSIGN.code)
         expression = self.parse_expression()
-        self.expect(Delimiters.SEMICOLON.name)
+        self.expect(Delimiters.SEMICOLON.code)
         return Assignment(var_name, expression)
 
     def parse_function_call(self) -> Command:
 
-        function_name = self.expect('IDENTIFIER').lexeme
+        function_name = self.expect_identifier().lexeme
         args = []
 
-        if self.peek() and self.peek().token_type == Delimiters.LEFT_PAR.name:
+        if self.peek() and self.peek().kind == Delimiters.LEFT_PAR.code:
             self.advance()
-            if self.peek().token_type != Delimiters.RIGHT_PAR.name:
+            if self.peek().kind != Delimiters.RIGHT_PAR.code:
                 args.append(self.parse_expression())
-                while self.peek() and self.peek().token_type == Delimiters.COMMA.name:
+                while self.peek() and self.peek().kind == Delimiters.COMMA.code:
                     self.advance()
                     args.append(self.parse_expression())
-            self.expect(Delimiters.RIGHT_PAR.name)
-        elif self.peek() and self.peek().token_type != Delimiters.SEMICOLON.name:
+            self.expect(Delimiters.RIGHT_PAR.code)
+        elif self.peek() and self.peek().kind != Delimiters.SEMICOLON.code:
             args.append(self.parse_expression())
 
-        self.expect(Delimiters.SEMICOLON.name)
+        self.expect(Delimiters.SEMICOLON.code)
         return Command(function_name, args)
 
     def parse_if_statement(self) -> IfStatement:
 
-        self.expect(KeyWords.IF.name)
+        self.expect(KeyWords.IF.code)
+        self.open_blocks.append(KeyWords.END_IF.code)
         condition = self.parse_expression()
-        self.expect(KeyWords.THEN.name)
+        self.expect(KeyWords.THEN.code)
 
-        true_branch = self.parse_command_block([KeyWords.ELSE.name, KeyWords.END_IF.name])
+        true_branch = self.parse_command_block(_IF_BLOCK_END)
 
         false_branch = None
-        if self.peek() and self.peek().token_type == KeyWords.ELSE.name:
+        if self.peek() and self.peek().kind == KeyWords.ELSE.code:
             self.advance()
-            false_branch = self.parse_command_block([KeyWords.END_IF.name])
+            false_branch = self.parse_command_block(_ELSE_BLOCK_END)
 
-        self.expect(KeyWords.END_IF.name)
-        self.expect(Delimiters.SEMICOLON.name)
+        self.expect(KeyWords.END_IF.code)
+        self.open_blocks.pop()
+        self.expect(Delimiters.SEMICOLON.code)
         return IfStatement(condition, true_branch, false_branch)
 
     def parse_while_loop(self) -> WhileLoop:
 
-        self.expect(KeyWords.WHILE.name)
+        self.expect(KeyWords.WHILE.code)
+        self.open_blocks.append(KeyWords.END_WHILE.code)
         condition = self.parse_expression()
-        self.expect(KeyWords.DO.name)
+        self.expect(KeyWords.DO.code)
 
-        body = self.parse_command_block([KeyWords.END_WHILE.name])
+        body = self.parse_command_block(_WHILE_BLOCK_END)
 
-        self.expect(KeyWords.END_WHILE.name)
-        self.expect(Delimiters.SEMICOLON.name)
+        self.expect(KeyWords.END_WHILE.code)
+        self.open_blocks.pop()
+        self.expect(Delimiters.SEMICOLON.code)
         return WhileLoop(condition, body)
 
     def parse_repeat_loop(self) -> RepeatLoop:
 
-        self.expect(KeyWords.REPEAT.name)
+        self.expect(KeyWords.REPEAT.code)
+        self.open_blocks.append(KeyWords.END_REPEAT.code)
         count = self.parse_expression()
-        self.expect(KeyWords.TIMES.name)
+        self.expect(KeyWords.TIMES.code)
 
-        body = self.parse_command_block([KeyWords.END_REPEAT.name])
+        body = self.parse_command_block(_REPEAT_BLOCK_END)
 
-        self.expect(KeyWords.END_REPEAT.name)
-        self.expect(Delimiters.SEMICOLON.name)
+        self.expect(KeyWords.END_REPEAT.code)
+        self.open_blocks.pop()
+        self.expect(Delimiters.SEMICOLON.code)
         return RepeatLoop(count, body)
 
-    def parse_command_block(self, stop_tokens: list[str]) -> list:
-
-        commands = []
-        while self.peek() and self.peek().token_type not in stop_tokens:
-            if self.peek() is None:
-                raise SyntaxError(f"Unexpected end of file inside a block. Expected one of {stop_tokens}")
-            commands.append(self.parse_command())
-        return commands
+    def parse_command_block(self, stop_kinds: frozenset[int]) -> list:
 
-    def parse_expression(self):
+        return list(self.iter_commands(self._body_stop_kinds(stop_kinds)))
 
-        return self.parse_comparison()
+    def parse_expression(self, min_power: int = 1):
+        """
+        Precedence climbing over ``_BINARY_OPERATORS``: parses a primary, then
+        folds in every following operator that binds at least ``min_power``.
+        """
+        left = self.parse_primary()
 
-    def parse_comparison(self):
+        while True:
+            token = self.peek()
+            operator = _BINARY_OPERATORS.get(token.kind) if token else None
+            if operator is None:
+                break
+            power, right_associative, symbol = operator
+            if power < min_power:
+                break
+            self.current += 1
+            right = self.parse_expression(power if right_associative else power + 1)
+            left = BinaryExpression(left, symbol, right)
+        return left
 
-        left = self.parse_addition()
+    def parse_primary(self):
 
-        while self.peek() and self.peek().token_type in [
-            Operators.EQUAL.name, Operators.NOT_EQUAL.name, Operators.LESS_THAN.name,
-            Operators.LESS_EQUAL.name, Operators.GREATER_THAN.name, Operators.GREATER_EQUAL.name
-        ]:
-            operator_token = self.advance()
-            right = self.parse_addition()
-            left = BinaryExpression(left, operator_token.lexeme, right)
-        return left
+        token = self.peek()
+        if not token:
+            raise SyntaxError("Unexpected end of tokens while parsing primary expression.")
 
-    def parse_addition(self):
+        if token.kind == _LEFT_PAR_KIND:
+            self.current += 1
+            expr = self.parse_expression()
+            self.expect(Delimiters.RIGHT_PAR.code)
+            return expr
+        return self.parse_value(token)
 
-        left = self.parse_multiplication()
+    def parse_value(self, token: Token):
+        """
+        Regra: Value -> IDENTIFIER | INTEGER | FLOAT | TEXT | BOOLEAN
+        """
+        kind = token.kind
+        if kind >= FIRST_IDENTIFIER_CODE:
+            self.current += 1
+            return VariableReference(token.lexeme)
+        # Numeric literals were already converted by the token list; a bare type
+        # keyword (e.g. 'inteiro') shares their code but is not a value.
+        elif kind == _INTEGER_KIND and isinstance(token.lexeme, int):
+            self.current += 1
+            return Literal(token.lexeme, _INTEGER_TYPE)
+        elif kind == _FLOAT_KIND and isinstance(token.lexeme, float):
+            self.current += 1
+            return Literal(token.lexeme, _FLOAT_TYPE)
+        elif kind == _TEXT_KIND:
+            self.current += 1
+            return Literal(token.lexeme.strip('"'), _TEXT_TYPE)
+        elif kind == _BOOLEAN_KIND:
+            self.current += 1
+            return Literal(token.lexeme == 'verdadeiro', _BOOLEAN_TYPE)
+        else:
+            raise SyntaxError(
+                f"Unexpected token in primary expression: {token.token_type} ('{token.lexeme}') at line {token.line}, column {token.column}")
 
-        while self.peek() and self.peek().token_type in [Operators.PLUS.name, Operators.MINUS.name]:
-            operator_token = self.advance()
-            right = self.parse_multiplication()
-            left = BinaryExpression(left, operator_token.lexeme, right)
-        return left
 
-    def parse_multiplication(self):
+class _OpenBlock:
+    """A 'se', 'enquanto' or 'repita' whose commands are still being parsed."""
+    __slots__ = ('kind', 'head', 'commands', 'true_branch', 'stop_kinds', 'start')
 
-        left = self.parse_primary()
+    def __init__(self, kind: int, head, stop_kinds: frozenset[int], start: int):
+        self.kind = kind
+        self.head = head
+        self.commands = []
+        self.true_branch = None
+        self.stop_kinds = stop_kinds
+        self.start = start
 
-        while self.peek() and self.peek().token_type in [Operators.MULTIPLICATION.name, Operators.DIVISIVE.name]:
-            operator_token = self.advance()
-            right = self.parse_primary()
-            left = BinaryExpression(left, operator_token.lexeme, right)
-        return left
 
-    def parse_primary(self):
+class IterativeParserLL1(ParserLL1):
+    """
+    ``ParserLL1`` with explicit stacks instead of recursion for nested blocks
+    and parenthesized expressions, so nesting is limited only by memory. It
+    builds the same AST, raises the same errors and recovers the same way.
+    """
 
+    def parse_command(self):
+        blocks = []
+        base = len(self.open_blocks)
+        while True:
+            start = self.current
+            try:
+                command = self._parse_statement(blocks)
+            except SyntaxError as error:
+                # Errors of the outermost command are recovered from by the caller.
+                if not (self.recover and blocks):
+                    raise
+                self.synchronize(error, start, base + len(blocks))
+                command = None
+            if command is not None:
+                if not blocks:
+                    return command
+                blocks[-1].commands.append(command)
+
+            # Close every block whose end comes next, innermost first.
+            while True:
+                block = blocks[-1]
+                token = self.peek()
+                if token and token.kind not in block.stop_kinds:
+                    break
+                try:
+                    command = self._close_block(block)
+                except SyntaxError as error:
+                    if not self.recover or len(blocks) == 1:
+                        raise
+                    # The block is dropped, like a failing command of its parent.
+                    blocks.pop()
+                    self.synchronize(error, block.start, base + len(blocks))
+                    continue
+                if command is None:
+                    continue
+                blocks.pop()
+                if not blocks:
+                    return command
+                blocks[-1].commands.append(command)
+
+    def _parse_statement(self, blocks: list[_OpenBlock]):
+        """
+        Parses an assignment or call and returns it, or the head of a block,
+        which is pushed onto ``blocks`` instead.
+        """
+        start = self.current
         token = self.peek()
-        if not token:
-            raise SyntaxError("Unexpected end of tokens while parsing primary expression.")
-
-        if token.token_type == 'IDENTIFIER':
-            return VariableReference(self.advance().lexeme)
-        elif token.token_type == 'INTEGER':
-            value = int(self.advance().lexeme)
-            return Literal(value, KeyWords.INTEGER.lexeme)
-        elif token.token_type == 'FLOAT':
-            value = float(self.advance().lexeme)
-            return Literal(value, KeyWords.FLOAT.lexeme)
-        elif token.token_type == 'STRING' or token.token_type == KeyWords.TEXT.name:
-            value = token.lexeme.strip('"')
+        kind = token.kind if token else None
+        if kind == KeyWords.IF.code:
             self.advance()
-            return Literal(value, KeyWords.TEXT.lexeme)
-        elif token.token_type == 'BOOLEAN':
-            value = (token.lexeme == 'verdadeiro')
+            self.open_blocks.append(KeyWords.END_IF.code)
+            condition = self.parse_expression()
+            self.expect(KeyWords.THEN.code)
+            blocks.append(_OpenBlock(kind, condition, self._body_stop_kinds(_IF_BLOCK_END), start))
+        elif kind == KeyWords.WHILE.code:
             self.advance()
-            return Literal(value, KeyWords.BOOLEAN.lexeme)
-        elif token.token_type == Delimiters.LEFT_PAR.name:
+            self.open_blocks.append(KeyWords.END_WHILE.code)
+            condition = self.parse_expression()
+            self.expect(KeyWords.DO.code)
+            blocks.append(_OpenBlock(kind, condition, self._body_stop_kinds(_WHILE_BLOCK_END), start))
+        elif kind == KeyWords.REPEAT.code:
             self.advance()
-            expr = self.parse_expression()
-            self.expect(Delimiters.RIGHT_PAR.name)
-            return expr
+            self.open_blocks.append(KeyWords.END_REPEAT.code)
+            count = self.parse_expression()
+            self.expect(KeyWords.TIMES.code)
+            blocks.append(_OpenBlock(kind, count, self._body_stop_kinds(_REPEAT_BLOCK_END), start))
         else:
-            raise SyntaxError(
-                f"Unexpected token in primary expression: {token.token_type} ('{token.lexeme}') at line {token.line}, column {token.column}")
+            # Assignments and calls do not nest; the parent also reports bad tokens.
+            return super().parse_command()
+        return None
+
+    def _close_block(self, block: _OpenBlock):
+        """Ends ``block`` and returns its node, or None when a 'senao' branch opens instead."""
+        if block.kind == KeyWords.IF.code:
+            token = self.peek()
+            if block.true_branch is None and token and token.kind == KeyWords.ELSE.code:
+                self.advance()
+                block.true_branch, block.commands = block.commands, []
+                block.stop_kinds = self._body_stop_kinds(_ELSE_BLOCK_END)
+                return None
+            self.expect(KeyWords.END_IF.code)
+            self.open_blocks.pop()
+            self.expect(Delimiters.SEMICOLON.code)
+            if block.true_branch is None:
+                return IfStatement(block.head, block.commands, None)
+            return IfStatement(block.head, block.true_branch, block.commands)
+
+        if block.kind == KeyWords.WHILE.code:
+            self.expect(KeyWords.END_WHILE.code)
+            self.open_blocks.pop()
+            self.expect(Delimiters.SEMICOLON.code)
+            return WhileLoop(block.head, block.commands)
+
+        self.expect(KeyWords.END_REPEAT.code)
+        self.open_blocks.pop()
+        self.expect(Delimiters.SEMICOLON.code)
+        return RepeatLoop(block.head, block.commands)
+
+    def parse_expression(self):
+        """
+        Shunting-yard over ``_BINARY_OPERATORS``: ``operators`` holds the
+        pending operators, with None for every open parenthesis.
+        """
+        operands = []
+        operators = []
+        while True:
+            token = self.peek()
+            while token and token.kind == _LEFT_PAR_KIND:
+                self.current += 1
+                operators.append(None)
+                token = self.peek()
+            if not token:
+                raise SyntaxError("Unexpected end of tokens while parsing primary expression.")
+            operands.append(self.parse_value(token))
+
+            # After a value: close parentheses until an operator follows.
+            while True:
+                token = self.peek()
+                operator = _BINARY_OPERATORS.get(token.kind) if token else None
+                if operator is not None:
+                    break
+                while operators and operators[-1] is not None:
+                    _fold(operands, operators)
+                if not operators:
+                    return operands.pop()
+                operators.pop()
+                self.expect(Delimiters.RIGHT_PAR.code)
+
+            power = operator[0]
+            while operators and operators[-1] is not None and (
+                    operators[-1][0] > power or operators[-1][0] == power and not operators[-1][1]):
+                _fold(operands, operators)
+            operators.append(operator)
+            self.current += 1
+
+
+def _fold(operands: list, operators: list) -> None:
+    """Replaces the last two operands with the last operator applied to them."""
+    symbol = operators.pop()[2]
+    right = operands.pop()
+    operands[-1] = BinaryExpression(operands[-1], symbol, right)
+
+
+class StreamingParserLL1(ParserLL1):
+    """
+    ``ParserLL1`` over a token iterator, such as ``Tokenizer.iter_tokens``.
+    Only tokens not yet consumed are buffered (two at most, for the lookahead
+    of an assignment). ``parse_stream`` yields every declaration and top-level
+    command as soon as it is complete, so later phases can process it while
+    the rest of the script is still being read.
+    """
+
+    def __init__(self, tokens: Iterable[Token], recover: bool = False):
+        super().__init__([], recover)
+        self._source = iter(tokens)
+        self._buffer = deque()
+        self._buffer_start = 0
+
+    def peek(self, ahead: int = 0) -> Token | None:
+        buffer = self._buffer
+        consumed = self.current - self._buffer_start
+        if consumed:
+            for _ in range(consumed):
+                buffer.popleft()
+            self._buffer_start = self.current
+
+        while len(buffer) <= ahead:
+            token = next(self._source, None)
+            if token is None:
+                return None
+            buffer.append(token)
+        return buffer[ahead]
+
+    def advance(self) -> Token | None:
+        token = self.peek()
+        if token:
+            self.current += 1
+        return token
+
+    def parse_stream(self) -> Iterator:
+        """Yields the ``VariableDeclaration``s, then the top-level commands, of the program."""
+        self.expect_or_record(Delimiters.START.code)
+        yield from self.iter_declarations()
+        yield from self.iter_commands(_PROGRAM_END)
+        self.expect_or_record(Delimiters.END.code)
+
 
 def pretty_print_ast_util(node, indent=0):
     spaces = "  " * indent
@@ -316,33 +697,40 @@ def pretty_print_ast_util(node, indent=0):
 
 def main():
 
+    avancar = FIRST_IDENTIFIER_CODE
+    girar_direita = FIRST_IDENTIFIER_CODE + 1
+
+    source = LineIndex()
+    for _ in range(14):
+        source.add_line(80)
+
     tokens_input = [
-        Token(token_type='START', lexeme='inicio', line=1, column=0),
-        Token(token_type='IDENTIFIER', lexeme='avancar', line=3, column=2),
-        Token(token_type='INTEGER', lexeme='150', line=3, column=10),
-        Token(token_type='SEMICOLON', lexeme=';', line=3, column=13),
-        Token(token_type='IDENTIFIER', lexeme='girar_direita', line=4, column=2),
-        Token(token_type='INTEGER', lexeme='90', line=4, column=16),
-        Token(token_type='SEMICOLON', lexeme=';', line=4, column=18),
-        Token(token_type='IDENTIFIER', lexeme='avancar', line=6, column=2),
-        Token(token_type='INTEGER', lexeme='150', line=6, column=10),
-        Token(token_type='SEMICOLON', lexeme=';', line=6, column=13),
-        Token(token_type='IDENTIFIER', lexeme='girar_direita', line=7, column=2),
-        Token(token_type='INTEGER', lexeme='90', line=7, column=16),
-        Token(token_type='SEMICOLON', lexeme=';', line=7, column=18),
-        Token(token_type='IDENTIFIER', lexeme='avancar', line=9, column=2),
-        Token(token_type='INTEGER', lexeme='150', line=9, column=10),
-        Token(token_type='SEMICOLON', lexeme=';', line=9, column=13),
-        Token(token_type='IDENTIFIER', lexeme='girar_direita', line=10, column=2),
-        Token(token_type='INTEGER', lexeme='90', line=10, column=16),
-        Token(token_type='SEMICOLON', lexeme=';', line=10, column=18),
-        Token(token_type='IDENTIFIER', lexeme='avancar', line=12, column=2),
-        Token(token_type='INTEGER', lexeme='150', line=12, column=10),
-        Token(token_type='SEMICOLON', lexeme=';', line=12, column=13),
-        Token(token_type='IDENTIFIER', lexeme='girar_direita', line=13, column=2),
-        Token(token_type='INTEGER', lexeme='90', line=13, column=16),
-        Token(token_type='SEMICOLON', lexeme=';', line=13, column=18),
-        Token(token_type='END', lexeme='fim', line=14, column=0),
+        Token(Delimiters.START.code, 'inicio', source.offset(1, 0), source),
+        Token(avancar, 'avancar', source.offset(3, 2), source),
+        Token(KeyWords.INTEGER.code, 150, source.offset(3, 10), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(3, 13), source),
+        Token(girar_direita, 'girar_direita', source.offset(4, 2), source),
+        Token(KeyWords.INTEGER.code, 90, source.offset(4, 16), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(4, 18), source),
+        Token(avancar, 'avancar', source.offset(6, 2), source),
+        Token(KeyWords.INTEGER.code, 150, source.offset(6, 10), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(6, 13), source),
+        Token(girar_direita, 'girar_direita', source.offset(7, 2), source),
+        Token(KeyWords.INTEGER.code, 90, source.offset(7, 16), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(7, 18), source),
+        Token(avancar, 'avancar', source.offset(9, 2), source),
+        Token(KeyWords.INTEGER.code, 150, source.offset(9, 10), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(9, 13), source),
+        Token(girar_direita, 'girar_direita', source.offset(10, 2), source),
+        Token(KeyWords.INTEGER.code, 90, source.offset(10, 16), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(10, 18), source),
+        Token(avancar, 'avancar', source.offset(12, 2), source),
+        Token(KeyWords.INTEGER.code, 150, source.offset(12, 10), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(12, 13), source),
+        Token(girar_direita, 'girar_direita', source.offset(13, 2), source),
+        Token(KeyWords.INTEGER.code, 90, source.offset(13, 16), source),
+        Token(Delimiters.SEMICOLON.code, ';', source.offset(13, 18), source),
+        Token(Delimiters.END.code, 'fim', source.offset(14, 0), source),
     ]
 
     parser = ParserLL1(tokens_input)
@@ -0,0 +1,227 @@
+"""
+Generates a recursive-descent parser module from ``TURTLESCRIPT_GRAMMAR``.
+
+Every non-terminal becomes a function that dispatches on the integer column
+of the lookahead token with the production's predict set (from FIRST/FOLLOW)
+inlined as a constant, so no table is interpreted at parse time.
+Right-recursive tails (``Commands -> Command Commands``) become loops.
+
+The output is checked in as ``src/parser/generated_parser.py``; regenerate it
+after changing the grammar with
+
+    python -m src.parser.parser_generator
+"""
+import argparse
+import os
+import re
+import sys
+
+from src.lexical_analyzer.utils.token_class import FIRST_IDENTIFIER_CODE, TOKEN_NAMES
+from src.parser.calculate_first_set import calculate_first_sets
+from src.parser.calculate_follow_set import calculate_follow_sets
+from src.parser.grammar import (EPSILON, END_OF_INPUT, LITERAL_TERMINALS, START_SYMBOL, TURTLESCRIPT_GRAMMAR,
+                                VALUE_TERMINALS, grammar_terminals, is_action, reported_terminals, without_actions)
+from src.parser.parse_table import predict_sets
+
+GENERATED_MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generated_parser.py")
+
+_HEADER = '''\
+# Generated by src/parser/parser_generator.py from TURTLESCRIPT_GRAMMAR; do not edit.
+# Regenerate with: python -m src.parser.parser_generator
+from src.parser.actions import ACTIONS
+from src.parser.parser import unexpected_token
+'''
+
+
+def _identifier(name: str) -> str:
+    return re.sub(r"\W", "_", name)
+
+
+class _Writer:
+
+    def __init__(self) -> None:
+        self.lines = []
+        self.indent = 0
+
+    def line(self, text: str = "") -> None:
+        indent = "    " * self.indent
+        if text == "return position" and self.lines and self.lines[-1].startswith(indent + "position = _parse_"):
+            # A call whose result is returned right away becomes a tail call.
+            self.lines[-1] = indent + "return " + self.lines[-1][len(indent + "position = "):]
+            return
+        self.lines.append(indent + text if text else "")
+
+
+def generate_parser_source(grammar_rules: dict = None, start_symbol: str = START_SYMBOL,
+                           class_name: str = "GeneratedParserLL1") -> str:
+    """Returns the source of a parser module for ``grammar_rules``."""
+    grammar_rules = TURTLESCRIPT_GRAMMAR if grammar_rules is None else grammar_rules
+    terminals = grammar_terminals(grammar_rules) + [END_OF_INPUT]
+    columns = {terminal: index for index, terminal in enumerate(terminals)}
+
+    plain = without_actions(grammar_rules)
+    first_sets = calculate_first_sets(plain, set(terminals))
+    follow_sets = calculate_follow_sets(plain, start_symbol, first_sets)
+    lookaheads = [
+        sorted(columns[terminal] for terminal in predicted)
+        for _, _, predicted in predict_sets(plain, first_sets, follow_sets, set(terminals))
+    ]
+
+    functions = {}
+    for non_terminal in grammar_rules:
+        function = f"_parse_{_identifier(non_terminal)}"
+        while function in functions.values():
+            function += "_"
+        functions[non_terminal] = function
+    actions = {
+        symbol: f"_action_{_identifier(symbol[1:])}"
+        for productions in grammar_rules.values()
+        for production in productions
+        for symbol in production
+        if is_action(symbol)
+    }
+
+    out = _Writer()
+    out.lines.extend(_HEADER.splitlines())
+    out.line()
+    for action, name in actions.items():
+        out.line(f"{name} = ACTIONS[{action!r}]")
+    out.line()
+    out.line(f"_END_COLUMN = {columns[END_OF_INPUT]}")
+    out.line(f"_IDENTIFIER_COLUMN = {columns.get('IDENTIFIER', -1)}")
+    out.line(f"_FIRST_IDENTIFIER_CODE = {FIRST_IDENTIFIER_CODE}")
+    kind_columns = tuple(columns.get(TOKEN_NAMES.get(kind), -1) for kind in range(FIRST_IDENTIFIER_CODE))
+    out.line(f"_KIND_COLUMNS = {kind_columns!r}")
+    literal_columns = ", ".join(
+        f"{kind}: ({literal_type.__name__}, {columns[terminal]})"
+        for terminal, (kind, literal_type) in LITERAL_TERMINALS.items()
+        if terminal in columns
+    )
+    out.line(f"_LITERAL_COLUMNS = {{{literal_columns}}}")
+    out.line()
+
+    lookahead_sets = {}
+    for predicted in lookaheads:
+        if len(predicted) > 1 and tuple(predicted) not in lookahead_sets:
+            lookahead_sets[tuple(predicted)] = f"_LOOKAHEAD_{len(lookahead_sets)}"
+            out.line(f"{lookahead_sets[tuple(predicted)]} = frozenset({tuple(predicted)!r})")
+    out.line()
+
+    out.lines.extend('''
+def _column(token):
+    kind = token.kind
+    if kind >= _FIRST_IDENTIFIER_CODE:
+        return _IDENTIFIER_COLUMN
+    literal = _LITERAL_COLUMNS.get(kind)
+    if literal is not None and isinstance(token.lexeme, literal[0]):
+        return literal[1]
+    return _KIND_COLUMNS[kind]
+
+
+def _unexpected(tokens, position, expected):
+    return unexpected_token(expected, tokens[position] if position < len(tokens) else None)
+'''.splitlines())
+
+    production_index = 0
+    for non_terminal, productions in grammar_rules.items():
+        alternatives = lookaheads[production_index:production_index + len(productions)]
+        production_index += len(productions)
+        expected = reported_terminals(
+            terminal for terminal in terminals
+            if terminal != END_OF_INPUT and any(columns[terminal] in predicted for predicted in alternatives)
+        )
+        loops = any(production and production[-1] == non_terminal for production in productions)
+
+        out.indent = 0
+        out.line()
+        out.line()
+        out.line(f"def {functions[non_terminal]}(tokens, columns, values, position):")
+        out.indent += 1
+        if len(productions) == 1:
+            _emit_body(out, productions[0], non_terminal, columns, functions, actions, dispatched=False)
+            out.line("return position")
+            continue
+
+        if loops:
+            out.line("while True:")
+            out.indent += 1
+        out.line("column = columns[position]")
+        for production, predicted in zip(productions, alternatives):
+            if len(predicted) == 1:
+                condition = f"column == {predicted[0]}"
+            else:
+                condition = f"column in {lookahead_sets[tuple(predicted)]}"
+            out.line(f"if {condition}:")
+            out.indent += 1
+            if _emit_body(out, production, non_terminal, columns, functions, actions, dispatched=True):
+                out.line("continue")
+            else:
+                out.line("return position")
+            out.indent -= 1
+        out.line(f"raise _unexpected(tokens, position, {expected!r})")
+
+    out.indent = 0
+    out.lines.extend(f'''
+
+class {class_name}:
+    """Recursive-descent parser generated from the LL(1) grammar; builds the same AST as ParserLL1."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.current = 0
+
+    def parse(self):
+        tokens = self.tokens
+        columns = [_column(token) for token in tokens]
+        columns.append(_END_COLUMN)
+        values = []
+        self.current = {functions[start_symbol]}(tokens, columns, values, self.current)
+        return values.pop()
+'''.splitlines())
+    return "\n".join(out.lines) + "\n"
+
+
+def _emit_body(out: _Writer, production: list[str], non_terminal: str, columns: dict, functions: dict,
+               actions: dict, dispatched: bool) -> bool:
+    """
+    Writes the code of one production; returns whether it ends by calling
+    ``non_terminal`` again, which the caller turns into a loop.
+    """
+    symbols = [symbol for symbol in production if symbol != EPSILON]
+    tail_call = bool(symbols) and symbols[-1] == non_terminal
+    if tail_call:
+        symbols.pop()
+
+    # The dispatch already checked the lookahead for a leading terminal.
+    checked = dispatched
+    for symbol in symbols:
+        if is_action(symbol):
+            out.line(f"{actions[symbol]}(values)")
+        elif symbol in functions:
+            out.line(f"position = {functions[symbol]}(tokens, columns, values, position)")
+            checked = False
+        else:
+            if not checked:
+                out.line(f"if columns[position] != {columns[symbol]}:")
+                out.line(f"    raise _unexpected(tokens, position, {(symbol,)!r})")
+            if symbol in VALUE_TERMINALS:
+                out.line("values.append(tokens[position])")
+            out.line("position += 1")
+            checked = False
+    return tail_call
+
+
+def main(args: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.parser.parser_generator",
+        description="Generates the recursive-descent parser for TURTLESCRIPT_GRAMMAR.",
+    )
+    parser.add_argument("output", nargs="?", default=GENERATED_MODULE,
+                        help="file to write (default: src/parser/generated_parser.py)")
+    path = parser.parse_args(args).output
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(generate_parser_source())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
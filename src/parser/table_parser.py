@@ -0,0 +1,257 @@
+from array import array
+
+from src.lexical_analyzer.utils.token import Token
+from src.lexical_analyzer.utils.token_class import FIRST_IDENTIFIER_CODE, TOKEN_NAMES
+from src.parser.actions import ACTIONS
+from src.parser.grammar import (END_OF_INPUT, LITERAL_TERMINALS, START_SYMBOL, TURTLESCRIPT_GRAMMAR,
+                                VALUE_TERMINALS, grammar_terminals, is_action, reported_terminals, without_actions)
+from src.parser.numbered_grammar import NumberedGrammar
+from src.parser.parser import unexpected_token
+from src.semantic_analyzer.syntatic_tree import Program
+
+_TABLE_FORMAT = 1
+_NO_PRODUCTION = -1
+
+
+def build_parse_table(grammar_rules: dict = None, start_symbol: str = START_SYMBOL) -> dict:
+    """
+    Compiles ``grammar_rules`` (default ``TURTLESCRIPT_GRAMMAR``) into an LL(1)
+    table.
+
+    Symbols are numbered: terminals (``'$'`` last) are ``0..width-1``,
+    non-terminals follow them and action ``i`` is ``-(i + 1)``. The result is a
+    JSON-friendly dict whose ``table`` holds, row-major by non-terminal, the
+    index of the production to expand on each terminal or -1.
+
+    Raises ``ValueError`` if the grammar is not LL(1).
+    """
+    grammar_rules = TURTLESCRIPT_GRAMMAR if grammar_rules is None else grammar_rules
+    terminals = grammar_terminals(grammar_rules) + [END_OF_INPUT]
+    non_terminals = list(grammar_rules)
+    actions = list(dict.fromkeys(
+        symbol
+        for productions in grammar_rules.values()
+        for production in productions
+        for symbol in production
+        if is_action(symbol)
+    ))
+
+    codes = {terminal: index for index, terminal in enumerate(terminals)}
+    codes.update((non_terminal, len(terminals) + index) for index, non_terminal in enumerate(non_terminals))
+    codes.update((action, -(index + 1)) for index, action in enumerate(actions))
+    productions = [
+        [codes[lhs], _inline_bodies(production, grammar_rules, codes)]
+        for lhs, alternatives in grammar_rules.items()
+        for production in alternatives
+    ]
+
+    grammar = NumberedGrammar(without_actions(grammar_rules), (), terminals)
+    first = grammar.first_masks()
+    predict = grammar.predict_masks(first, grammar.follow_masks(start_symbol, first))
+    conflicts = [
+        f"({lhs}, {terminal})"
+        for lhs, shared in grammar.conflicts(predict)
+        for terminal in sorted(grammar.symbols(shared))
+    ]
+    if conflicts:
+        raise ValueError(f"Grammar is not LL(1), conflicts at {', '.join(conflicts)}")
+
+    width = len(terminals)
+    # Bit position in the masks -> column of the table.
+    columns = [codes.get(terminal, -1) for terminal in grammar.terminals]
+    table = [_NO_PRODUCTION] * (len(non_terminals) * width)
+    for index, (lhs, _) in enumerate(grammar.productions):
+        row = lhs * width
+        for position, bit in enumerate(bin(predict[index])[:1:-1]):
+            if bit == '1':
+                table[row + columns[position]] = index
+
+    return {
+        "terminals": terminals,
+        "non_terminals": non_terminals,
+        "actions": actions,
+        "start": codes[start_symbol],
+        "productions": productions,
+        "table": table,
+    }
+
+
+def _inline_bodies(production: list[str], grammar_rules: dict, codes: dict, expanding: frozenset = frozenset()) -> list[int]:
+    """
+    Encodes ``production``, replacing every non-terminal that has a single
+    production by that production's symbols: it would be expanded the same
+    way whatever the lookahead, so the driver skips the table lookup.
+    """
+    body = []
+    for symbol in production:
+        if symbol == '#':
+            continue
+        alternatives = grammar_rules.get(symbol)
+        if alternatives is not None and len(alternatives) == 1 and symbol not in expanding:
+            body.extend(_inline_bodies(alternatives[0], grammar_rules, codes, expanding | {symbol}))
+        else:
+            body.append(codes[symbol])
+    return body
+
+
+def _is_int_list(value, low: int, high: int) -> bool:
+    """Whether ``value`` is a list of ints in ``range(low, high)``."""
+    return isinstance(value, list) and all(type(item) is int and low <= item < high for item in value)
+
+
+def _is_parse_table(table, grammar_rules: dict = None) -> bool:
+    """
+    Whether ``table`` has the shape ``build_parse_table`` gives it for
+    ``grammar_rules`` (default ``TURTLESCRIPT_GRAMMAR``), so ``ParseTable``
+    and the driver can index it without checks.
+    """
+    grammar_rules = TURTLESCRIPT_GRAMMAR if grammar_rules is None else grammar_rules
+    if not isinstance(table, dict) or set(table) != {"terminals", "non_terminals", "actions", "start",
+                                                     "productions", "table"}:
+        return False
+    terminals, non_terminals, actions = table["terminals"], table["non_terminals"], table["actions"]
+    if terminals != grammar_terminals(grammar_rules) + [END_OF_INPUT] or non_terminals != list(grammar_rules):
+        return False
+    if not isinstance(actions, list) or not all(isinstance(action, str) and action in ACTIONS for action in actions):
+        return False
+    width = len(terminals)
+    symbols = width + len(non_terminals)
+    productions = table["productions"]
+    if type(table["start"]) is not int or not width <= table["start"] < symbols or not isinstance(productions, list):
+        return False
+    for production in productions:
+        if not isinstance(production, list) or len(production) != 2:
+            return False
+        lhs, body = production
+        if type(lhs) is not int or not width <= lhs < symbols or not _is_int_list(body, -len(actions), symbols):
+            return False
+    rows = table["table"]
+    return len(rows) == len(non_terminals) * width and _is_int_list(rows, _NO_PRODUCTION, len(productions))
+
+
+class ParseTable:
+    """Compact, ready-to-run form of a table built by ``build_parse_table``."""
+
+    def __init__(self, table: dict) -> None:
+        self.terminals = table["terminals"]
+        self.non_terminals = table["non_terminals"]
+        self.actions = table["actions"]
+        self.start = table["start"]
+        self.width = len(self.terminals)
+        self.rows = array("i", table["table"])
+        # Right-hand sides reversed, ready to be pushed onto the parse stack.
+        self.bodies = [tuple(reversed(body)) for _, body in table["productions"]]
+        self.keeps_value = bytes(terminal in VALUE_TERMINALS for terminal in self.terminals)
+
+        columns = {terminal: index for index, terminal in enumerate(self.terminals)}
+        self.end_column = columns[END_OF_INPUT]
+        self.identifier_column = columns.get("IDENTIFIER", -1)
+        # Token code -> column; codes the grammar never uses map to -1.
+        self.kind_columns = [columns.get(TOKEN_NAMES.get(kind), -1) for kind in range(FIRST_IDENTIFIER_CODE)]
+        self.literal_columns = {
+            kind: (literal_type, columns[terminal])
+            for terminal, (kind, literal_type) in LITERAL_TERMINALS.items()
+            if terminal in columns
+        }
+
+    def column(self, token: Token) -> int:
+        kind = token.kind
+        if kind >= FIRST_IDENTIFIER_CODE:
+            return self.identifier_column
+        literal = self.literal_columns.get(kind)
+        if literal is not None and isinstance(token.lexeme, literal[0]):
+            return literal[1]
+        return self.kind_columns[kind]
+
+    def expected(self, symbol: int) -> tuple[str, ...]:
+        """Names of the terminals that can come next when ``symbol`` is on top of the stack."""
+        if symbol < self.width:
+            return (self.terminals[symbol],)
+        row = (symbol - self.width) * self.width
+        return reported_terminals(
+            terminal
+            for column, terminal in enumerate(self.terminals)
+            if self.rows[row + column] != _NO_PRODUCTION and terminal != END_OF_INPUT
+        )
+
+
+_TABLE: ParseTable | None = None
+
+
+def load_parse_table() -> ParseTable:
+    """
+    Returns the table for ``TURTLESCRIPT_GRAMMAR``, computing FIRST/FOLLOW only
+    when the on-disk cache (see ``src.cache``) has no table for this grammar.
+    """
+    global _TABLE
+    if _TABLE is None:
+        from src.cache import cache_key, load_json, store_json
+
+        key = cache_key("ll1-table", _TABLE_FORMAT, START_SYMBOL, TURTLESCRIPT_GRAMMAR)
+        table = load_json("ll1-table", key, _is_parse_table)
+        if table is None:
+            table = build_parse_table()
+            store_json("ll1-table", key, table)
+        _TABLE = ParseTable(table)
+    return _TABLE
+
+
+class TableParserLL1:
+    """
+    Predictive parser driven by the LL(1) table of ``TURTLESCRIPT_GRAMMAR``.
+
+    It keeps the pending grammar symbols on an explicit stack instead of the
+    call stack and builds the same ``Program`` as ``ParserLL1``.
+    """
+
+    def __init__(self, tokens: list[Token], table: ParseTable | None = None):
+        self.tokens = tokens
+        self.current = 0
+        self._table = load_parse_table() if table is None else table
+        self._actions = [ACTIONS[name] for name in self._table.actions]
+
+    def parse(self) -> Program:
+        table = self._table
+        width = table.width
+        rows = table.rows
+        bodies = table.bodies
+        keeps_value = table.keeps_value
+        actions = self._actions
+        tokens = self.tokens
+        count = len(tokens)
+
+        column_of = table.column
+        end_column = table.end_column
+
+        # Like ParserLL1, parsing stops after 'fim': '$' is never pushed, so
+        # tokens after it are left unread.
+        stack = [table.start]
+        values = []
+        position = self.current
+        token = tokens[position] if position < count else None
+        column = column_of(token) if token else end_column
+
+        pop = stack.pop
+        push_body = stack.extend
+        while stack:
+            symbol = pop()
+            if symbol < 0:
+                actions[~symbol](values)
+            elif symbol < width:
+                if symbol != column:
+                    self.current = position
+                    raise unexpected_token(table.expected(symbol), token)
+                if keeps_value[symbol]:
+                    values.append(token)
+                position += 1
+                token = tokens[position] if position < count else None
+                column = column_of(token) if token else end_column
+            else:
+                production = rows[(symbol - width) * width + column] if column >= 0 else -1
+                if production < 0:
+                    self.current = position
+                    raise unexpected_token(table.expected(symbol), token)
+                push_body(bodies[production])
+
+        self.current = position
+        return values.pop()
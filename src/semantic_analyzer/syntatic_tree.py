@@ -1,56 +1,78 @@
 # Como tô criando a árvore sintática, vou criar a simulação de classes que representam os nós da árvore.
 
 class Program:
+    __slots__ = ('declarations', 'commands')
+
     def __init__(self, declarations, commands):
         self.declarations = declarations
         self.commands = commands
 
 class VariableDeclaration:
+    __slots__ = ('var_type', 'names')
+
     def __init__(self, var_type, names):
         self.var_type = var_type
         self.names = names
 
 class BinaryExpression:
+    __slots__ = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left
         self.operator = operator
         self.right = right
 
 class Assignment:
+    __slots__ = ('var_name', 'expression')
+
     def __init__(self, var_name, expression):
         self.var_name = var_name
         self.expression = expression
 
 class IfStatement:
+    __slots__ = ('condition', 'true_branch', 'false_branch')
+
     def __init__(self, condition, true_branch, false_branch=None):
         self.condition = condition
         self.true_branch = true_branch
         self.false_branch = false_branch
 
 class WhileLoop:
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
 
 class RepeatLoop:
+    __slots__ = ('count', 'body')
+
     def __init__(self, count, body):
         self.count = count
         self.body = body
 
 class Command:
-    def __init__(self, name, args=[]):
+    __slots__ = ('name', 'args')
+
+    def __init__(self, name, args=None):
         self.name = name
-        self.args = args
+        self.args = [] if args is None else args
 
 class Literal:
+    __slots__ = ('value', 'type_')
+
     def __init__(self, value, type_):
         self.value = value
         self.type_ = type_
 
 class VariableReference:
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
 class CommentNode:
+    __slots__ = ('text',)
+
     def __init__(self, text):
         self.text = text
\ No newline at end of file
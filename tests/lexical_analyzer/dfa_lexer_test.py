@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.lexical_analyzer.utils.dfa_lexer import DfaLexer, LexerTable, build_lexer_table, load_lexer_table
+from src.lexical_analyzer.utils.lexer import Lexer
+
+LINES = [
+    '  se lado >= 10 entao avancar lado; fim_se;\n',
+    'x = 1.5; t = " a // b "; l = falso; // fim\n',
+    'a == b != c <= d >= e = f % g\n',
+    '12abc 1.5abc 1. .5 1.5.3 _x9 x_ação ação ١٢ ²\n',
+    '"sem fim \'q\' "a\\"b" "c\\\\" @ # ! $\n',
+    '(((1))) inicio fim\t\n',
+    'a\x1cb\x1d c\x1e\x1f; \x0b\x0c\r\n',
+    '',
+]
+
+
+class TestDfaLexer(unittest.TestCase):
+
+    def test_scan_matches_regex_lexer(self):
+        lexer = DfaLexer()
+        for line in LINES:
+            self.assertEqual(list(lexer.scan(line)), list(Lexer.scan(line)), line)
+
+    def test_scan_bytes_matches_regex_lexer(self):
+        lexer = DfaLexer()
+        buffer = b''.join(line.encode('utf-8') for line in LINES if line.isascii())
+        self.assertEqual(
+            list(lexer.scan_bytes(buffer, 3, len(buffer))),
+            list(Lexer.scan_bytes(buffer, 3, len(buffer))),
+        )
+        for line in LINES:
+            if line.isascii():
+                buffer = line.encode('ascii')
+                expected = [(code, column, column + len(lexeme)) for code, lexeme, column in Lexer.scan(line)]
+                self.assertEqual(list(lexer.scan_bytes(buffer, 0, len(buffer))), expected, line)
+                self.assertEqual(list(Lexer.scan_bytes(buffer, 0, len(buffer))), expected, line)
+
+    def test_table_is_minimized_and_cached(self):
+        table = build_lexer_table()
+        self.assertEqual(table['transitions'][:table['width']], [0] * table['width'])
+        self.assertLess(len(table['accept']), 64)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.lexical_analyzer.utils.dfa_lexer._TABLE', None):
+                self.assertIsInstance(load_lexer_table(), LexerTable)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.lexical_analyzer.utils.dfa_lexer._TABLE', None), \
+                    mock.patch('src.lexical_analyzer.utils.dfa_lexer.build_lexer_table') as build:
+                load_lexer_table()
+                build.assert_not_called()
+
+    def test_invalid_cached_table_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.lexical_analyzer.utils.dfa_lexer._TABLE', None):
+                load_lexer_table()
+            (name,) = os.listdir(cache_dir)
+            path = os.path.join(cache_dir, name)
+            with open(path, encoding='utf-8') as file:
+                entry = json.load(file)
+            entry['value']['transitions'].pop()
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(entry, file)
+
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.lexical_analyzer.utils.dfa_lexer._TABLE', None), \
+                    mock.patch('src.lexical_analyzer.utils.dfa_lexer.build_lexer_table',
+                               wraps=build_lexer_table) as build:
+                lexer = DfaLexer()
+                build.assert_called_once()
+            for line in LINES:
+                self.assertEqual(list(lexer.scan(line)), list(Lexer.scan(line)), line)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from src.errors.error import LexicalError
+from src.lexical_analyzer.utils.lexer import Lexer
+from src.lexical_analyzer.utils.token_class import KeyWords, Delimiters, Operators
+
+
+class TestLexerScan(unittest.TestCase):
+
+    def test_scan_classifies_while_matching(self):
+        result = list(Lexer.scan('  se lado >= 10 entao avancar lado; fim_se;\n'))
+        expected = [
+            (KeyWords.IF.code, 'se', 2),
+            (None, 'lado', 5),
+            (Operators.GREATER_EQUAL.code, '>=', 10),
+            (KeyWords.INTEGER.code, '10', 13),
+            (KeyWords.THEN.code, 'entao', 16),
+            (None, 'avancar', 22),
+            (None, 'lado', 30),
+            (Delimiters.SEMICOLON.code, ';', 34),
+            (KeyWords.END_IF.code, 'fim_se', 36),
+            (Delimiters.SEMICOLON.code, ';', 42),
+        ]
+        self.assertEqual(result, expected)
+
+    def test_scan_literals(self):
+        result = list(Lexer.scan('x = 1.5; t = " a // b "; l = falso;'))
+        codes = [code for code, _, _ in result]
+        self.assertIn(KeyWords.FLOAT.code, codes)
+        self.assertIn((KeyWords.TEXT.code, '" a // b "', 13), result)
+        self.assertIn((KeyWords.BOOLEAN.code, 'falso', 29), result)
+
+    def test_scan_stops_at_comment(self):
+        self.assertEqual(list(Lexer.scan('// avancar 10;')), [])
+        self.assertEqual(list(Lexer.scan('inicio // resto')), [(Delimiters.START.code, 'inicio', 0)])
+
+    def test_scan_marks_invalid_lexemes(self):
+        lexer = Lexer()
+        for line, column, lexeme in [('1test', 0, '1test'), ('a @', 2, '@'), ('"aberto', 0, '"')]:
+            result = list(Lexer.scan(line))
+            self.assertIn((Lexer.INVALID, lexeme, column), result)
+            with self.assertRaises(LexicalError):
+                lexer.analyze(lexeme, 1, column)
+
+
+if __name__ == '__main__':
+    unittest.main()
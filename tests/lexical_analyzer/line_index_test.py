@@ -0,0 +1,48 @@
+import unittest
+
+from src.errors.error import LexicalError
+from src.lexical_analyzer.utils.line_index import LineIndex
+
+
+def make_index(lines):
+    index = LineIndex()
+    for line in lines:
+        index.add_line(len(line))
+    return index
+
+
+class TestLineIndex(unittest.TestCase):
+
+    def test_position_and_offset(self):
+        index = make_index(['inicio\n', '\n', '  avancar 1;\n', 'fim'])
+
+        self.assertEqual(index.line_count, 4)
+        self.assertEqual(index.end, 24)
+        self.assertEqual(index.position(0), (1, 0))
+        self.assertEqual(index.position(7), (2, 0))
+        self.assertEqual(index.position(10), (3, 2))
+        self.assertEqual(index.position(23), (4, 2))
+        self.assertEqual(index.offset(3, 2), 10)
+        self.assertEqual(index.line_start(9), 24)
+
+    def test_splice(self):
+        index = make_index(['inicio\n', 'a;\n', 'b;\n', 'fim\n'])
+
+        self.assertEqual(index.splice(2, 3, [9]), 3)
+        self.assertEqual((index.line_count, index.end), (3, 20))
+        self.assertEqual(index.position(16), (3, 0))
+
+        self.assertEqual(index.splice(2, 1, [3]), 3)
+        self.assertEqual(index.position(10), (3, 0))
+
+    def test_error_resolves_position_lazily(self):
+        index = make_index(['inicio\n', '  @\n'])
+        error = LexicalError('Symbol not known to the compiler.', symbol='@', offset=9, source=index)
+
+        self.assertIsNone(error._line)
+        self.assertEqual((error.line, error.column), (2, 2))
+        self.assertIn('(line 2, column 2)', str(error))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from src.lexical_analyzer.utils.symbol_table import SymbolTable
+
+
+class TestSymbolTable(unittest.TestCase):
+
+    def test_lookups(self):
+        table = SymbolTable()
+        lado = table.add_symbol('lado', 'inteiro')
+        cor = table.add_symbol('cor', 'texto')
+
+        self.assertEqual(cor, lado + 1)
+        self.assertEqual(table.get_by_code(lado), 'inteiro')
+        self.assertEqual(table.get_by_code_with_value(cor), 'IDENTIFIER')
+        self.assertEqual(table.get_by_code_lexeme('cor'), cor)
+        self.assertEqual(table.get_by_lexeme('cor'), 'texto')
+
+    def test_unknown_symbols(self):
+        table = SymbolTable()
+        table.add_symbol('lado', None)
+
+        self.assertIsNone(table.get_by_code(1))
+        self.assertIsNone(table.get_by_code(1000))
+        self.assertIsNone(table.get_by_code_with_value(1000))
+        self.assertIsNone(table.get_by_code_lexeme('cor'))
+        self.assertIsNone(table.get_by_lexeme('cor'))
+        self.assertIsNone(table.get_by_lexeme('lado'))
+
+    def test_get_symbols(self):
+        table = SymbolTable()
+        code = table.add_symbol('lado', 'inteiro')
+        self.assertEqual(
+            table.get_symbols(),
+            [{'type': 'inteiro', 'value': 'IDENTIFIER', 'lexeme': 'lado', 'code': code}],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import pickle
+import unittest
+
+from src.lexical_analyzer.utils import SymbolTable, TokenListTable, TokenTypeFactory
+from src.lexical_analyzer.utils.token_class import Delimiters, KeyWords, Operators
+
+
+def make_table(compact):
+    symbol_table = SymbolTable()
+    table = TokenListTable(TokenTypeFactory(symbol_table), compact=compact)
+    lado = symbol_table.add_symbol('lado', 'inteiro')
+    for length in (7, 14, 13, 4):
+        table.source.add_line(length)
+    for code, lexeme, line, column in [
+        (Delimiters.START.code, 'inicio', 1, 0),
+        (lado, 'lado', 2, 2),
+        (Operators.ASSIGN.code, '=', 2, 7),
+        (KeyWords.FLOAT.code, '2.5', 2, 9),
+        (Delimiters.SEMICOLON.code, ';', 2, 12),
+        (KeyWords.INTEGER.code, 'inteiro', 3, 2),
+        (KeyWords.INTEGER.code, '10', 3, 10),
+        (Delimiters.END.code, 'fim', 4, 0),
+    ]:
+        table.add_token(code, lexeme, table.source.offset(line, column))
+    return table
+
+
+def fields(tokens):
+    return [(t.token_type, t.lexeme, t.line, t.column) for t in tokens]
+
+
+class TestCompactTokenList(unittest.TestCase):
+
+    def test_views_match_token_objects(self):
+        expected = make_table(compact=False).get_tokens()
+        tokens = make_table(compact=True).get_tokens()
+
+        self.assertEqual(len(tokens), len(expected))
+        self.assertEqual(fields(tokens), fields(expected))
+        self.assertEqual(fields(tokens[2:5]), fields(expected[2:5]))
+        self.assertEqual(fields([tokens[-1]]), fields([expected[-1]]))
+        self.assertEqual(tokens[3].lexeme, 2.5)
+        self.assertEqual(tokens[6].lexeme, 10)
+        self.assertEqual(tokens[5].lexeme, 'inteiro')
+        with self.assertRaises(IndexError):
+            tokens[len(tokens)]
+
+    def test_splice_and_line_range(self):
+        for compact in (False, True):
+            table = make_table(compact)
+            start, end = table.line_range(2, 2)
+            self.assertEqual((start, end), (1, 5))
+
+            offset = table.source.line_start(2)
+            delta = table.source.splice(2, 2, [2, 2])
+            table.splice(start, end, [(Delimiters.LEFT_PAR.code, '(', offset), (Delimiters.RIGHT_PAR.code, ')', offset + 2)], delta)
+            self.assertEqual(
+                [(t.lexeme, t.line) for t in table.get_tokens()],
+                [('inicio', 1), ('(', 2), (')', 3), ('inteiro', 4), (10, 4), ('fim', 5)],
+            )
+
+    def test_pickle_round_trip(self):
+        table = pickle.loads(pickle.dumps(make_table(compact=True)))
+        self.assertEqual(fields(table.get_tokens()), fields(make_table(compact=False).get_tokens()))
+
+
+if __name__ == '__main__':
+    unittest.main()
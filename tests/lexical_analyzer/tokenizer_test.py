@@ -0,0 +1,251 @@
+import io
+import os
+import tempfile
+import unittest
+
+from src.errors.error import LexicalError
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+
+
+def make_tokenizer():
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    token_list = TokenListTable(token_factory)
+    return Tokenizer(Lexer(), token_list, symbol_table, token_factory), token_list, symbol_table
+
+
+SCRIPT = """inicio
+  var inteiro : lado ;
+  lado = 5; // comentario
+  repita 2 vezes
+    avancar lado ;
+  fim_repita ;
+fim
+"""
+
+
+class TestIterTokens(unittest.TestCase):
+
+    def test_yields_same_tokens_as_analise_line(self):
+        tokenizer, token_list, _ = make_tokenizer()
+        streamed = list(tokenizer.iter_tokens(io.StringIO(SCRIPT)))
+
+        self.assertEqual(token_list.get_tokens(), [])
+        self.assertEqual(
+            [(t.token_type, t.lexeme, t.line, t.column) for t in streamed[:6]],
+            [
+                ('START', 'inicio', 1, 0),
+                ('VAR', 'var', 2, 2),
+                ('INTEGER', 'inteiro', 2, 6),
+                ('COLON', ':', 2, 14),
+                ('IDENTIFIER', 'lado', 2, 16),
+                ('SEMICOLON', ';', 2, 21),
+            ],
+        )
+        self.assertEqual(streamed[-1].token_type, 'END')
+
+        other, other_list, _ = make_tokenizer()
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as file:
+            file.write(SCRIPT)
+        try:
+            other.analise_line(file.name)
+        finally:
+            os.remove(file.name)
+        self.assertEqual(repr(streamed), repr(other_list.get_tokens()))
+
+    def test_is_lazy(self):
+        tokenizer, _, _ = make_tokenizer()
+        consumed = []
+
+        def lines():
+            for line in SCRIPT.splitlines(keepends=True):
+                consumed.append(line)
+                yield line
+
+        first = next(tokenizer.iter_tokens(lines()))
+        self.assertEqual(first.lexeme, 'inicio')
+        self.assertEqual(len(consumed), 1)
+
+    def test_keeps_only_line_starts_between_lines(self):
+        tokenizer, token_list, _ = make_tokenizer()
+        body = '  avancar 1;\n' * 1000
+        first = last = None
+        for token in tokenizer.iter_tokens(io.StringIO('inicio\n' + body + 'fim\n')):
+            first = first or token
+            last = token
+
+        self.assertEqual(token_list.get_tokens(), [])
+        # The tokens share one index holding a start offset per line read.
+        self.assertIs(last.source, first.source)
+        self.assertEqual(last.source.line_count, 1002)
+        self.assertEqual((first.line, first.column), (1, 0))
+        self.assertEqual((last.line, last.column), (1002, 0))
+
+    def test_reports_unbalanced_delimiters(self):
+        tokenizer, _, _ = make_tokenizer()
+        with self.assertRaises(LexicalError):
+            list(tokenizer.iter_tokens(io.StringIO("inicio\n  avancar (1;\nfim\n")))
+
+        tokenizer, _, _ = make_tokenizer()
+        with self.assertRaises(LexicalError):
+            list(tokenizer.iter_tokens(io.StringIO("inicio\n  avancar 1;\n")))
+
+
+class TestAnaliseMmap(unittest.TestCase):
+
+    def _analise(self, method, content):
+        tokenizer, token_list, symbol_table = make_tokenizer()
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as file:
+            file.write(content.encode('utf-8'))
+        try:
+            getattr(tokenizer, method)(file.name)
+        finally:
+            os.remove(file.name)
+        return repr(token_list.get_tokens()), symbol_table.get_symbols()
+
+    def test_matches_analise_line(self):
+        content = SCRIPT + '// sem acentuação\n'
+        content = content.replace('lado = 5;', 'lado = 5; escrever "ação" ; r = 1.5;')
+        self.assertEqual(self._analise('analise_mmap', content), self._analise('analise_line', content))
+
+    def test_matches_analise_line_on_any_line_ending(self):
+        for newline in ('\r\n', '\r'):
+            content = SCRIPT.replace('\n', newline) + 'escrever "ação";' + newline + '  r = 1.5;\r\r\n'
+            self.assertEqual(self._analise('analise_mmap', content), self._analise('analise_line', content), newline)
+
+    def test_matches_analise_line_on_ascii_separators(self):
+        content = SCRIPT.replace('lado = 5;', 'lado\x1c=\x1d5;\x1e\x1f')
+        self.assertEqual(self._analise('analise_mmap', content), self._analise('analise_line', content))
+
+    def test_empty_file(self):
+        self.assertEqual(self._analise('analise_mmap', ''), ('[]', []))
+
+    def test_reports_invalid_lexeme(self):
+        with self.assertRaises(LexicalError) as context:
+            self._analise('analise_mmap', 'inicio\n  a = 1test;\nfim\n')
+        self.assertEqual(context.exception.symbol, '1test')
+        self.assertEqual((context.exception.line, context.exception.column), (2, 6))
+
+    def test_analise_line_reports_errors_in_source_order(self):
+        with self.assertRaises(LexicalError) as context:
+            self._analise('analise_line', 'inicio\n  avancar ) ;\n  a = 1test;\n')
+        self.assertEqual(context.exception.symbol, ')')
+        self.assertEqual((context.exception.line, context.exception.column), (2, 10))
+
+        with self.assertRaises(LexicalError) as context:
+            self._analise('analise_line', 'inicio\n  a = 1test;\n')
+        self.assertEqual(context.exception.symbol, '1test')
+
+
+class TestAnaliseParallel(unittest.TestCase):
+
+    def _analise(self, method, content, **kwargs):
+        tokenizer, token_list, symbol_table = make_tokenizer()
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as file:
+            file.write(content.encode('utf-8'))
+        try:
+            getattr(tokenizer, method)(file.name, **kwargs)
+        finally:
+            os.remove(file.name)
+        return repr(token_list.get_tokens()), symbol_table.get_symbols()
+
+    def test_matches_analise_line(self):
+        content = SCRIPT.replace('inicio\n', 'inicio\n  var texto : cor,\r\n    fundo;\n') * 3
+        expected = self._analise('analise_line', content)
+        self.assertEqual(self._analise('analise_parallel', content, workers=2, chunk_size=16), expected)
+        self.assertEqual(self._analise('analise_parallel', content), expected)
+
+    def test_reports_first_error_in_source_order(self):
+        content = 'inicio\n' + '  avancar 1;\n' * 20 + '  a = 1test;\n  recuar );\n'
+        with self.assertRaises(LexicalError) as context:
+            self._analise('analise_parallel', content, workers=2, chunk_size=32)
+        self.assertEqual(context.exception.symbol, '1test')
+        self.assertEqual(context.exception.line, 22)
+
+
+class TestRelexLines(unittest.TestCase):
+
+    def _analise(self, content):
+        tokenizer, token_list, _ = make_tokenizer()
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as file:
+            file.write(content)
+        try:
+            tokenizer.analise_line(file.name)
+        finally:
+            os.remove(file.name)
+        return tokenizer, token_list
+
+    def _positions(self, token_list):
+        return [(t.token_type, t.lexeme, t.line, t.column) for t in token_list.get_tokens()]
+
+    def test_replace_line_keeps_line_count(self):
+        tokenizer, token_list = self._analise(SCRIPT)
+        tokenizer.relex_lines(3, 3, ['  lado = lado * 2;\n'])
+
+        _, expected = self._analise(SCRIPT.replace('lado = 5; // comentario', 'lado = lado * 2;'))
+        self.assertEqual(self._positions(token_list), self._positions(expected))
+
+    def test_insert_and_delete_shift_following_lines(self):
+        tokenizer, token_list = self._analise(SCRIPT)
+        tokenizer.relex_lines(4, 3, ['  girar_direita 90;\n', '\n'])
+        edited = SCRIPT.replace('  repita', '  girar_direita 90;\n\n  repita')
+        _, expected = self._analise(edited)
+        self.assertEqual(self._positions(token_list), self._positions(expected))
+
+        tokenizer.relex_lines(3, 5, [])
+        _, expected = self._analise(SCRIPT.replace('  lado = 5; // comentario\n', ''))
+        self.assertEqual(self._positions(token_list), self._positions(expected))
+
+    def test_invalid_edit_leaves_tokens_untouched(self):
+        tokenizer, token_list = self._analise(SCRIPT)
+        before = self._positions(token_list)
+
+        with self.assertRaises(LexicalError):
+            tokenizer.relex_lines(7, 7, ['\n'])
+        with self.assertRaises(LexicalError):
+            tokenizer.relex_lines(3, 3, ['  lado = 1test;\n'])
+        self.assertEqual(self._positions(token_list), before)
+
+
+class TestDeclarationTypes(unittest.TestCase):
+
+    DECLARATIONS = '''inicio
+  var inteiro : a, b,
+    c;
+  var texto : cor;
+  d = 1;
+fim
+'''
+
+    def _types(self, symbol_table):
+        return {s['lexeme']: s['type'] for s in symbol_table.get_symbols()}
+
+    def test_every_declared_name_gets_the_type(self):
+        tokenizer, _, symbol_table = make_tokenizer()
+        list(tokenizer.iter_tokens(io.StringIO(self.DECLARATIONS)))
+        self.assertEqual(
+            self._types(symbol_table),
+            {'a': 'inteiro', 'b': 'inteiro', 'c': 'inteiro', 'cor': 'texto', 'd': None},
+        )
+
+    def test_relex_resumes_open_declaration(self):
+        tokenizer, token_list, symbol_table = make_tokenizer()
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as file:
+            file.write(self.DECLARATIONS)
+        try:
+            tokenizer.analise_line(file.name)
+        finally:
+            os.remove(file.name)
+
+        tokenizer.relex_lines(3, 3, ['    e, f;\n'])
+        types = self._types(symbol_table)
+        self.assertEqual((types['e'], types['f']), ('inteiro', 'inteiro'))
+
+        tokenizer.relex_lines(5, 5, ['  g, h;\n'])
+        types = self._types(symbol_table)
+        self.assertEqual((types['g'], types['h']), (None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
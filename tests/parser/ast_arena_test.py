@@ -0,0 +1,97 @@
+import unittest
+
+from src.parser.ast_arena import NodeArena
+from src.parser.ast_codec import decode_ast, encode_ast
+from src.parser.parser import ParserLL1
+from src.semantic_analyzer.semantico import analyze_program
+from src.semantic_analyzer.syntatic_tree import Command, IfStatement, Literal, Program, RepeatLoop, VariableReference
+from tests.parser.table_parser_test import PROGRAMS, dump, tokenize
+
+SOURCE = (
+    'inicio\n'
+    '  var inteiro : lado;\n'
+    '  lado = 1;\n'
+    '  repita 4 vezes\n'
+    '    se lado > 2 entao avancar lado; senao recuar 1; fim_se;\n'
+    '    girar_direita 90;\n'
+    '  fim_repita;\n'
+    '  limpar_tela;\n'
+    'fim\n'
+)
+
+
+class TestNodeClasses(unittest.TestCase):
+
+    def test_nodes_have_no_instance_dict(self):
+        self.assertFalse(hasattr(Command('limpar_tela'), '__dict__'))
+        self.assertFalse(hasattr(VariableReference('lado'), '__dict__'))
+
+    def test_command_args_are_not_shared(self):
+        first, second = Command('limpar_tela'), Command('levantar_caneta')
+        first.args.append(Literal(1, 'inteiro'))
+        self.assertEqual(second.args, [])
+
+
+class TestNodeArena(unittest.TestCase):
+
+    def test_views_read_like_the_nodes(self):
+        for source in PROGRAMS + [SOURCE]:
+            program = ParserLL1(tokenize(source)).parse()
+            self.assertEqual(dump(NodeArena().add(program)), dump(program))
+
+    def test_views_are_instances_of_the_node_classes(self):
+        program = NodeArena().add(ParserLL1(tokenize(SOURCE)).parse())
+        self.assertIsInstance(program, Program)
+        assignment, loop, clear = program.commands
+        self.assertIsInstance(loop, RepeatLoop)
+        self.assertIsInstance(loop.body[0], IfStatement)
+        self.assertEqual(loop.body[0].false_branch[0].name, 'recuar')
+        self.assertEqual(clear.args, [])
+        analyze_program(program)
+
+    def test_views_are_read_only_and_compare_by_node(self):
+        arena = NodeArena()
+        program = arena.add(ParserLL1(tokenize(SOURCE)).parse())
+        self.assertEqual(program.commands[1], program.commands[1])
+        self.assertNotEqual(program.commands[0], program.commands[1])
+        self.assertEqual(len({program.commands[2], program.commands[2]}), 1)
+        with self.assertRaises(AttributeError):
+            program.commands[2].name = 'avancar'
+
+    def test_strings_and_literals_are_stored_once(self):
+        arena = NodeArena()
+        arena.add(ParserLL1(tokenize(SOURCE)).parse())
+        self.assertEqual(arena.strings.count('lado'), 1)
+        self.assertEqual(len(arena.constants), len(set(map(repr, arena.constants))))
+
+    def test_decoding_into_an_arena(self):
+        program = ParserLL1(tokenize(PROGRAMS[1])).parse()
+        arena = NodeArena()
+        view = decode_ast(encode_ast(program), arena)
+        self.assertIs(view._arena, arena)
+        self.assertEqual(dump(view), dump(program))
+        self.assertEqual(dump(decode_ast(encode_ast(view))), dump(program))
+
+    def test_numeric_declared_types_are_constants(self):
+        arena = NodeArena()
+        program = ParserLL1(tokenize('inicio\n  var 1 : lado;\n  var 2.5 : passo;\n  var inteiro : x;\nfim\n')).parse()
+        view = arena.add(program)
+        self.assertEqual(dump(view), dump(program))
+        self.assertEqual([type(d.var_type) for d in view.declarations], [int, float, str])
+        self.assertIn(1, arena.constants)
+        self.assertIn(2.5, arena.constants)
+        self.assertNotIn(1, arena.strings)
+        self.assertEqual(dump(decode_ast(encode_ast(view))), dump(program))
+
+    def test_one_arena_holds_several_programs(self):
+        arena = NodeArena()
+        first = arena.add(ParserLL1(tokenize(PROGRAMS[0])).parse())
+        size = len(arena)
+        second = arena.add(ParserLL1(tokenize(PROGRAMS[1])).parse())
+        self.assertGreater(len(arena), size)
+        self.assertEqual(dump(first), dump(ParserLL1(tokenize(PROGRAMS[0])).parse()))
+        self.assertEqual(dump(second), dump(ParserLL1(tokenize(PROGRAMS[1])).parse()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from src.parser.ast_codec import FORMAT_VERSION, decode_ast, encode_ast
+from src.parser.parser import ParserLL1
+from src.semantic_analyzer.syntatic_tree import CommentNode, IfStatement, Literal, Program, \
+    VariableDeclaration, WhileLoop
+from tests.parser.table_parser_test import PROGRAMS, dump, tokenize
+
+
+class TestAstCodec(unittest.TestCase):
+
+    def test_round_trip(self):
+        for source in PROGRAMS:
+            program = ParserLL1(tokenize(source)).parse()
+            data = encode_ast(program)
+            self.assertEqual(dump(decode_ast(data)), dump(program))
+            self.assertLess(len(data), len(source))
+
+    def test_literals_and_optional_branches(self):
+        program = Program([], [
+            IfStatement(Literal(True, 'logico'), [], None),
+            IfStatement(Literal(False, 'logico'), [], []),
+            IfStatement(Literal(-300, 'inteiro'), [CommentNode('ângulo')], [WhileLoop(Literal(0.1, 'real'), [])]),
+            CommentNode(''),
+        ])
+        decoded = decode_ast(encode_ast(program))
+        self.assertEqual(dump(decoded), dump(program))
+        self.assertIsNone(decoded.commands[0].false_branch)
+        self.assertEqual(decoded.commands[1].false_branch, [])
+
+    def test_numeric_declared_types(self):
+        for source, var_type in (('inicio\n  var 1 : lado;\nfim\n', 1),
+                                 ('inicio\n  var 2.5 : lado, passo;\nfim\n', 2.5)):
+            program = ParserLL1(tokenize(source)).parse()
+            decoded = decode_ast(encode_ast(program))
+            self.assertEqual(dump(decoded), dump(program))
+            self.assertIs(type(decoded.declarations[0].var_type), type(var_type))
+        declarations = [VariableDeclaration(-300, ['a']), VariableDeclaration(-0.5, ['b', 'c'])]
+        decoded = decode_ast(encode_ast(Program(declarations, [])))
+        self.assertEqual([(d.var_type, d.names) for d in decoded.declarations], [(-300, ['a']), (-0.5, ['b', 'c'])])
+
+    def test_strings_are_stored_once(self):
+        once = encode_ast(ParserLL1(tokenize('inicio\n  avancar comprimento_do_lado;\nfim\n')).parse())
+        twice = encode_ast(ParserLL1(tokenize(
+            'inicio\n  avancar comprimento_do_lado;\n  avancar comprimento_do_lado;\nfim\n')).parse())
+        self.assertEqual(twice.count(b'comprimento_do_lado'), 1)
+        self.assertLess(len(twice) - len(once), len('comprimento_do_lado'))
+
+    def test_deep_nesting(self):
+        body = []
+        for _ in range(10000):
+            body = [WhileLoop(Literal(True, 'logico'), body)]
+        commands = decode_ast(encode_ast(Program([], body))).commands
+        depth = 0
+        while commands:
+            commands = commands[0].body
+            depth += 1
+        self.assertEqual(depth, 10000)
+
+    def test_malformed_data(self):
+        data = encode_ast(ParserLL1(tokenize(PROGRAMS[0])).parse())
+        with self.assertRaisesRegex(ValueError, 'not an encoded'):
+            decode_ast(b'inicio')
+        with self.assertRaisesRegex(ValueError, 'unsupported encoded AST version'):
+            decode_ast(data[:5] + bytes([FORMAT_VERSION + 1]) + data[6:])
+        for truncated in (data[:8], data[:-1]):
+            with self.assertRaises(ValueError):
+                decode_ast(truncated)
+        with self.assertRaisesRegex(ValueError, 'unknown AST node tag'):
+            decode_ast(data + b'\xff\x00')
+        with self.assertRaises(TypeError):
+            encode_ast(Literal(None, 'inteiro'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from src.parser.calculate_first_set import calculate_first_sets
+from src.parser.digraph import propagate_inclusions
+
+
+class TestPropagateInclusions(unittest.TestCase):
+
+    def test_cycles_share_their_masks(self):
+        masks = [0b0001, 0b0010, 0b0100, 0b1000]
+        includes = [[1], [2], [0, 3], []]
+        propagate_inclusions(masks, includes)
+        self.assertEqual(masks, [0b1111, 0b1111, 0b1111, 0b1000])
+
+    def test_deep_chains_do_not_recurse(self):
+        size = 2000
+        grammar = {f'A{index}': [[f'A{index + 1}'], [f't{index}']] for index in range(size)}
+        grammar[f'A{size}'] = [['end']]
+        first_sets = calculate_first_sets(grammar, {'end'} | {f't{index}' for index in range(size)})
+        self.assertEqual(len(first_sets['A0']), size + 1)
+        self.assertEqual(first_sets[f'A{size - 1}'], {f't{size - 1}', 'end'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from src.parser.incremental import parse_program, reparse_program
+from tests.parser.table_parser_test import dump, tokenize
+
+SOURCE = (
+    'inicio\n'
+    '  var inteiro : lado;\n'
+    '  lado = 1;\n'
+    '  repita 4 vezes\n'
+    '    se lado > 2 entao avancar lado; senao recuar 1; fim_se;\n'
+    '    girar_direita 90;\n'
+    '  fim_repita;\n'
+    '  limpar_tela;\n'
+    'fim\n'
+)
+
+
+def edit(previous, old, new):
+    """Replaces the first occurrence of source ``old`` with ``new`` and reparses incrementally."""
+    tokens = tokenize(SOURCE.replace(old, new, 1))
+    start = 0
+    while previous.tokens[start].lexeme == tokens[start].lexeme:
+        start += 1
+    end = 0
+    while previous.tokens[-1 - end].lexeme == tokens[-1 - end].lexeme and end < min(len(tokens), len(previous.tokens)) - start:
+        end += 1
+    return reparse_program(previous, tokens, start, len(previous.tokens) - end, len(tokens) - end), tokens
+
+
+class TestIncrementalParse(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = parse_program(tokenize(SOURCE))
+        self.assignment, self.loop, self.clear = self.previous.program.commands
+
+    def assertSameAsFullParse(self, result, tokens):
+        self.assertEqual(dump(result.program), dump(parse_program(tokens).program))
+        self.assertEqual(result.bounds, parse_program(tokens).bounds)
+
+    def test_reparses_only_the_edited_command(self):
+        condition = self.loop.body[0]
+        turn = self.loop.body[1]
+        result, tokens = edit(self.previous, 'avancar lado;', 'avancar lado * 2;')
+        self.assertSameAsFullParse(result, tokens)
+
+        assignment, loop, clear = result.program.commands
+        self.assertIs(assignment, self.assignment)
+        self.assertIs(clear, self.clear)
+        self.assertIsNot(loop, self.loop)
+        self.assertIs(loop.count, self.loop.count)
+        self.assertIs(loop.body[1], turn)
+        self.assertIs(loop.body[0].false_branch, condition.false_branch)
+        self.assertEqual(loop.body[0].true_branch[0].args[0].operator, '*')
+        # The old tree is left as it was.
+        self.assertEqual(condition.true_branch[0].args[0].name, 'lado')
+
+    def test_inserting_and_deleting_commands(self):
+        result, tokens = edit(self.previous, '    girar_direita 90;\n', '    girar_direita 90;\n    avancar 2;\n')
+        self.assertSameAsFullParse(result, tokens)
+        self.assertIs(result.program.commands[1].body[1], self.loop.body[1])
+
+        with self.assertRaises(ValueError):
+            edit(self.previous, '  limpar_tela;\n', '')
+        result, tokens = edit(parse_program(tokenize(SOURCE)), '  limpar_tela;\n', '')
+        self.assertSameAsFullParse(result, tokens)
+        self.assertEqual(len(result.program.commands), 2)
+
+    def test_structural_edits_reparse_the_enclosing_block(self):
+        result, tokens = edit(self.previous, 'senao recuar 1; fim_se;', 'fim_se; se lado entao recuar 1; fim_se;')
+        self.assertSameAsFullParse(result, tokens)
+        self.assertEqual(len(result.program.commands[1].body), 3)
+        self.assertIs(result.program.commands[0], self.assignment)
+
+        result, tokens = edit(parse_program(tokenize(SOURCE)), '  lado = 1;\n', '  var real : passo;\n  lado = 1;\n')
+        self.assertSameAsFullParse(result, tokens)
+
+    def test_syntax_errors_are_those_of_a_full_parse(self):
+        with self.assertRaises(SyntaxError) as incremental:
+            edit(self.previous, '    girar_direita 90;\n', '    girar_direita 90;\n  fim_enquanto;\n')
+        with self.assertRaises(SyntaxError) as full:
+            parse_program(tokenize(SOURCE.replace('    girar_direita 90;\n', '    girar_direita 90;\n  fim_enquanto;\n')))
+        self.assertEqual(str(incremental.exception), str(full.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from src.parser.left_factoring import left_factoring_concise
+from src.parser.left_factoring import left_factoring, left_factoring_concise
 
 
 class TestLeftFactoringConcise(unittest.TestCase):
@@ -106,4 +106,66 @@ class TestLeftFactoringConcise(unittest.TestCase):
         self.assertIn(['b', 'c'], result[new_nt])
         self.assertIn(['b', 'd'], result[new_nt])
         self.assertIn(['x', 'y'], result[new_nt])
-        self.assertEqual(len(result[new_nt]), 3)
\ No newline at end of file
+        self.assertEqual(len(result[new_nt]), 3)
+
+
+class TestLeftFactoring(unittest.TestCase):
+
+    def test_longest_common_prefixes(self):
+        input_grammar = {
+            'A': [['a', 'b', 'c'], ['a', 'b', 'd'], ['a', 'x', 'y'], ['k']],
+            'B': [['e']]
+        }
+        expected_output = {
+            'A': [['a', "A'"], ['k']],
+            'B': [['e']],
+            "A'": [['b', "A'1"], ['x', 'y']],
+            "A'1": [['c'], ['d']]
+        }
+        self.assertEqual(left_factoring(input_grammar), expected_output)
+
+    def test_shared_prefix_longer_than_one_symbol(self):
+        input_grammar = {
+            'S': [['if', 'E', 'then', 'S'], ['if', 'E', 'then', 'S', 'else', 'S'], ['#']]
+        }
+        expected_output = {
+            'S': [['if', 'E', 'then', 'S', "S'"], ['#']],
+            "S'": [['#'], ['else', 'S']]
+        }
+        self.assertEqual(left_factoring(input_grammar), expected_output)
+
+    def test_generated_names_do_not_clash(self):
+        input_grammar = {
+            'A': [['a', 'b', 'c'], ['a', 'b', 'd'], ['a', 'x']],
+            "A'": [['x']],
+            "A'1": [['y']]
+        }
+        result = left_factoring(input_grammar)
+        self.assertEqual(result["A'"], [['x']])
+        self.assertEqual(result["A'1"], [['y']])
+        self.assertEqual(result['A'], [['a', "A'2"]])
+        self.assertEqual(result["A'2"], [['b', "A'3"], ['x']])
+        self.assertEqual(result["A'3"], [['c'], ['d']])
+
+    def test_generated_names_stay_short(self):
+        # A binary prefix trie: every inner node becomes a non-terminal.
+        input_grammar = {'A': [list(f'{index:010b}') for index in range(1 << 10)]}
+        result = left_factoring(input_grammar)
+        self.assertEqual(len(result), (1 << 10) - 1)
+        self.assertIn("A'1021", result)
+        self.assertEqual(max(map(len, result)), len("A'1021"))
+
+    def test_result_is_fully_factored(self):
+        input_grammar = {
+            'A': [['x'] * depth + [f'y{index}'] for depth in range(1, 40) for index in range(3)]
+                 + [['x', 'x'], ['x', 'x']]
+        }
+        result = left_factoring(input_grammar)
+        for productions in result.values():
+            first_symbols = [production[0] for production in productions]
+            self.assertEqual(len(first_symbols), len(set(first_symbols)))
+        self.assertEqual(len(result), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from src.parser.numbered_grammar import EPSILON_BIT, NumberedGrammar
+
+
+class TestNumberedGrammar(unittest.TestCase):
+
+    def setUp(self):
+        self.grammar = NumberedGrammar({
+            'E': [['T', 'E_prime']],
+            'E_prime': [['+', 'T', 'E_prime'], ['#']],
+            'T': [['F', 'T_prime']],
+            'T_prime': [['*', 'F', 'T_prime'], ['#']],
+            'F': [['(', 'E', ')'], ['id']],
+        })
+
+    def test_masks(self):
+        grammar = self.grammar
+        first = grammar.first_masks()
+        follow = grammar.follow_masks('E', first)
+        index = grammar.non_terminal_index
+
+        self.assertEqual(first[index['T_prime']], grammar.mask({'*'}) | EPSILON_BIT)
+        self.assertEqual(grammar.symbols(first[index['E']]), {'(', 'id'})
+        self.assertEqual(grammar.symbols(follow[index['F']]), {'*', '+', ')', '$'})
+        self.assertEqual(grammar.nullable(), [False, True, False, True, False])
+
+        predict = grammar.predict_masks(first, follow)
+        self.assertEqual(grammar.symbols(predict[2]), {')', '$'})
+        self.assertEqual(list(grammar.conflicts(predict)), [])
+
+    def test_conflicts_are_shared_lookaheads(self):
+        grammar = NumberedGrammar({'S': [['a', 'B'], ['a', 'C'], ['c']], 'B': [['b']], 'C': [['c']]})
+        first = grammar.first_masks()
+        predict = grammar.predict_masks(first, grammar.follow_masks('S', first))
+        self.assertEqual([(lhs, grammar.symbols(mask)) for lhs, mask in grammar.conflicts(predict)],
+                         [('S', {'a'})])
+
+    def test_views(self):
+        grammar = self.grammar
+        first = grammar.first_view(grammar.first_masks(), with_epsilon=True)
+        self.assertEqual(first['E_prime'], {'+', '#'})
+        self.assertEqual(first['id'], {'id'})
+        self.assertEqual(set(first), {'#', '+', '*', '(', ')', 'id', 'E', 'E_prime', 'T', 'T_prime', 'F'})
+        self.assertIs(first['E'], first['E'])
+
+
+if __name__ == '__main__':
+    unittest.main()
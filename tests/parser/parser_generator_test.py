@@ -0,0 +1,74 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from src.parser.generated_parser import GeneratedParserLL1
+from src.parser.grammar import START_SYMBOL
+from src.parser.parser import ParserLL1
+from src.parser.parser_generator import GENERATED_MODULE, generate_parser_source, main
+from tests.parser.table_parser_test import PROGRAMS, dump, tokenize
+
+
+class TestParserGenerator(unittest.TestCase):
+
+    def test_generated_module_is_up_to_date(self):
+        with open(GENERATED_MODULE, encoding='utf-8') as file:
+            self.assertEqual(file.read(), generate_parser_source(),
+                             'run python -m src.parser.parser_generator')
+
+    def test_main_writes_the_given_path_and_rejects_options(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'parser.py')
+            main([path])
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(file.read(), generate_parser_source())
+
+            for option in ('--help', '-o'):
+                with self.assertRaises(SystemExit), contextlib.redirect_stdout(io.StringIO()), \
+                        contextlib.redirect_stderr(io.StringIO()):
+                    main([option])
+
+    def test_builds_the_same_ast_as_the_recursive_parser(self):
+        for source in PROGRAMS:
+            tokens = tokenize(source)
+            self.assertEqual(dump(GeneratedParserLL1(tokens).parse()), dump(ParserLL1(tokens).parse()))
+
+    def test_long_command_lists_do_not_recurse(self):
+        tokens = tokenize('inicio\n' + '  avancar 1;\n' * 5000 + 'fim\n')
+        self.assertEqual(len(GeneratedParserLL1(tokens).parse().commands), 5000)
+
+    def test_syntax_errors(self):
+        with self.assertRaises(SyntaxError) as context:
+            GeneratedParserLL1(tokenize('inicio\n  se a entao avancar 1;\nfim\n')).parse()
+        self.assertEqual(
+            str(context.exception),
+            "Expected one of ('END_IF', 'ELSE'), got END ('fim') at line 3, column 0",
+        )
+        with self.assertRaisesRegex(SyntaxError, 'reached end of file'):
+            GeneratedParserLL1(tokenize(PROGRAMS[0])[:-1]).parse()
+
+    def test_accepts_a_number_as_declared_type_like_the_recursive_parser(self):
+        tokens = tokenize('inicio\n  var 1 : lado;\nfim\n')
+        self.assertEqual(dump(GeneratedParserLL1(tokens).parse()), dump(ParserLL1(tokens).parse()))
+        with self.assertRaises(SyntaxError) as context:
+            GeneratedParserLL1(tokenize('inicio\n  var : lado;\nfim\n')).parse()
+        self.assertEqual(
+            str(context.exception),
+            "Expected one of ('INTEGER', 'FLOAT', 'TEXT', 'BOOLEAN'), got COLON (':') at line 2, column 6",
+        )
+
+    def test_generates_other_grammars(self):
+        grammar = {
+            START_SYMBOL: [['START', '@list', 'Names', 'END', '@none', '@program']],
+            'Names': [['IDENTIFIER', '@append', 'Names'], ['#']],
+        }
+        namespace = {}
+        exec(compile(generate_parser_source(grammar, class_name='NamesParser'), '<generated>', 'exec'), namespace)
+        program = namespace['NamesParser'](tokenize('inicio\n  a b c\nfim\n')).parse()
+        self.assertEqual([name.lexeme for name in program.declarations], ['a', 'b', 'c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,285 @@
+import io
+import unittest
+
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.lexical_analyzer.utils.token_class import Delimiters, KeyWords
+from src.parser.parser import IterativeParserLL1, ParserLL1, StreamingParserLL1
+from src.semantic_analyzer.syntatic_tree import Assignment, BinaryExpression, Command, IfStatement, Literal, \
+    RepeatLoop, VariableDeclaration, VariableReference
+from tests.parser.table_parser_test import PROGRAMS, dump
+
+
+def tokenize(source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+    return list(tokenizer.iter_tokens(io.StringIO(source)))
+
+
+def parse(source):
+    return ParserLL1(tokenize(source)).parse()
+
+
+class TestParserLL1(unittest.TestCase):
+
+    def test_tokens_carry_integer_kinds(self):
+        tokens = tokenize('inicio\n  avancar 150;\nfim\n')
+        self.assertEqual(tokens[0].kind, Delimiters.START.code)
+        self.assertEqual(tokens[0].token_type, 'START')
+        self.assertEqual(tokens[1].token_type, 'IDENTIFIER')
+        self.assertEqual((tokens[2].kind, tokens[2].lexeme), (KeyWords.INTEGER.code, 150))
+
+    def test_declarations_and_commands(self):
+        program = parse(
+            'inicio\n'
+            '  var inteiro : lado, passo;\n'
+            '  var texto : cor;\n'
+            '  lado = 2 + 3 * passo;\n'
+            '  definir_cor "red";\n'
+            '  ir_para(lado, 10);\n'
+            '  limpar_tela;\n'
+            'fim\n'
+        )
+        self.assertEqual([(d.var_type, d.names) for d in program.declarations],
+                         [('inteiro', ['lado', 'passo']), ('texto', ['cor'])])
+
+        assignment, color, goto, clear = program.commands
+        self.assertIsInstance(assignment, Assignment)
+        self.assertEqual(assignment.expression.operator, '+')
+        self.assertEqual(assignment.expression.right.operator, '*')
+        self.assertIsInstance(assignment.expression.right.right, VariableReference)
+        self.assertEqual((color.name, color.args[0].value), ('definir_cor', 'red'))
+        self.assertEqual(len(goto.args), 2)
+        self.assertIsInstance(clear, Command)
+        self.assertEqual(clear.args, [])
+
+    def test_nested_blocks(self):
+        program = parse(
+            'inicio\n'
+            '  repita 4 vezes\n'
+            '    se lado > 2.5 entao avancar 1; senao recuar 1; fim_se;\n'
+            '  fim_repita;\n'
+            'fim\n'
+        )
+        loop = program.commands[0]
+        self.assertIsInstance(loop, RepeatLoop)
+        self.assertEqual(loop.count.value, 4)
+        condition = loop.body[0]
+        self.assertIsInstance(condition, IfStatement)
+        self.assertIsInstance(condition.condition, BinaryExpression)
+        self.assertEqual(condition.condition.right.value, 2.5)
+        self.assertEqual([c.name for c in condition.true_branch + condition.false_branch], ['avancar', 'recuar'])
+
+    def test_literals(self):
+        program = parse('inicio\n  a = verdadeiro;\n  b = (1);\nfim\n')
+        self.assertIsInstance(program.commands[0].expression, Literal)
+        self.assertIs(program.commands[0].expression.value, True)
+        self.assertEqual(program.commands[1].expression.value, 1)
+
+    def test_operator_precedence(self):
+        def shape(node):
+            if isinstance(node, BinaryExpression):
+                return shape(node.left), node.operator, shape(node.right)
+            return node.name if isinstance(node, VariableReference) else node.value
+
+        expression = parse('inicio\n  x = a - b - c * d % 2 < e + 1 == f;\nfim\n').commands[0].expression
+        self.assertEqual(shape(expression),
+                         (((('a', '-', 'b'), '-', (('c', '*', 'd'), '%', 2)), '<', ('e', '+', 1)), '==', 'f'))
+        expression = parse('inicio\n  x = (a + b) * c;\nfim\n').commands[0].expression
+        self.assertEqual(shape(expression), (('a', '+', 'b'), '*', 'c'))
+
+    def test_syntax_errors(self):
+        with self.assertRaises(SyntaxError) as context:
+            parse('inicio\n  avancar 1\nfim\n')
+        self.assertEqual(
+            str(context.exception),
+            "Expected one of ('SEMICOLON',), got END ('fim') at line 3, column 0",
+        )
+        with self.assertRaises(SyntaxError):
+            parse('inicio\n  a = inteiro;\nfim\n')
+
+
+class TestIterativeParserLL1(unittest.TestCase):
+
+    def test_builds_the_same_ast_as_the_recursive_parser(self):
+        programs = PROGRAMS + [
+            'inicio\n'
+            '  x = ((a + b) * (c - (d % 2))) < 3 == (((e)));\n'
+            '  se a entao se b entao fim_se; senao enquanto c faca repita 2 vezes avancar 1; fim_repita; '
+            'fim_enquanto; fim_se;\n'
+            'fim\n',
+        ]
+        for source in programs:
+            tokens = tokenize(source)
+            self.assertEqual(dump(IterativeParserLL1(tokens).parse()), dump(ParserLL1(tokens).parse()))
+
+    def test_same_syntax_errors(self):
+        cases = [tokenize(source) for source in ('inicio\n  se a entao avancar 1;\n  senao recuar 1; senao\nfim\n',
+                                                 'inicio\n  x = (1 + (2 * 3) 4);\nfim\n')]
+        cases.append(tokenize('inicio\n  repita 2 vezes avancar 1;\nfim\n')[:-1])
+        for tokens in cases:
+            with self.assertRaises(SyntaxError) as recursive:
+                ParserLL1(tokens).parse()
+            with self.assertRaises(SyntaxError) as iterative:
+                IterativeParserLL1(tokens).parse()
+            self.assertEqual(str(iterative.exception), str(recursive.exception))
+
+    def test_deep_nesting(self):
+        depth = 5000
+        program = IterativeParserLL1(tokenize(
+            'inicio\n' + 'repita 2 vezes ' * depth + 'avancar ' + '(1 + ' * depth + '2' + ')' * depth + ';'
+            + ' fim_repita;' * depth + '\nfim\n'
+        )).parse()
+
+        loops = 0
+        node = program.commands[0]
+        while isinstance(node, RepeatLoop):
+            loops += 1
+            node, = node.body
+        self.assertEqual(loops, depth)
+        operators = 0
+        node = node.args[0]
+        while isinstance(node, BinaryExpression):
+            operators += 1
+            node = node.right
+        self.assertEqual((operators, node.value), (depth, 2))
+
+
+class TestStreamingParserLL1(unittest.TestCase):
+
+    def test_yields_the_declarations_and_commands_of_the_program(self):
+        for source in PROGRAMS:
+            tokens = tokenize(source)
+            program = ParserLL1(tokens).parse()
+            items = list(StreamingParserLL1(iter(tokens)).parse_stream())
+            self.assertEqual(dump(items), dump(program.declarations + program.commands))
+            self.assertEqual(dump(StreamingParserLL1(iter(tokens)).parse()), dump(program))
+
+    def test_reads_tokens_lazily(self):
+        tokens = tokenize(PROGRAMS[0])
+        read = []
+
+        def source():
+            for token in tokens:
+                read.append(token)
+                yield token
+
+        parser = StreamingParserLL1(source())
+        items = parser.parse_stream()
+        self.assertIsInstance(next(items), VariableDeclaration)
+        # 'inicio', the declaration and the 'var' that may start another one.
+        self.assertEqual(len(read), 8)
+        self.assertLessEqual(len(parser._buffer), 2)
+        for _ in items:
+            self.assertLessEqual(len(parser._buffer), 2)
+        self.assertEqual(len(read), len(tokens))
+
+    def test_syntax_errors(self):
+        tokens = tokenize('inicio\n  avancar 1;\n  avancar 1\nfim\n')
+        items = StreamingParserLL1(iter(tokens)).parse_stream()
+        self.assertEqual(next(items).name, 'avancar')
+        with self.assertRaisesRegex(SyntaxError, "Expected one of \\('SEMICOLON',\\), got END"):
+            next(items)
+        with self.assertRaisesRegex(SyntaxError, 'reached end of file'):
+            list(StreamingParserLL1(iter(tokens[:-1])).parse_stream())
+
+
+BROKEN_PROGRAM = (
+    'inicio\n'
+    '  var inteiro lado;\n'
+    '  var inteiro : passo;\n'
+    '  passo = 2 +;\n'
+    '  avancar passo;\n'
+    '  se passo > entao\n'
+    '    avancar 1;\n'
+    '  fim_se;\n'
+    '  repita 3 vezes\n'
+    '    se passo > 1 entao\n'
+    '      girar_direita 90;\n'
+    '  fim_repita;\n'
+    '  ir_para(1, 2 3);\n'
+    '  recuar passo;\n'
+    'fim\n'
+)
+
+
+class TestErrorRecovery(unittest.TestCase):
+
+    def test_reports_every_error_in_one_pass(self):
+        parser = ParserLL1(tokenize(BROKEN_PROGRAM), recover=True)
+        program = parser.parse()
+        self.assertEqual([str(error) for error in parser.errors], [
+            "Expected one of ('COLON',), got IDENTIFIER ('lado') at line 2, column 14",
+            "Unexpected token in primary expression: SEMICOLON (';') at line 4, column 13",
+            "Unexpected token in primary expression: THEN ('entao') at line 6, column 13",
+            "Expected one of ('END_IF',), got END_REPEAT ('fim_repita') at line 12, column 2",
+            "Expected one of ('RIGHT_PAR',), got INTEGER ('3') at line 13, column 15",
+        ])
+        self.assertEqual([declaration.names for declaration in program.declarations], [['passo']])
+        avancar, repeat, recuar = program.commands
+        self.assertEqual((avancar.name, recuar.name), ('avancar', 'recuar'))
+        self.assertIsInstance(repeat, RepeatLoop)
+        self.assertEqual(repeat.body, [])
+
+    def test_valid_programs_are_unaffected(self):
+        for source in PROGRAMS:
+            parser = ParserLL1(tokenize(source), recover=True)
+            self.assertEqual(dump(parser.parse()), dump(parse(source)))
+            self.assertEqual(parser.errors, [])
+
+    def test_missing_semicolon_resumes_at_the_next_command(self):
+        parser = ParserLL1(tokenize('inicio\n  avancar 1\n  se 1 > 0 entao recuar 2; fim_se;\nfim\n'), recover=True)
+        program = parser.parse()
+        self.assertEqual(len(parser.errors), 1)
+        self.assertEqual(len(program.commands), 1)
+        self.assertIsInstance(program.commands[0], IfStatement)
+
+    def test_end_of_file(self):
+        parser = ParserLL1(tokenize('inicio\n  avancar 1;\n  avancar\nfim\n')[:-1], recover=True)
+        program = parser.parse()
+        self.assertEqual(len(program.commands), 1)
+        self.assertEqual(len(parser.errors), 2)
+        self.assertIn('reached end of file', str(parser.errors[-1]))
+
+    def test_stray_closer_is_reported_once(self):
+        parser = ParserLL1(tokenize(
+            'inicio\n'
+            'enquanto x faca\n'
+            '  enquanto y faca\n'
+            '    avancar 1 fim_se;\n'
+            '  fim_enquanto;\n'
+            'fim_enquanto;\n'
+            'fim\n'
+        ), recover=True)
+        program = parser.parse()
+        self.assertEqual([str(error) for error in parser.errors], [
+            "Expected one of ('SEMICOLON',), got END_IF ('fim_se') at line 4, column 14",
+        ])
+        outer, = program.commands
+        inner, = outer.body
+        self.assertEqual(inner.body, [])
+
+    def test_all_parsers_recover_alike(self):
+        sources = [
+            BROKEN_PROGRAM,
+            'inicio\nrepita 2 vezes\n  avancar 1 +;\n  recuar * 2;\n  x = ;\nfim_repita;\nfim\n',
+            'inicio\nse a entao\n  avancar 1 +;\nsenao\n  recuar * 2;\n  x = ;\nfim_se;\nfim\n',
+            'inicio\nenquanto x faca\n  repita 2 vezes\n    avancar 1;\nfim_enquanto;\nfim_se;\nfim\n',
+        ]
+        for source in sources:
+            parser = ParserLL1(tokenize(source), recover=True)
+            program = parser.parse()
+            expected = [str(error) for error in parser.errors], dump(program.declarations + program.commands)
+
+            iterative = IterativeParserLL1(tokenize(source), recover=True)
+            program = iterative.parse()
+            self.assertEqual(
+                ([str(error) for error in iterative.errors], dump(program.declarations + program.commands)), expected)
+
+            streaming = StreamingParserLL1(iter(tokenize(source)), recover=True)
+            items = list(streaming.parse_stream())
+            self.assertEqual(([str(error) for error in streaming.errors], dump(items)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
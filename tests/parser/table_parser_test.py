@@ -0,0 +1,141 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import cache
+from src.lexical_analyzer.tokenizer import Tokenizer
+from src.lexical_analyzer.utils import Lexer, SymbolTable, TokenListTable, TokenTypeFactory
+from src.parser.grammar import TURTLESCRIPT_GRAMMAR, without_actions
+from src.parser.parser import ParserLL1
+from src.parser.table_parser import ParseTable, TableParserLL1, build_parse_table, load_parse_table
+from src.semantic_analyzer import syntatic_tree
+
+PROGRAMS = [
+    'inicio\n'
+    '  var inteiro : lado, passo;\n'
+    '  var texto : cor;\n'
+    '  lado = 2 + 3 * passo - (lado / 2) % 3;\n'
+    '  definir_cor "red";\n'
+    '  ir_para(lado, 10);\n'
+    '  ir_para();\n'
+    '  limpar_tela;\n'
+    'fim\n',
+
+    'inicio\n'
+    '  repita 4 vezes\n'
+    '    se lado > 2.5 entao avancar 1; senao recuar 1 + 2 * 3; fim_se;\n'
+    '    enquanto a == verdadeiro faca a = falso; fim_enquanto;\n'
+    '  fim_repita;\n'
+    '  se a < b <= c entao fim_se;\n'
+    'fim\n',
+]
+
+
+def tokenize(source):
+    symbol_table = SymbolTable()
+    token_factory = TokenTypeFactory(symbol_table)
+    tokenizer = Tokenizer(Lexer(), TokenListTable(token_factory), symbol_table, token_factory)
+    return list(tokenizer.iter_tokens(io.StringIO(source)))
+
+
+def dump(node):
+    if isinstance(node, list):
+        return [dump(item) for item in node]
+    for node_class in type(node).__mro__:
+        # Arena views subclass the node classes, so they dump like the nodes they stand for.
+        if node_class.__module__ == syntatic_tree.__name__:
+            return node_class.__name__, {name: dump(getattr(node, name)) for name in node_class.__slots__}
+    return node
+
+
+class TestTableParserLL1(unittest.TestCase):
+
+    def test_builds_the_same_ast_as_the_recursive_parser(self):
+        for source in PROGRAMS:
+            tokens = tokenize(source)
+            self.assertEqual(dump(TableParserLL1(tokens).parse()), dump(ParserLL1(tokens).parse()))
+
+    def test_syntax_errors(self):
+        with self.assertRaises(SyntaxError) as context:
+            TableParserLL1(tokenize('inicio\n  se a entao avancar 1;\nfim\n')).parse()
+        self.assertEqual(
+            str(context.exception),
+            "Expected one of ('END_IF', 'ELSE'), got END ('fim') at line 3, column 0",
+        )
+        for source in ('inicio\n  a = inteiro;\nfim\n', 'inicio\n  avancar (1) + 2;\nfim\n'):
+            with self.assertRaises(SyntaxError):
+                TableParserLL1(tokenize(source)).parse()
+        with self.assertRaisesRegex(SyntaxError, 'reached end of file'):
+            TableParserLL1(tokenize(PROGRAMS[0])[:-1]).parse()
+
+    def test_accepts_a_number_as_declared_type_like_the_recursive_parser(self):
+        for source in ('inicio\n  var 1 : lado;\nfim\n', 'inicio\n  var 1.5 : lado;\nfim\n'):
+            tokens = tokenize(source)
+            self.assertEqual(dump(TableParserLL1(tokens).parse()), dump(ParserLL1(tokens).parse()))
+        with self.assertRaises(SyntaxError) as context:
+            TableParserLL1(tokenize('inicio\n  var : lado;\nfim\n')).parse()
+        self.assertEqual(
+            str(context.exception),
+            "Expected one of ('INTEGER', 'FLOAT', 'TEXT', 'BOOLEAN'), got COLON (':') at line 2, column 6",
+        )
+
+    def test_grammar_is_ll1(self):
+        table = build_parse_table()
+        self.assertEqual(len(table['table']), len(table['non_terminals']) * len(table['terminals']))
+
+        ambiguous = dict(without_actions(TURTLESCRIPT_GRAMMAR))
+        ambiguous['Command'] = ambiguous['Command'] + [['IDENTIFIER', 'SEMICOLON']]
+        with self.assertRaises(ValueError):
+            build_parse_table(ambiguous)
+
+    def test_table_holds_any_production_index(self):
+        table = build_parse_table()
+        filler = table['productions'][0]
+        table['productions'] += [filler] * 40000
+        table['table'][0] = len(table['productions']) - 1
+        self.assertEqual(ParseTable(table).rows[0], len(table['productions']) - 1)
+
+    def test_table_is_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.parser.table_parser._TABLE', None):
+                self.assertIsInstance(load_parse_table(), ParseTable)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.parser.table_parser._TABLE', None), \
+                    mock.patch('src.parser.table_parser.build_parse_table') as build:
+                load_parse_table()
+                build.assert_not_called()
+
+    def test_invalid_cached_table_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.parser.table_parser._TABLE', None):
+                load_parse_table()
+            (name,) = os.listdir(cache_dir)
+            path = os.path.join(cache_dir, name)
+            with open(path, encoding='utf-8') as file:
+                entry = json.load(file)
+            entry['value']['table'][0] = 40000
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(entry, file)
+
+            with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': cache_dir}), \
+                    mock.patch('src.parser.table_parser._TABLE', None), \
+                    mock.patch('src.parser.table_parser.build_parse_table', wraps=build_parse_table) as build:
+                self.assertEqual(load_parse_table().rows.tolist(), build_parse_table()['table'])
+                build.assert_called_once()
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(json.load(file)['value'], build_parse_table())
+
+    def test_cache_defaults_to_the_user_cache_directory(self):
+        with mock.patch.dict(os.environ, {'TURTLESCRIPT_CACHE_DIR': '', 'XDG_CACHE_HOME': '/home/someone/.cache'}):
+            self.assertEqual(cache.cache_dir(), os.path.join('/home/someone/.cache', 'turtlescript'))
+
+
+if __name__ == '__main__':
+    unittest.main()